@@ -1,17 +1,26 @@
 import scrapy
+from scrapy.utils.defer import maybe_deferred_to_future
 import logging
-import re
 from langcodes import Language as Lang
-from langdetect import detect, DetectorFactory
-from deep_translator import GoogleTranslator
+from langdetect import DetectorFactory
 from typing import Dict, List
-from collections import Counter
-import stanza
 import os
 import subprocess
+import sys
 from openpyxl import Workbook
 from urllib.parse import urljoin
-import pandas as pd
+from common.drug_terms import profile_columns
+from common.term_index import open_term_index
+from common.gazetteer import country_gazetteer
+from common.translation import translate
+from common.translation_service import translation_service
+from common.language_id import detect_language_code
+from common.extractive import extractive_summary, paragraph_text
+from common.keyword_classifier import keyword_classifier
+from common import reference
+
+# Dutch-language pages on Belgian sites are Flemish
+LANGUAGE_TO_COUNTRY = reference.freeze({**reference.LANGUAGE_TO_COUNTRY, 'dutch': 'Belgium'})
 
 
 # Initialize language detection
@@ -22,111 +31,19 @@ class TranslationClassifier:
     
     def __init__(self):
 
-        # ✅ LOAD drug terms from .tsv file
-        tsv_path = 'https://raw.githubusercontent.com/MariaKlap/Drug-Name-Database/refs/heads/main/drug.target.interaction.tsv'  
-        
-
-        try:
-            df = pd.read_csv(tsv_path, sep='\t')
-        except UnicodeDecodeError:
-            df = pd.read_csv(tsv_path, sep='\t', encoding='ISO-8859-1')
-        print(f"📊 DRUG_NAME column row count (including duplicates and empty): {len(df['DRUG_NAME'])}")
-
-        # Limit to specific columns only
-        allowed_columns = {'DRUG_NAME', 'SWISSPROT', 'ACTION_TYPE', 'TARGET_CLASS', 'TARGET_NAME'}
-        allowed_columns = [col for col in df.columns if col in allowed_columns]
-
-        terms = set()
-        for col in allowed_columns:
-            col_terms = df[col].dropna().astype(str)
-            col_terms = {t.strip().lower() for t in col_terms if len(t.strip()) > 3}
-            terms.update(col_terms)
+        # ✅ LOAD drug terms as a read-only, memory-mapped index shared with other running scrapers
+        allowed_columns = profile_columns('long_terms_no_gene')
+        terms = open_term_index('long_terms_no_gene', boundary='word')
 
         self.drug_terms_set = terms
+        self.drug_matcher = self.drug_terms_set
         print(f"✅ Loaded {len(self.drug_terms_set)} drug terms from TSV columns: {', '.join(allowed_columns)}")
         
         # English-only document type classification
-        self.DOCUMENT_TYPES = {
-            'Announcement': ['announcement', 'notification', 'bulletin'],
-            'Expert Report': ['expert report', 'technical report', 'scientific opinion'],
-            'Amendment': ['amendment', 'regulation change', 'regulatory update'],
-            'Law': ['law', 'legislation', 'statute', 'act'],
-            'Directive': ['directive', 'guideline', 'policy'],
-            'Order': ['order', 'decision', 'ruling', 'decree'],
-            'Information Note': ['information note', 'information bulletin', 'notice'],
-            'Q&A': ['questions and answers', 'q&a', 'faq', 'frequently asked'],
-            'Instructions': ['instructions', 'manual', 'guidance', 'procedure'],
-            'Resolution': ['resolution', 'conclusion', 'determination'],
-            'Consultation': ['consultation', 'public hearing', 'stakeholder input'],
-            'Product Info': ['product information', 'package leaflet', 'product update'],
-            'Regulatory Decision': ['regulatory decision', 'approval summary', 'assessment'],
-            'Evaluation': ['evaluation report', 'assessment report', 'review report'],
-            'Recommendation': ['recommendation', 'advice', 'suggestion'],
-            'Checklist': ['checklist', 'verification list', 'review points'],
-            'Approval Tracker': ['approval tracker', 'authorization status', 'timeline'],
-            'CHMP Opinion': ['chmp opinion', 'committee opinion', 'scientific opinion'],
-            'Committee': ['committee', 'working group', 'task force'],
-            'CV': ['curriculum vitae', 'cv', 'resume'],
-            'EPAR': ['epar', 'european public assessment report'],
-            'Letter': ['letter', 'correspondence', 'official communication'],
-            'Meeting': ['meeting', 'conference', 'session'],
-            'Withdrawal': ['withdrawn application', 'cancelled submission'],
-            'Communication': ['communication', 'announcement', 'message'],
-            'Decree': ['decree', 'royal decree', 'official order'],
-            'Form': ['form', 'application form', 'submission form'],
-            'Regulatory History': ['regulatory history', 'dossier history', 'timeline'],
-            'Press Release': ['press release', 'news release', 'media statement'],
-            'Ordinance': ['ordinance', 'local regulation', 'municipal law'],
-            'Advisory Committee': ['advisory committee', 'committee profile'],
-            'Voting': ['voting', 'committee vote', 'decision outcome'],
-            'Petition': ['citizen petition', 'public petition', 'request'],
-            'Federal Register': ['federal register', 'official gazette', 'journal'],
-            'Inspection': ['inspection report', 'audit report', 'site visit'],
-            'SOP': ['sop', 'standard procedure', 'operating protocol'],
-            'BLA Approval': ['bla', 'biologics license application'],
-            'BLA Supplement': ['supplemental bla', 'bla amendment'],
-            'NDA Supplement': ['supplemental nda', 'nda amendment'],
-            '510(k)': ['510(k)', 'premarket notification'],
-            'NDA Approval': ['nda', 'new drug application'],
-            'Other Type': []
-        }
+        self.DOCUMENT_TYPES = reference.DOCUMENT_TYPES
 
         # English-only product type classification
-        self.PRODUCT_TYPES = {
-            'Biological': [
-                'biological', 'biologic',
-                'monoclonal antibody', 'mab', 'recombinant', 'cell therapy',
-                'gene therapy', 'blood product', 'plasma derived',
-                'therapeutic protein', 'insulin', 'erythropoietin',
-                'immunoglobulin', 'stem cell'
-            ],
-            'Drug Product': [
-                'drug product', 'finished product', 'formulation', 'dosage form',
-                'tablet', 'capsule', 'injection', 'solution', 'suspension', 'biopharmaceutical', 'biosimilar',
-                'cream', 'ointment', 'gel', 'suppository', 'inhalation'
-            ],
-            'Drug Substance': [
-                'drug substance', 'active substance', 'api', 'active ingredient',
-                'bulk drug', 'chemical entity', 'reference standard'
-            ],
-            'Vaccine': [
-                'vaccine', 'vaccination', 'immunization', 'antigen', 'adjuvant',
-                'mmr', 'dtap', 'hpv', 'influenza', 'covid-19', 'sars-cov-2'
-            ],
-            'Small Molecule': [
-                'small molecule', 'chemical drug', 'synthetic', 'organic compound',
-                'nme', 'new molecular entity', 'low molecular weight'
-            ],
-            'Medical Device': [
-                'medical device', 'implant', 'stent', 'catheter', 'prosthesis',
-                'pacemaker', 'defibrillator', 'surgical instrument'
-            ],
-            'IVD': [
-                'ivd', 'in vitro diagnostic', 'diagnostic test', 'assay',
-                'reagent', 'test kit', 'analyzer', 'rapid test'
-            ],
-            'Other': []
-        }
+        self.PRODUCT_TYPES = reference.PRODUCT_TYPES_EXTENDED
 
     def translate_to_english(self, text: str, source_lang: str) -> str:
         if not text:
@@ -144,7 +61,7 @@ class TranslationClassifier:
                 return "[Translation Not Available]"
 
             try:
-                translated = GoogleTranslator(source=lang_code, target='en').translate(text)
+                translated = translate(text, source=lang_code)
                 print(f"[TRANSLATED] From '{source_lang}' ({lang_code}): '{text[:30]}' -> '{translated[:30]}'")
                 return translated
             except Exception as e:
@@ -158,31 +75,23 @@ class TranslationClassifier:
      
     def classify_document(self, text: str) -> Dict[str, str]:
         """Classify document type from English text"""
-        text = text.lower()
-        for doc_type, keywords in self.DOCUMENT_TYPES.items():
-            matched = [kw for kw in keywords if re.search(rf'\b{re.escape(kw)}\b', text)]
-            if matched:
-                return {
-                    'document_type': doc_type,
-                    'matched_keywords': ", ".join(matched)
-                }
+        keywords = keyword_classifier('word', document=self.DOCUMENT_TYPES, product=self.PRODUCT_TYPES)
+        doc_type, matched = keywords.first_match(text, 'document')
+        if matched:
+            return {
+                'document_type': doc_type,
+                'matched_keywords': ", ".join(matched)
+            }
         return {'document_type': 'Other Type', 'matched_keywords': 'unclassified'}
     
     def extract_drug_names(self, text: str) -> List[str]:
         if not text.strip():
             return []
 
-        matched = []
-        for term in self.drug_terms_set:
-            # Escape regex special chars and match as whole word/phrase
-            pattern = r'\b' + re.escape(term) + r'\b'
-            if re.search(pattern, text, flags=re.IGNORECASE):
-                matched.append(term)
-        return matched
+        return self.drug_matcher.find_all(text)
         
     def classify_product(self, text: str) -> Dict[str, str]:
         """Classify product type from English text with drug name extraction"""
-        text_lower = text.lower()
         drug_names = self.extract_drug_names(text)
         product_info = {
             'product_type': None,
@@ -190,18 +99,15 @@ class TranslationClassifier:
             'drug_names': ", ".join(drug_names) if drug_names else None
             }
 
-        # First check for specific product types
-        for product_type, keywords in self.PRODUCT_TYPES.items():
-            if product_type == 'Drug Product':
-               continue  # We'll handle this separately
-        
-            matched = [kw for kw in keywords if re.search(rf'\b{re.escape(kw)}\b', text_lower)]
-            if matched:
-                product_info.update({
-                    'product_type': product_type,
-                    'product_keywords': ", ".join(matched)
-                    })
-                return product_info
+        # First check for specific product types; Drug Product is handled separately
+        keywords = keyword_classifier('word', document=self.DOCUMENT_TYPES, product=self.PRODUCT_TYPES)
+        product_type, matched = keywords.first_match(text, 'product', skip=('Drug Product',))
+        if matched:
+            product_info.update({
+                'product_type': product_type,
+                'product_keywords': ", ".join(matched)
+                })
+            return product_info
     
     # If no specific type matched but we found drug names, classify as Drug Product
         if drug_names:
@@ -226,596 +132,16 @@ class BEnewsSpider(scrapy.Spider):
     page_counter = 0 
     
     # Country patterns for detection in text
-    COUNTRY_PATTERNS = {
-        # Europe (Complete list)
-        'Albania': ['albania', 'shqipëria', 'tirana'],
-        'Andorra': ['andorra', 'andorre'],
-        'Austria': ['austria', 'österreich', 'vienna'],
-        'Belarus': ['belarus', 'belarús', 'minsk'],
-        'Belgium': ['belgium', 'belgique', 'belgie', 'brussels'],
-        'Bosnia and Herzegovina': ['bosnia', 'herzegovina', 'sarajevo'],
-        'Bulgaria': ['bulgaria', 'българия', 'sofia'],
-        'Croatia': ['croatia', 'hrvatska', 'zagreb'],
-        'Cyprus': ['cyprus', 'κύπρος', 'lefkosia'],
-        'Czech Republic': ['czech republic', 'česko', 'prague'],
-        'Denmark': ['denmark', 'danmark', 'copenhagen'],
-        'Estonia': ['estonia', 'eesti', 'tallinn'],
-        'Finland': ['finland', 'suomi', 'helsinki'],
-        'France': ['france', 'french', 'paris'],
-        'Germany': ['germany', 'deutschland', 'berlin'],
-        'Greece': ['greece', 'ελλάδα', 'athens'],
-        'Hungary': ['hungary', 'magyarország', 'budapest'],
-        'Iceland': ['iceland', 'ísland', 'reykjavik'],
-        'Ireland': ['ireland', 'éire', 'dublin'],
-        'Italy': ['italy', 'italia', 'rome'],
-        'Latvia': ['latvia', 'latvija', 'riga'],
-        'Liechtenstein': ['liechtenstein', 'vaduz'],
-        'Lithuania': ['lithuania', 'lietuva', 'vilnius'],
-        'Luxembourg': ['luxembourg', 'luxemburg', 'luxembourg city'],
-        'Malta': ['malta', 'valletta'],
-        'Moldova': ['moldova', 'chișinău'],
-        'Monaco': ['monaco', 'monaco-ville'],
-        'Montenegro': ['montenegro', 'crna gora', 'podgorica'],
-        'Netherlands': ['netherlands', 'nederland', 'holland', 'amsterdam'],
-        'North Macedonia': ['north macedonia', 'macedonia', 'skopje'],
-        'Norway': ['norway', 'norge', 'oslo'],
-        'Poland': ['poland', 'polska', 'warsaw'],
-        'Portugal': ['portugal', 'lisbon'],
-        'Romania': ['romania', 'românia', 'bucharest'],
-        'Russia': ['russia', 'россия', 'moscow'],
-        'San Marino': ['san marino'],
-        'Serbia': ['serbia', 'srbija', 'belgrade'],
-        'Slovakia': ['slovakia', 'slovensko', 'bratislava'],
-        'Slovenia': ['slovenia', 'slovenija', 'ljubljana'],
-        'Spain': ['spain', 'españa', 'madrid'],
-        'Sweden': ['sweden', 'sverige', 'stockholm'],
-        'Switzerland': ['switzerland', 'suisse', 'schweiz', 'bern'],
-        'Ukraine': ['ukraine', 'україна', 'kyiv'],
-        'United Kingdom': ['uk', 'united kingdom', 'britain', 'london'],
-        'Vatican City': ['vatican', 'holy see'],
-
-        # Americas (Complete list)
-        'Antigua and Barbuda': ['antigua', 'barbuda', "antigua and barbuda", 'saint john'],
-        'Argentina': ['argentina', 'buenos aires', 'argentine republic'],
-        'Bahamas': ['bahamas', 'nassau', 'commonwealth of the bahamas'],
-        'Barbados': ['barbados', 'bridgetown'],
-        'Belize': ['belize', 'belmopan'],
-        'Bolivia': ['bolivia', 'sucre', 'la paz', 'plurinational state'],
-        'Brazil': ['brazil', 'brasil', 'brasília', 'rio de janeiro', 'federative republic'],
-        'Canada': ['canada', 'ottawa', 'toronto', 'ontario', 'quebec'],
-        'Chile': ['chile', 'santiago', 'republic of chile'],
-        'Colombia': ['colombia', 'bogotá', 'bogota', 'republic of colombia'],
-        'Costa Rica': ['costa rica', 'san josé', 'san jose'],
-        'Cuba': ['cuba', 'havana', 'republic of cuba'],
-        'Dominica': ['dominica', 'roseau', 'commonwealth of dominica'],
-        'Dominican Republic': ['dominican republic', 'santo domingo'],
-        'Ecuador': ['ecuador', 'quito', 'republic of ecuador'],
-        'El Salvador': ['el salvador', 'san salvador', 'republic of el salvador'],
-        'Grenada': ['grenada', "saint george"],
-        'Guatemala': ['guatemala', 'guatemala city', 'republic of guatemala'],
-        'Guyana': ['guyana', 'georgetown', 'cooperative republic'],
-        'Haiti': ['haiti', 'port-au-prince', 'republic of haiti'],
-        'Honduras': ['honduras', 'tegucigalpa', 'republic of honduras'],
-        'Jamaica': ['jamaica', 'kingston'],
-        'Mexico': ['mexico', 'méxico', 'mexico city', 'cdmx', 'estados unidos mexicanos'],
-        'Nicaragua': ['nicaragua', 'managua', 'republic of nicaragua'],
-        'Panama': ['panama', 'panama city', 'republic of panama'],
-        'Paraguay': ['paraguay', 'asunción', 'asunción', 'republic of paraguay'],
-        'Peru': ['peru', 'lima', 'republic of peru'],
-        'Saint Kitts and Nevis': ['saint kitts', 'nevis', 'basseterre'],
-        'Saint Lucia': ['saint lucia', 'castries'],
-        'Saint Vincent and the Grenadines': ['saint vincent', 'grenadines', 'kingstown'],
-        'Suriname': ['suriname', 'paramaribo', 'republic of suriname'],
-        'Trinidad and Tobago': ['trinidad', 'tobago', 'port of spain'],
-        'United States': ['usa', 'u\\.s\\.', 'united states', 'america', 'washington dc', 'new york', 'california'],
-        'Uruguay': ['uruguay', 'montevideo', 'oriental republic'],
-        'Venezuela': ['venezuela', 'caracas', 'bolivarian republic'],
-
-        # Asia (Complete list)
-        'Afghanistan': ['afghanistan', 'kabul', 'islamic emirate'],
-        'Armenia': ['armenia', 'yerevan', 'republic of armenia'],
-        'Azerbaijan': ['azerbaijan', 'baku', 'republic of azerbaijan'],
-        'Bahrain': ['bahrain', 'manama', 'kingdom of bahrain'],
-        'Bangladesh': ['bangladesh', 'dhaka', "people's republic"],
-        'Bhutan': ['bhutan', 'thimphu', 'kingdom of bhutan'],
-        'Brunei': ['brunei', 'bandar seri begawan', 'darussalam'],
-        'Cambodia': ['cambodia', 'phnom penh', 'kingdom of cambodia'],
-        'China': ['china', 'zhongguo', 'beijing', 'shanghai', "people's republic"],
-        'Cyprus': ['cyprus', 'nicosia', 'republic of cyprus'],
-        'Georgia': ['georgia', 'tbilisi'],
-        'India': ['india', 'bharat', 'new delhi', 'mumbai', 'republic of india'],
-        'Indonesia': ['indonesia', 'jakarta', 'republic of indonesia'],
-        'Iran': ['iran', 'tehran', 'islamic republic'],
-        'Iraq': ['iraq', 'baghdad', 'republic of iraq'],
-        'Israel': ['israel', 'jerusalem', 'state of israel'],
-        'Japan': ['japan', 'nippon', 'tokyo'],
-        'Jordan': ['jordan', 'amman', 'hashemite kingdom'],
-        'Kazakhstan': ['kazakhstan', 'nur-sultan', 'astana', 'republic of kazakhstan'],
-        'Kuwait': ['kuwait', 'kuwait city', 'state of kuwait'],
-        'Kyrgyzstan': ['kyrgyzstan', 'bishkek', 'kyrgyz republic'],
-        'Laos': ['laos', 'vientiane', "lao people's republic"],
-        'Lebanon': ['lebanon', 'beirut', 'lebanese republic'],
-        'Malaysia': ['malaysia', 'kuala lumpur', 'putrajaya'],
-        'Maldives': ['maldives', 'malé', 'republic of maldives'],
-        'Mongolia': ['mongolia', 'ulaanbaatar'],
-        'Myanmar': ['myanmar', 'burma', 'naypyidaw', 'republic of the union'],
-        'Nepal': ['nepal', 'kathmandu', 'federal democratic republic'],
-        'North Korea': ['north korea', 'dprk', 'pyongyang', "democratic people's republic"],
-        'Oman': ['oman', 'muscat', 'sultanate of oman'],
-        'Pakistan': ['pakistan', 'islamabad', 'islamic republic'],
-        'Palestine': ['palestine', 'ramallah', 'state of palestine'],
-        'Philippines': ['philippines', 'manila', 'republic of the philippines'],
-        'Qatar': ['qatar', 'doha', 'state of qatar'],
-        'Russia': ['russia', 'russian federation', 'moscow'],
-        'Saudi Arabia': ['saudi arabia', 'riyadh', 'kingdom of saudi arabia'],
-        'Singapore': ['singapore', 'republic of singapore'],
-        'South Korea': ['south korea', 'korea republic', 'seoul', 'republic of korea'],
-        'Sri Lanka': ['sri lanka', 'colombo', 'sri jayawardenepura kotte'],
-        'Syria': ['syria', 'damascus', 'syrian arab republic'],
-        'Taiwan': ['taiwan', 'taipei', 'republic of china'],
-        'Tajikistan': ['tajikistan', 'dushanbe', 'republic of tajikistan'],
-        'Thailand': ['thailand', 'bangkok', 'kingdom of thailand'],
-        'Timor-Leste': ['timor-leste', 'east timor', 'dili', 'democratic republic'],
-        'Turkey': ['turkey', 'türkiye', 'ankara', 'republic of turkey'],
-        'Turkmenistan': ['turkmenistan', 'ashgabat'],
-        'United Arab Emirates': ['uae', 'united arab emirates', 'dubai', 'abu dhabi'],
-        'Uzbekistan': ['uzbekistan', 'tashkent', 'republic of uzbekistan'],
-        'Vietnam': ['vietnam', 'hanoi', 'socialist republic'],
-        'Yemen': ['yemen', "sana'a", 'republic of yemen'],
-
-        # Africa (Complete list)
-        'Algeria': ['algeria', 'algiers', "people's democratic republic"],
-        'Angola': ['angola', 'luanda', 'republic of angola'],
-        'Benin': ['benin', 'porto-novo', 'republic of benin'],
-        'Botswana': ['botswana', 'gaborone', 'republic of botswana'],
-        'Burkina Faso': ['burkina faso', 'ouagadougou'],
-        'Burundi': ['burundi', 'gitega', 'republic of burundi'],
-        'Cameroon': ['cameroon', 'yaoundé', 'republic of cameroon'],
-        'Cape Verde': ['cape verde', 'cabo verde', 'praia', 'republic of cape verde'],
-        'Central African Republic': ['central african republic', 'bangui'],
-        'Chad': ['chad', "n'djamena", 'republic of chad'],
-        'Comoros': ['comoros', 'moroni', 'union of the comoros'],
-        'Congo (Brazzaville)': ['republic of the congo', 'congo-brazzaville', 'brazzaville'],
-        'Congo (Kinshasa)': ['democratic republic of the congo', 'drc', 'kinshasa'],
-        "Côte d'Ivoire": ["côte d'ivoire", 'ivory coast', 'yamoussoukro'],
-        'Djibouti': ['djibouti', 'republic of djibouti'],
-        'Egypt': ['egypt', 'cairo', 'arab republic of egypt'],
-        'Equatorial Guinea': ['equatorial guinea', 'malabo', 'republic of equatorial guinea'],
-        'Eritrea': ['eritrea', 'asmara', 'state of eritrea'],
-        'Eswatini': ['eswatini', 'swaziland', 'mbabane', 'kingdom of eswatini'],
-        'Ethiopia': ['ethiopia', 'addis ababa', 'federal democratic republic'],
-        'Gabon': ['gabon', 'libreville', 'gabonese republic'],
-        'Gambia': ['gambia', 'banjul', 'republic of the gambia'],
-        'Ghana': ['ghana', 'accra', 'republic of ghana'],
-        'Guinea': ['guinea', 'conakry', 'republic of guinea'],
-        'Guinea-Bissau': ['guinea-bissau', 'bissau', 'republic of guinea-bissau'],
-        'Kenya': ['kenya', 'nairobi', 'republic of kenya'],
-        'Lesotho': ['lesotho', 'maseru', 'kingdom of lesotho'],
-        'Liberia': ['liberia', 'monrovia', 'republic of liberia'],
-        'Libya': ['libya', 'tripoli', 'state of libya'],
-        'Madagascar': ['madagascar', 'antananarivo', 'republic of madagascar'],
-        'Malawi': ['malawi', 'lilongwe', 'republic of malawi'],
-        'Mali': ['mali', 'bamako', 'republic of mali'],
-        'Mauritania': ['mauritania', 'nouakchott', 'islamic republic'],
-        'Mauritius': ['mauritius', 'port louis', 'republic of mauritius'],
-        'Morocco': ['morocco', 'rabat', 'kingdom of morocco'],
-        'Mozambique': ['mozambique', 'maputo', 'republic of mozambique'],
-        'Namibia': ['namibia', 'windhoek', 'republic of namibia'],
-        'Niger': ['niger', 'niamey', 'republic of niger'],
-        'Nigeria': ['nigeria', 'abuja', 'federal republic of nigeria'],
-        'Rwanda': ['rwanda', 'kigali', 'republic of rwanda'],
-        'Sao Tome and Principe': ['são tomé and príncipe', 'sao tome', 'são tomé'],
-        'Senegal': ['senegal', 'dakar', 'republic of senegal'],
-        'Seychelles': ['seychelles', 'victoria', 'republic of seychelles'],
-        'Sierra Leone': ['sierra leone', 'freetown', 'republic of sierra leone'],
-        'Somalia': ['somalia', 'mogadishu', 'federal republic of somalia'],
-        'South Africa': ['south africa', 'pretoria', 'cape town', 'republic of south africa'],
-        'South Sudan': ['south sudan', 'juba', 'republic of south sudan'],
-        'Sudan': ['sudan', 'khartoum', 'republic of the sudan'],
-        'Tanzania': ['tanzania', 'dodoma', 'united republic of tanzania'],
-        'Togo': ['togo', 'lomé', 'togolese republic'],
-        'Tunisia': ['tunisia', 'tunis', 'republic of tunisia'],
-        'Uganda': ['uganda', 'kampala', 'republic of uganda'],
-        'Zambia': ['zambia', 'lusaka', 'republic of zambia'],
-        'Zimbabwe': ['zimbabwe', 'harare', 'republic of zimbabwe'],
-
-        # International/Regional
-        'European Union': ['eu', 'european union', 'e\\.u\\.', 'brussels eu'],
-        'African Union': ['african union', 'au', 'addis ababa'],
-        'ASEAN': ['asean', 'southeast asia', 'jakarta'],
-        'Global': ['who', 'world health organization', 'united nations', 'international'],
-    }
+    COUNTRY_PATTERNS = reference.COUNTRY_PATTERNS
 
     # Mapping of regions to countries
-    REGION_MAPPING = {
-        # Europe
-        'Albania': 'Southern Europe',
-        'Andorra': 'Southern Europe',
-        'Austria': 'Central Europe',
-        'Belarus': 'Eastern Europe',
-        'Belgium': 'Western Europe',
-        'Bosnia and Herzegovina': 'Southern Europe',
-        'Bulgaria': 'Eastern Europe',
-        'Croatia': 'Southern Europe',
-        'Cyprus': 'Southern Europe',
-        'Czech Republic': 'Central Europe',
-        'Denmark': 'Northern Europe',
-        'Estonia': 'Northern Europe',
-        'Finland': 'Northern Europe',
-        'France': 'Western Europe',
-        'Germany': 'Central Europe',
-        'Greece': 'Southern Europe',
-        'Hungary': 'Central Europe',
-        'Iceland': 'Northern Europe',
-        'Ireland': 'Northern Europe',
-        'Italy': 'Southern Europe',
-        'Latvia': 'Northern Europe',
-        'Liechtenstein': 'Central Europe',
-        'Lithuania': 'Northern Europe',
-        'Luxembourg': 'Western Europe',
-        'Malta': 'Southern Europe',
-        'Moldova': 'Eastern Europe',
-        'Monaco': 'Western Europe',
-        'Montenegro': 'Southern Europe',
-        'Netherlands': 'Western Europe',
-        'North Macedonia': 'Southern Europe',
-        'Norway': 'Northern Europe',
-        'Poland': 'Central Europe',
-        'Portugal': 'Southern Europe',
-        'Romania': 'Eastern Europe',
-        'Russia': 'Eastern Europe',  # Transcontinental
-        'San Marino': 'Southern Europe',
-        'Serbia': 'Southern Europe',
-        'Slovakia': 'Central Europe',
-        'Slovenia': 'Southern Europe',
-        'Spain': 'Southern Europe',
-        'Sweden': 'Northern Europe',
-        'Switzerland': 'Central Europe',
-        'Ukraine': 'Eastern Europe',
-        'United Kingdom': 'Northern Europe',
-        'Vatican City': 'Southern Europe',
-
-        # Americas
-        # North America
-        'Canada': 'North America',
-        'United States': 'North America',
-        'Mexico': 'North America',
-        
-        # Central America
-        'Belize': 'Central America',
-        'Costa Rica': 'Central America',
-        'El Salvador': 'Central America',
-        'Guatemala': 'Central America',
-        'Honduras': 'Central America',
-        'Nicaragua': 'Central America',
-        'Panama': 'Central America',
-        
-        # Caribbean
-        'Antigua and Barbuda': 'Caribbean',
-        'Bahamas': 'Caribbean',
-        'Barbados': 'Caribbean',
-        'Cuba': 'Caribbean',
-        'Dominica': 'Caribbean',
-        'Dominican Republic': 'Caribbean',
-        'Grenada': 'Caribbean',
-        'Haiti': 'Caribbean',
-        'Jamaica': 'Caribbean',
-        'Saint Kitts and Nevis': 'Caribbean',
-        'Saint Lucia': 'Caribbean',
-        'Saint Vincent and the Grenadines': 'Caribbean',
-        'Trinidad and Tobago': 'Caribbean',
-        
-        # South America
-        'Argentina': 'South America',
-        'Bolivia': 'South America',
-        'Brazil': 'South America',
-        'Chile': 'South America',
-        'Colombia': 'South America',
-        'Ecuador': 'South America',
-        'Guyana': 'South America',
-        'Paraguay': 'South America',
-        'Peru': 'South America',
-        'Suriname': 'South America',
-        'Uruguay': 'South America',
-        'Venezuela': 'South America',
-
-        # Asia
-        # Central Asia
-        'Kazakhstan': 'Central Asia',
-        'Kyrgyzstan': 'Central Asia',
-        'Tajikistan': 'Central Asia',
-        'Turkmenistan': 'Central Asia',
-        'Uzbekistan': 'Central Asia',
-        
-        # East Asia
-        'China': 'East Asia',
-        'Japan': 'East Asia',
-        'Mongolia': 'East Asia',
-        'North Korea': 'East Asia',
-        'South Korea': 'East Asia',
-        'Taiwan': 'East Asia',
-        
-        # South Asia
-        'Afghanistan': 'South Asia',
-        'Bangladesh': 'South Asia',
-        'Bhutan': 'South Asia',
-        'India': 'South Asia',
-        'Maldives': 'South Asia',
-        'Nepal': 'South Asia',
-        'Pakistan': 'South Asia',
-        'Sri Lanka': 'South Asia',
-        
-        # Southeast Asia
-        'Brunei': 'Southeast Asia',
-        'Cambodia': 'Southeast Asia',
-        'Indonesia': 'Southeast Asia',
-        'Laos': 'Southeast Asia',
-        'Malaysia': 'Southeast Asia',
-        'Myanmar': 'Southeast Asia',
-        'Philippines': 'Southeast Asia',
-        'Singapore': 'Southeast Asia',
-        'Thailand': 'Southeast Asia',
-        'Timor-Leste': 'Southeast Asia',
-        'Vietnam': 'Southeast Asia',
-        
-        # Middle East (West Asia)
-        'Armenia': 'Middle East',
-        'Azerbaijan': 'Middle East',
-        'Bahrain': 'Middle East',
-        'Cyprus': 'Middle East',
-        'Georgia': 'Middle East',
-        'Iran': 'Middle East',
-        'Iraq': 'Middle East',
-        'Israel': 'Middle East',
-        'Jordan': 'Middle East',
-        'Kuwait': 'Middle East',
-        'Lebanon': 'Middle East',
-        'Oman': 'Middle East',
-        'Palestine': 'Middle East',
-        'Qatar': 'Middle East',
-        'Saudi Arabia': 'Middle East',
-        'Syria': 'Middle East',
-        'Turkey': 'Middle East',
-        'United Arab Emirates': 'Middle East',
-        'Yemen': 'Middle East',
-
-        # ====== AFRICA ====== #
-        # Northern Africa
-        'Algeria': 'Northern Africa',
-        'Egypt': 'Northern Africa',
-        'Libya': 'Northern Africa',
-        'Morocco': 'Northern Africa',
-        'Sudan': 'Northern Africa',
-        'Tunisia': 'Northern Africa',
-        
-        # Sub-Saharan Africa
-        # Western Africa
-        'Benin': 'Western Africa',
-        'Burkina Faso': 'Western Africa',
-        'Cape Verde': 'Western Africa',
-        "Côte d'Ivoire": 'Western Africa',
-        'Gambia': 'Western Africa',
-        'Ghana': 'Western Africa',
-        'Guinea': 'Western Africa',
-        'Guinea-Bissau': 'Western Africa',
-        'Liberia': 'Western Africa',
-        'Mali': 'Western Africa',
-        'Mauritania': 'Western Africa',
-        'Niger': 'Western Africa',
-        'Nigeria': 'Western Africa',
-        'Senegal': 'Western Africa',
-        'Sierra Leone': 'Western Africa',
-        'Togo': 'Western Africa',
-        
-        # Central Africa
-        'Angola': 'Central Africa',
-        'Cameroon': 'Central Africa',
-        'Central African Republic': 'Central Africa',
-        'Chad': 'Central Africa',
-        'Congo (Brazzaville)': 'Central Africa',
-        'Congo (Kinshasa)': 'Central Africa',
-        'Equatorial Guinea': 'Central Africa',
-        'Gabon': 'Central Africa',
-        'Sao Tome and Principe': 'Central Africa',
-        
-        # Eastern Africa
-        'Burundi': 'Eastern Africa',
-        'Comoros': 'Eastern Africa',
-        'Djibouti': 'Eastern Africa',
-        'Eritrea': 'Eastern Africa',
-        'Ethiopia': 'Eastern Africa',
-        'Kenya': 'Eastern Africa',
-        'Madagascar': 'Eastern Africa',
-        'Malawi': 'Eastern Africa',
-        'Mauritius': 'Eastern Africa',
-        'Mozambique': 'Eastern Africa',
-        'Rwanda': 'Eastern Africa',
-        'Seychelles': 'Eastern Africa',
-        'Somalia': 'Eastern Africa',
-        'South Sudan': 'Eastern Africa',
-        'Tanzania': 'Eastern Africa',
-        'Uganda': 'Eastern Africa',
-        'Zambia': 'Eastern Africa',
-        'Zimbabwe': 'Eastern Africa',
-        
-        # Southern Africa
-        'Botswana': 'Southern Africa',
-        'Eswatini': 'Southern Africa',
-        'Lesotho': 'Southern Africa',
-        'Namibia': 'Southern Africa',
-        'South Africa': 'Southern Africa',
-
-        # Oceania
-        'Australia': 'Australia and New Zealand',
-        'New Zealand': 'Australia and New Zealand',
-        'Fiji': 'Pacific Islands',
-        'Papua New Guinea': 'Pacific Islands',
-        'Solomon Islands': 'Pacific Islands',
-        'Vanuatu': 'Pacific Islands',
-
-        # Special Regions
-        'European Union': 'European Union',
-        'African Union': 'African Union',
-        'ASEAN': 'ASEAN',
-        'Global': 'Global'
-    }
+    REGION_MAPPING = reference.REGION_MAPPING
 
     # Mapping of languages to likely countries
-    LANGUAGE_TO_COUNTRY = {
-        # European Languages
-        'dutch': 'Netherlands', 'dutch': 'Belgium',
-        'german': 'Germany', 'austrian german': 'Austria',
-        'swiss german': 'Switzerland', 'french': 'France',
-        'belgian french': 'Belgium', 'swiss french': 'Switzerland',
-        'canadian french': 'Canada', 'italian': 'Italy',
-        'swiss italian': 'Switzerland', 'spanish': 'Spain',
-        'latin american spanish': 'Mexico', 'catalan': 'Spain',
-        'portuguese': 'Portugal', 'brazilian portuguese': 'Brazil',
-        'english': 'United States', 'british english': 'United Kingdom',
-        'irish english': 'Ireland', 'scots': 'United Kingdom',
-        'swedish': 'Sweden', 'norwegian': 'Norway',
-        'danish': 'Denmark', 'finnish': 'Finland',
-        'icelandic': 'Iceland', 'russian': 'Russia',
-        'ukrainian': 'Ukraine', 'polish': 'Poland',
-        'czech': 'Czech Republic', 'slovak': 'Slovakia',
-        'hungarian': 'Hungary', 'romanian': 'Romania',
-        'bulgarian': 'Bulgaria', 'serbian': 'Serbia',
-        'croatian': 'Croatia', 'slovenian': 'Slovenia',
-        'bosnian': 'Bosnia and Herzegovina', 'albanian': 'Albania',
-        'greek': 'Greece', 'turkish': 'Turkey',
-        'estonian': 'Estonia', 'latvian': 'Latvia',
-        'lithuanian': 'Lithuania', 'maltese': 'Malta',
-
-        # Asian Languages
-        'mandarin': 'China', 'cantonese': 'China',
-        'japanese': 'Japan', 'korean': 'South Korea',
-        'vietnamese': 'Vietnam', 'thai': 'Thailand',
-        'hindi': 'India', 'bengali': 'Bangladesh',
-        'punjabi': 'India', 'tamil': 'India',
-        'telugu': 'India', 'urdu': 'Pakistan',
-        'indonesian': 'Indonesia', 'malay': 'Malaysia',
-        'filipino': 'Philippines', 'burmese': 'Myanmar',
-        'khmer': 'Cambodia', 'lao': 'Laos',
-        'mongolian': 'Mongolia', 'nepali': 'Nepal',
-        'sinhala': 'Sri Lanka', 'dzongkha': 'Bhutan',
-
-        # Middle Eastern Languages
-        'arabic': 'Egypt', 'egyptian arabic': 'Egypt',
-        'saudi arabic': 'Saudi Arabia', 'hebrew': 'Israel',
-        'persian': 'Iran', 'pashto': 'Afghanistan',
-        'dari': 'Afghanistan', 'kurdish': 'Iraq',
-        'turkmen': 'Turkmenistan', 'uzbek': 'Uzbekistan',
-        'kazakh': 'Kazakhstan',
-
-        # African Languages
-        'swahili': 'Tanzania', 'amharic': 'Ethiopia',
-        'yoruba': 'Nigeria', 'hausa': 'Nigeria',
-        'igbo': 'Nigeria', 'somali': 'Somalia',
-        'afrikaans': 'South Africa', 'zulu': 'South Africa',
-        'xhosa': 'South Africa', 'shona': 'Zimbabwe',
-        'malagasy': 'Madagascar',
-
-        # Americas
-        'american english': 'United States',
-        'canadian english': 'Canada',
-        'mexican spanish': 'Mexico',
-        'argentine spanish': 'Argentina',
-        'brazilian portuguese': 'Brazil',
-        'quebec french': 'Canada',
-        'haitian creole': 'Haiti',
-        'jamaican patois': 'Jamaica',
-
-        # Other
-        'esperanto': 'International',
-        'latin': 'Vatican City'
-    }
+    LANGUAGE_TO_COUNTRY = LANGUAGE_TO_COUNTRY
 
     # Country code top-level domains
-    COUNTRY_TLDS = {
-        # ====== OFFICIAL COUNTRY CODE TLDs ======
-        # Europe
-        '.al': 'Albania', '.ad': 'Andorra', '.am': 'Armenia', '.at': 'Austria',
-        '.az': 'Azerbaijan', '.by': 'Belarus', '.be': 'Belgium', '.ba': 'Bosnia and Herzegovina',
-        '.bg': 'Bulgaria', '.hr': 'Croatia', '.cy': 'Cyprus', '.cz': 'Czech Republic',
-        '.dk': 'Denmark', '.ee': 'Estonia', '.fi': 'Finland', '.fr': 'France',
-        '.ge': 'Georgia', '.de': 'Germany', '.gr': 'Greece', '.hu': 'Hungary',
-        '.is': 'Iceland', '.ie': 'Ireland', '.it': 'Italy', '.kz': 'Kazakhstan',
-        '.lv': 'Latvia', '.li': 'Liechtenstein', '.lt': 'Lithuania', '.lu': 'Luxembourg',
-        '.mk': 'North Macedonia', '.mt': 'Malta', '.md': 'Moldova', '.mc': 'Monaco',
-        '.me': 'Montenegro', '.nl': 'Netherlands', '.no': 'Norway', '.pl': 'Poland',
-        '.pt': 'Portugal', '.ro': 'Romania', '.ru': 'Russia', '.sm': 'San Marino',
-        '.rs': 'Serbia', '.sk': 'Slovakia', '.si': 'Slovenia', '.es': 'Spain',
-        '.se': 'Sweden', '.ch': 'Switzerland', '.tr': 'Turkey', '.ua': 'Ukraine',
-        '.uk': 'United Kingdom', '.va': 'Vatican City',
-       
-        # Americas
-        '.ai': 'Anguilla', '.ag': 'Antigua and Barbuda', '.ar': 'Argentina', '.aw': 'Aruba',
-        '.bs': 'Bahamas', '.bb': 'Barbados', '.bz': 'Belize', '.bm': 'Bermuda',
-        '.bo': 'Bolivia', '.br': 'Brazil', '.vg': 'British Virgin Islands', '.ca': 'Canada',
-        '.ky': 'Cayman Islands', '.cl': 'Chile', '.co': 'Colombia', '.cr': 'Costa Rica',
-        '.cu': 'Cuba', '.dm': 'Dominica', '.do': 'Dominican Republic', '.ec': 'Ecuador',
-        '.sv': 'El Salvador', '.fk': 'Falkland Islands', '.gd': 'Grenada', '.gt': 'Guatemala',
-        '.gy': 'Guyana', '.ht': 'Haiti', '.hn': 'Honduras', '.jm': 'Jamaica',
-        '.mx': 'Mexico', '.ni': 'Nicaragua', '.pa': 'Panama', '.py': 'Paraguay',
-        '.pe': 'Peru', '.pr': 'Puerto Rico', '.bl': 'Saint Barthélemy', '.kn': 'Saint Kitts and Nevis',
-        '.lc': 'Saint Lucia', '.mf': 'Saint Martin', '.vc': 'Saint Vincent and the Grenadines',
-        '.sr': 'Suriname', '.tt': 'Trinidad and Tobago', '.tc': 'Turks and Caicos Islands',
-        '.us': 'United States', '.uy': 'Uruguay', '.ve': 'Venezuela',
-        
-        # Asia
-        '.af': 'Afghanistan', '.bh': 'Bahrain', '.bd': 'Bangladesh', '.bt': 'Bhutan',
-        '.bn': 'Brunei', '.kh': 'Cambodia', '.cn': 'China', '.tw': 'Taiwan',
-        '.in': 'India', '.id': 'Indonesia', '.ir': 'Iran', '.iq': 'Iraq',
-        '.il': 'Israel', '.jp': 'Japan', '.jo': 'Jordan', '.kw': 'Kuwait',
-        '.kg': 'Kyrgyzstan', '.la': 'Laos', '.lb': 'Lebanon', '.mo': 'Macao',
-        '.my': 'Malaysia', '.mv': 'Maldives', '.mn': 'Mongolia', '.mm': 'Myanmar',
-        '.np': 'Nepal', '.kp': 'North Korea', '.om': 'Oman', '.pk': 'Pakistan',
-        '.ps': 'Palestine', '.ph': 'Philippines', '.qa': 'Qatar', '.sa': 'Saudi Arabia',
-        '.sg': 'Singapore', '.kr': 'South Korea', '.lk': 'Sri Lanka', '.sy': 'Syria',
-        '.tj': 'Tajikistan', '.th': 'Thailand', '.tl': 'Timor-Leste', '.ae': 'United Arab Emirates',
-        '.uz': 'Uzbekistan', '.vn': 'Vietnam', '.ye': 'Yemen',
-
-        # Africa
-        '.dz': 'Algeria', '.ao': 'Angola', '.bj': 'Benin', '.bw': 'Botswana',
-        '.bf': 'Burkina Faso', '.bi': 'Burundi', '.cv': 'Cape Verde', '.cm': 'Cameroon',
-        '.cf': 'Central African Republic', '.td': 'Chad', '.km': 'Comoros', '.cd': 'Congo (Kinshasa)',
-        '.cg': 'Congo (Brazzaville)', '.ci': "Côte d'Ivoire", '.dj': 'Djibouti', '.eg': 'Egypt',
-        '.gq': 'Equatorial Guinea', '.er': 'Eritrea', '.sz': 'Eswatini', '.et': 'Ethiopia',
-        '.ga': 'Gabon', '.gm': 'Gambia', '.gh': 'Ghana', '.gn': 'Guinea',
-        '.gw': 'Guinea-Bissau', '.ke': 'Kenya', '.ls': 'Lesotho', '.lr': 'Liberia',
-        '.ly': 'Libya', '.mg': 'Madagascar', '.mw': 'Malawi', '.ml': 'Mali',
-        '.mr': 'Mauritania', '.mu': 'Mauritius', '.yt': 'Mayotte', '.ma': 'Morocco',
-        '.mz': 'Mozambique', '.na': 'Namibia', '.ne': 'Niger', '.ng': 'Nigeria',
-        '.re': 'Réunion', '.rw': 'Rwanda', '.sh': 'Saint Helena', '.st': 'Sao Tome and Principe',
-        '.sn': 'Senegal', '.sc': 'Seychelles', '.sl': 'Sierra Leone', '.so': 'Somalia',
-        '.za': 'South Africa', '.ss': 'South Sudan', '.sd': 'Sudan', '.tz': 'Tanzania',
-        '.tg': 'Togo', '.tn': 'Tunisia', '.ug': 'Uganda', '.eh': 'Western Sahara',
-        '.zm': 'Zambia', '.zw': 'Zimbabwe',
-
-       # Oceania
-        '.as': 'American Samoa', '.au': 'Australia', '.ck': 'Cook Islands', '.fj': 'Fiji',
-        '.pf': 'French Polynesia', '.gu': 'Guam', '.ki': 'Kiribati', '.mh': 'Marshall Islands',
-        '.fm': 'Micronesia', '.nr': 'Nauru', '.nc': 'New Caledonia', '.nz': 'New Zealand',
-        '.nu': 'Niue', '.nf': 'Norfolk Island', '.mp': 'Northern Mariana Islands', '.pw': 'Palau',
-        '.pg': 'Papua New Guinea', '.pn': 'Pitcairn', '.ws': 'Samoa', '.sb': 'Solomon Islands',
-        '.tk': 'Tokelau', '.to': 'Tonga', '.tv': 'Tuvalu', '.vu': 'Vanuatu',
-
-        # ====== SPECIAL CASES & SECOND-LEVEL DOMAINS ======
-        # UK second-level domains
-        '.ac.uk': 'United Kingdom', '.gov.uk': 'United Kingdom', '.co.uk': 'United Kingdom',
-        '.org.uk': 'United Kingdom', '.me.uk': 'United Kingdom', '.net.uk': 'United Kingdom',
-            
-        # Australia second-level
-        '.com.au': 'Australia', '.org.au': 'Australia', '.net.au': 'Australia',
-        '.gov.au': 'Australia', '.edu.au': 'Australia',
-            
-        # Other notable second-levels
-       '.edu': 'United States', '.gov': 'United States', '.mil': 'United States',
-       '.gc.ca': 'Canada', '.gob.mx': 'Mexico', '.gov.in': 'India',
-            
-     # Generic TLDs with geographic significance
-     '.asia': 'Asia', '.eu': 'European Union', '.lat': 'Latin America'
-    }
+    COUNTRY_TLDS = reference.COUNTRY_TLDS
 
     def __init__(self):
         self.classifier = TranslationClassifier()
@@ -848,61 +174,10 @@ class BEnewsSpider(scrapy.Spider):
         
     def summarize_article(self, article):
         """Generate a 40-word summary"""
-        paragraphs = []
-        for p in article.css('div.node__content p'):
-            p_text = []
-            for node in p.xpath('.//node()'):
-                if isinstance(node.root, str):
-                    text = node.get().strip()
-                    if text: p_text.append(text)
-                elif node.root.tag in ['abbr', 'acronym']:
-                    abbr_text = node.css('::text').get()
-                    abbr_title = node.css('::attr(title)').get()
-                    if abbr_text and abbr_title:
-                        p_text.append(f"{abbr_text} ({abbr_title})")
-                else:
-                    text = node.css('::text').get()
-                    if text and text.strip():
-                        p_text.append(text.strip())
-            
-            paragraph = ' '.join(p_text).strip()
-            if paragraph: paragraphs.append(paragraph)
-        
-        if not paragraphs: return ""
-        
-        clean_text = ' '.join(paragraphs)
-        sentences = [s.strip() for s in re.split(r'(?<!\w\.\w.)(?<![A-Z][a-z]\.)(?<=\.|\?)\s', clean_text) if s.strip()]
-        
-        if not sentences: return ""
-        
-        words = re.findall(r'\b\w{3,}\b', clean_text.lower())
-        word_freq = Counter(words)
-        max_freq = max(word_freq.values()) if word_freq else 1
-        
-        common_abbr = {'ema', 'eu', 'hma', 'atmp'}
-        ranked_sentences = []
-        
-        for sentence in sentences:
-            words_in_sent = re.findall(r'\b\w{3,}\b', sentence.lower())
-            base_score = sum(word_freq[word] for word in words_in_sent) / max_freq
-            abbr_count = sum(1 for abbr in common_abbr if re.search(r'\b' + abbr + r'\b', sentence.lower()))
-            ranked_sentences.append((base_score * (1 + 0.3 * abbr_count), sentence))
-        
-        ranked_sentences.sort(reverse=True, key=lambda x: x[0])
-        
-        summary, word_count = [], 0
-        for score, sentence in ranked_sentences:
-            words = sentence.split()
-            if word_count + len(words) <= 40:
-                summary.append(sentence)
-                word_count += len(words)
-            else:
-                remaining = 40 - word_count
-                if remaining >= 3:
-                    summary.append(' '.join(words[:remaining]) + '...')
-                break
-        
-        return ' '.join(summary).strip()
+        paragraphs = [paragraph_text(p) for p in article.css('div.node__content p')]
+        clean_text = ' '.join(p for p in paragraphs if p)
+        if not clean_text: return ""
+        return extractive_summary(clean_text, word_limit=40)
 
     def closed(self, reason):
         # Save the workbook when spider is closed
@@ -930,7 +205,7 @@ class BEnewsSpider(scrapy.Spider):
                 return Lang.get(lang_code).display_name()
 
             # Fallback to langdetect
-            lang_code = detect(text)
+            lang_code = detect_language_code(text, site='fagg.be')
             # Handle Dutch language specifically
             if lang_code == 'nl':
                 return "dutch"
@@ -940,36 +215,12 @@ class BEnewsSpider(scrapy.Spider):
             logging.debug(f"Language detection failed: {str(e)}")
             return "Unknown"
         
-    def safe_translate(self, text: str, src_lang: str) -> str:
-        """Safe translation with error handling. Skips if text is empty or already English."""
-        if not text:
-            return text
-
-        src_lang = src_lang.lower().strip()
-        if src_lang in ["english", "en"]:
-            return text
-        
-        try:
-            # Handle Dutch specifically
-            if src_lang in ["dutch", "nl"]:
-                lang_code = "nl"
-            else:
-                lang_code = Lang.get(src_lang).to_alpha2()
-                
-            return GoogleTranslator(source=lang_code, target='en').translate(text)
-        except Exception as e:
-            logging.warning(f"Translation failed: {str(e)}")
-            return "[Translation Not Available]"
-
     def detect_countries(self, text: str) -> Dict[str, List[str]]:
         """Detect countries and regions mentioned in text"""
         text_lower = text.lower()
-        mentioned_countries = []
         mentioned_regions = []
         
-        for country, patterns in self.COUNTRY_PATTERNS.items():
-            if any(re.search(rf'\b{re.escape(pattern)}\b', text_lower) for pattern in patterns):
-                mentioned_countries.append(country)
+        mentioned_countries = country_gazetteer(self.COUNTRY_PATTERNS, literal=True).detect(text_lower)
         
         for country in mentioned_countries:
             region = self.REGION_MAPPING.get(country)
@@ -1013,7 +264,26 @@ class BEnewsSpider(scrapy.Spider):
         else:
             self.logger.info(f"Reached maximum page limit ({self.max_pages}), stopping pagination")
 
-    def parse_detail(self, response):
+    async def translate_fields(self, texts: List[str], src_lang: str) -> List[str]:
+        """Translate several fields at once off the reactor thread; untranslatable fields get a marker"""
+        src_lang = src_lang.lower().strip()
+        if src_lang in ["english", "en"]:
+            return list(texts)
+
+        try:
+            # Handle Dutch specifically
+            if src_lang in ["dutch", "nl"]:
+                lang_code = "nl"
+            else:
+                lang_code = Lang.get(src_lang).to_alpha2()
+        except Exception as e:
+            logging.warning(f"Translation failed: {str(e)}")
+            return [text and "[Translation Not Available]" for text in texts]
+
+        return await maybe_deferred_to_future(translation_service().translate_deferred(
+            texts, source=lang_code, fallback="[Translation Not Available]"))
+
+    async def parse_detail(self, response):
         title = response.meta['title']
         url = response.meta['url']
         
@@ -1041,10 +311,8 @@ class BEnewsSpider(scrapy.Spider):
             lang = "Unknown"
 
         
-        # Translate to English
-        title_english = self.safe_translate(title, lang)
-        summary_english = self.safe_translate(summary, lang)
-        content_en = self.safe_translate(content, lang)
+        # Translate to English on the translation threads so other downloads keep going
+        title_english, summary_english, content_en = await self.translate_fields([title, summary, content], lang)
         combined_en = f"{title_english} {content_en}"
         
         # Classify using English text only
@@ -1073,16 +341,31 @@ class BEnewsSpider(scrapy.Spider):
         ])
 
 
-def run_script(file_path):
-    try:
-        logging.info(f"Running script: {file_path}")
-        if "Spider" in open(file_path, encoding="utf-8").read():  # crude way to detect Scrapy spiders
-            subprocess.run(["scrapy", "runspider", file_path], check=True)
-        else:
-            subprocess.run(["python", file_path], check=True)
-        logging.info(f"✅ Completed: {file_path}")
-    except subprocess.CalledProcessError as e:
-        logging.error(f"❌ Failed: {file_path} with error: {e}")
+def run_scripts(file_paths):
+    """Crawl every spider script in one reactor and run the Selenium scripts on one browser pool,
+    both in this process; other scripts run as subprocesses"""
+    # Imported here so that importing this spider does not load the sweep orchestrators
+    from common.browser_sweep import BROWSER_SCRIPTS
+    from common.browser_sweep import run_scripts as run_browser_scripts
+    from common.crawl import SPIDER_SCRIPTS, crawl_scripts
+
+    spider_paths = [path for path in file_paths if os.path.basename(path) in SPIDER_SCRIPTS]
+    browser_paths = [path for path in file_paths if os.path.basename(path) in BROWSER_SCRIPTS]
+    for file_path in file_paths:
+        if file_path in spider_paths or file_path in browser_paths:
+            continue
+        try:
+            logging.info(f"Running script: {file_path}")
+            subprocess.run([sys.executable, file_path], check=True)
+            logging.info(f"✅ Completed: {file_path}")
+        except subprocess.CalledProcessError as e:
+            logging.error(f"❌ Failed: {file_path} with error: {e}")
+    if browser_paths:
+        for path, ok in run_browser_scripts(browser_paths).items():
+            logging.info(f"{'✅ Completed' if ok else '❌ Failed'}: {path}")
+    if spider_paths:
+        for name, reason in crawl_scripts(spider_paths).items():
+            logging.info(f"{'✅' if reason == 'finished' else '❌'} {name}: {reason}")
 
 
 if __name__ == "__main__":
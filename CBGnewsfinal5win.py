@@ -2,16 +2,19 @@ import scrapy
 import logging
 import re
 from langcodes import Language as Lang
-from deep_translator import GoogleTranslator
 from typing import Dict, List
 import os
 from openpyxl import Workbook
-from langdetect import detect, DetectorFactory
-import pandas as pd
-from deep_translator.exceptions import TranslationNotFound, RequestError
+from langdetect import DetectorFactory
 from scrapy.crawler import CrawlerProcess
 from scrapy.utils.project import get_project_settings
 from datetime import datetime
+from common.drug_terms import profile_columns
+from common.term_index import open_term_index
+from common.translation import translate
+from common.language_id import detect_language_code
+from common.keyword_classifier import keyword_classifier
+from common import reference
 
 DetectorFactory.seed = 0
 
@@ -21,92 +24,17 @@ class TranslationClassifier:
     def __init__(self):
 
         # Load known drug names from file
-        tsv_url = "https://raw.githubusercontent.com/MariaKlap/Drug-Name-Database/refs/heads/main/drug.target.interaction.tsv"
-                   
-
-        try:
-            df = pd.read_csv(tsv_url, sep='\t')
-        except UnicodeDecodeError:
-            df = pd.read_csv(tsv_url, sep='\t', encoding='ISO-8859-1')
-        print(f"📊 DRUG_NAME column row count (including duplicates and empty): {len(df['DRUG_NAME'])}")
-
-        # Limit to specific columns only
-        allowed_columns = {'DRUG_NAME', 'GENE', 'SWISSPROT', 'ACTION_TYPE', 'TARGET_CLASS', 'TARGET_NAME'}
-        allowed_columns = [col for col in df.columns if col in allowed_columns]
-
-        terms = set()
-        for col in allowed_columns:
-            col_terms = df[col].dropna().astype(str)
-            col_terms = {t.strip().lower() for t in col_terms if len(t.strip()) > 3}
-            terms.update(col_terms)
+        # ✅ LOAD drug terms as a read-only, memory-mapped index shared with other running scrapers
+        allowed_columns = profile_columns('long_terms')
+        terms = open_term_index('long_terms', boundary='lookaround')
 
         self.drug_terms_set = terms
+        self.drug_matcher = self.drug_terms_set
         print(f"✅ Loaded {len(self.drug_terms_set)} drug terms from TSV columns: {', '.join(allowed_columns)}")
 
-        self.DOCUMENT_TYPES = {
-            'Announcement': ['announcement', 'notification', 'bulletin'],
-            'Expert Report': ['expert report', 'technical report', 'scientific opinion'],
-            'Amendment': ['amendment', 'regulation change', 'regulatory update'],
-            'Law': ['law', 'legislation', 'statute', 'act'],
-            'Directive': ['directive', 'guideline', 'policy'],
-            'Order': ['order', 'decision', 'ruling', 'decree'],
-            'Information Note': ['information note', 'information bulletin', 'notice'],
-            'Q&A': ['questions and answers', 'q&a', 'faq', 'frequently asked'],
-            'Instructions': ['instructions', 'manual', 'guidance', 'procedure'],
-            'Resolution': ['resolution', 'conclusion', 'determination'],
-            'Consultation': ['consultation', 'public hearing', 'stakeholder input'],
-            'Product Info': ['product information', 'package leaflet', 'product update'],
-            'Regulatory Decision': ['regulatory decision', 'approval summary', 'assessment'],
-            'Evaluation': ['evaluation report', 'assessment report', 'review report'],
-            'Recommendation': ['recommendation', 'advice', 'suggestion'],
-            'Checklist': ['checklist', 'verification list', 'review points'],
-            'Approval Tracker': ['approval tracker', 'authorization status', 'timeline'],
-            'CHMP Opinion': ['chmp opinion', 'committee opinion', 'scientific opinion'],
-            'Committee': ['committee', 'working group', 'task force'],
-            'CV': ['curriculum vitae', 'cv', 'resume'],
-            'EPAR': ['epar', 'european public assessment report'],
-            'Letter': ['letter', 'correspondence', 'official communication'],
-            'Meeting': ['meeting', 'conference', 'session'],
-            'Withdrawal': ['withdrawn application', 'cancelled submission'],
-            'Communication': ['communication', 'announcement', 'message'],
-            'Decree': ['decree', 'royal decree', 'official order'],
-            'Form': ['form', 'application form', 'submission form'],
-            'Regulatory History': ['regulatory history', 'dossier history', 'timeline'],
-            'Press Release': ['press release', 'news release', 'media statement'],
-            'Ordinance': ['ordinance', 'local regulation', 'municipal law'],
-            'Advisory Committee': ['advisory committee', 'committee profile'],
-            'Voting': ['voting', 'committee vote', 'decision outcome'],
-            'Petition': ['citizen petition', 'public petition', 'request'],
-            'Federal Register': ['federal register', 'official gazette', 'journal'],
-            'Inspection': ['inspection report', 'audit report', 'site visit'],
-            'SOP': ['sop', 'standard procedure', 'operating protocol'],
-            'BLA Approval': ['bla', 'biologics license application'],
-            'BLA Supplement': ['supplemental bla', 'bla amendment'],
-            'NDA Supplement': ['supplemental nda', 'nda amendment'],
-            '510(k)': ['510(k)', 'premarket notification'],
-            'NDA Approval': ['nda', 'new drug application'],
-            'Other Type': []
-        }
+        self.DOCUMENT_TYPES = reference.DOCUMENT_TYPES
 
-        self.PRODUCT_TYPES = {
-            'Biological': ['biological', 'biologic', 'monoclonal antibody', 'mab', 'recombinant', 'cell therapy',
-                           'gene therapy', 'blood product', 'plasma derived', 'therapeutic protein', 'insulin',
-                           'erythropoietin', 'immunoglobulin', 'stem cell'],
-            'Drug Product': ['drug product', 'finished product', 'formulation', 'dosage form', 'tablet', 'capsule',
-                             'injection', 'solution', 'suspension', 'biopharmaceutical', 'biosimilar', 'cream',
-                             'ointment', 'gel', 'suppository', 'inhalation'],
-            'Drug Substance': ['drug substance', 'active substance', 'api', 'active ingredient', 'bulk drug',
-                               'chemical entity', 'reference standard'],
-            'Vaccine': ['vaccine', 'vaccination', 'immunization', 'antigen', 'adjuvant', 'mmr', 'dtap', 'hpv',
-                        'influenza', 'covid-19', 'sars-cov-2'],
-            'Small Molecule': ['small molecule', 'chemical drug', 'synthetic', 'organic compound', 'nme',
-                               'new molecular entity', 'low molecular weight'],
-            'Medical Device': ['medical device', 'implant', 'stent', 'catheter', 'prosthesis', 'pacemaker',
-                               'defibrillator', 'surgical instrument'],
-            'IVD': ['ivd', 'in vitro diagnostic', 'diagnostic test', 'assay', 'reagent', 'test kit', 'analyzer',
-                    'rapid test'],
-            'Other': []
-        }
+        self.PRODUCT_TYPES = reference.PRODUCT_TYPES_EXTENDED
 
 
     def translate_to_english(self, text: str, source_lang: str) -> str:
@@ -124,28 +52,23 @@ class TranslationClassifier:
             else:
                 lang_code = Lang.get(source_lang).to_alpha2()
                 
-            translated = GoogleTranslator(source=lang_code, target='en').translate(text)
+            translated = translate(text, source=lang_code)
             return translated
         except Exception as e:
             logging.warning(f"Translation failed: {str(e)}")
             return "[Translation Not Available]"
 
     def classify_document(self, text: str) -> Dict[str, str]:
-        text = text.lower()
-        for doc_type, keywords in self.DOCUMENT_TYPES.items():
-            if any(re.search(rf'\b{re.escape(kw)}\b', text) for kw in keywords):
-                return {'document_type': doc_type}
-        return {'document_type': 'Other Type'}
+        return {'document_type': keyword_classifier('word', document=self.DOCUMENT_TYPES, product=self.PRODUCT_TYPES).classify(text, 'document', default='Other Type')}
 
     def classify_product(self, text: str) -> Dict[str, str]:
-        text_lower = text.lower()
         drug_names = self.extract_drug_names(text)
-        for product_type, keywords in self.PRODUCT_TYPES.items():
-            if any(re.search(rf'\b{re.escape(kw)}\b', text_lower) for kw in keywords):
-                return {
-                    'product_type': product_type,
-                    'drug_names': ", ".join(drug_names) if drug_names else "None"
-                }
+        product_type, _ = keyword_classifier('word', document=self.DOCUMENT_TYPES, product=self.PRODUCT_TYPES).first_match(text, 'product')
+        if product_type:
+            return {
+                'product_type': product_type,
+                'drug_names': ", ".join(drug_names) if drug_names else "None"
+            }
         return {
             'product_type': 'Drug Product' if drug_names else 'Other',
             'drug_names': ", ".join(drug_names) if drug_names else "None"
@@ -155,13 +78,7 @@ class TranslationClassifier:
         if not text.strip():
             return []
 
-        matched = []
-        for term in self.drug_terms_set:
-            # Escape regex special chars and match as whole word/phrase
-            pattern = r'(?<!\w)' + re.escape(term.lower()) + r'(?!\w)'
-            if re.search(pattern, text, flags=re.IGNORECASE):
-                matched.append(term)
-        return matched
+        return self.drug_matcher.find_all(text)
 
 
 class CBGfinal5Spider(scrapy.Spider):
@@ -203,7 +120,7 @@ class CBGfinal5Spider(scrapy.Spider):
             return "Unknown"
         
         try:
-            lang_code = detect(text)
+            lang_code = detect_language_code(text, site='cbg-meb.nl')
             # Special handling for Dutch
             if lang_code == 'nl':
                 return "Dutch"
@@ -1,8 +1,5 @@
-from selenium import webdriver
 from deep_translator import GoogleTranslator
 from selenium.webdriver.common.by import By
-from selenium.webdriver.edge.service import Service
-from selenium.webdriver.edge.options import Options
 from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException, TimeoutException
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -12,9 +9,21 @@ from collections import Counter
 from datetime import datetime
 from urllib.parse import urljoin
 import os
-import time
 from typing import List, Dict, Optional
 import logging
+from common.drug_terms import profile_columns
+from common.term_index import open_term_index
+from common.gazetteer import country_gazetteer
+from common.translation import translate, translate_batch
+from common.keyword_classifier import keyword_classifier
+from common import reference
+from common.browser import driver_pool
+from common.readiness import wait_hidden, wait_ready
+from common.dom import element_text, snapshot, text_of, url_of
+from common.fetch import fetch_pages
+
+# The shared document types without the short keywords that match inside German words
+DOCUMENT_TYPES = reference.without_keywords(reference.DOCUMENT_TYPES, 'act', 'cv', 'nda')
 
 
 class DEnews:
@@ -55,640 +64,48 @@ class DEnews:
         
         self._init_country_mappings()
 
-        # ✅ LOAD drug terms from .tsv file
-        tsv_path = 'https://raw.githubusercontent.com/MariaKlap/Drug-Name-Database/refs/heads/main/drug.target.interaction.tsv'  
-        
-
-        try:
-            df = pd.read_csv(tsv_path, sep='\t')
-        except UnicodeDecodeError:
-            df = pd.read_csv(tsv_path, sep='\t', encoding='ISO-8859-1')
-        print(f"📊 DRUG_NAME column row count (including duplicates and empty): {len(df['DRUG_NAME'])}")
-
-        # Limit to specific columns only
-        allowed_columns = {'DRUG_NAME', 'SWISSPROT', 'ACTION_TYPE', 'TARGET_CLASS', 'TARGET_NAME'}
-        allowed_columns = [col for col in df.columns if col in allowed_columns]
-
-        terms = set()
-        for col in allowed_columns:
-            col_terms = df[col].dropna().astype(str)
-            col_terms = {t.strip().lower() for t in col_terms if len(t.strip()) > 3}
-            terms.update(col_terms)
+        # ✅ LOAD drug terms as a read-only, memory-mapped index shared with other running scrapers
+        allowed_columns = profile_columns('long_terms_no_gene')
+        terms = open_term_index('long_terms_no_gene', boundary='word')
 
         self.drug_terms_set = terms
-        self.known_drug_names = list(self.drug_terms_set)
+        self.drug_matcher = self.drug_terms_set
 
         print(f"✅ Loaded {len(self.drug_terms_set)} drug terms from TSV columns: {', '.join(allowed_columns)}")
 
-        # Selenium settings
-        options = Options()
-        prefs = {
-            "profile.default_content_settings.popups": 0,
-            "profile.content_settings.exceptions.automatic_downloads.*.setting": 1,
-            "profile.default_content_setting_values.automatic_downloads": 1,
-            "profile.default_content_setting_values.popups": 0
-        }
-        options.add_experimental_option("prefs", prefs)
-        edge_service = Service()  # Initialize Edge service
-        self.driver = webdriver.Chrome()
+        # Warm browser from the shared pool (common.browser), returned when the scraper is done
+        self.driver = driver_pool().acquire(site='bfarm.de')
 
     def cleanup(self):
         """Clean up resources"""
         try:
-            self.driver.quit()
+            driver_pool().release(self.driver)
         except Exception as e:
             print(f"⚠️ Error during cleanup: {e}")
     
-    def _init_language_resources(self):
-        """Initialize NLP resources on demand"""
-
-        # Initialize country/region mappings
-        self._init_country_mappings()
-
     def _init_country_mappings(self):
         """Initialize country and region mappings"""   
         # Language code to full name mapping
-        self.LANGUAGE_NAMES = {
-        'af': 'Afrikaans',
-        'ar': 'Arabic',
-        'bg': 'Bulgarian',
-        'bn': 'Bengali',
-        'ca': 'Catalan',
-        'cs': 'Czech',
-        'cy': 'Welsh',
-        'da': 'Danish',
-        'de': 'German',
-        'el': 'Greek',
-        'en': 'English',
-        'es': 'Spanish',
-        'et': 'Estonian',
-        'fa': 'Persian',
-        'fi': 'Finnish',
-        'fr': 'French',
-        'gu': 'Gujarati',
-        'he': 'Hebrew',
-        'hi': 'Hindi',
-        'hr': 'Croatian',
-        'hu': 'Hungarian',
-        'id': 'Indonesian',
-        'it': 'Italian',
-        'ja': 'Japanese',
-        'kn': 'Kannada',
-        'ko': 'Korean',
-        'lt': 'Lithuanian',
-        'lv': 'Latvian',
-        'mk': 'Macedonian',
-        'ml': 'Malayalam',
-        'mr': 'Marathi',
-        'ne': 'Nepali',
-        'nl': 'Dutch',
-        'no': 'Norwegian',
-        'pa': 'Punjabi',
-        'pl': 'Polish',
-        'pt': 'Portuguese',
-        'ro': 'Romanian',
-        'ru': 'Russian',
-        'sk': 'Slovak',
-        'sl': 'Slovenian',
-        'so': 'Somali',
-        'sq': 'Albanian',
-        'sv': 'Swedish',
-        'sw': 'Swahili',
-        'ta': 'Tamil',
-        'te': 'Telugu',
-        'th': 'Thai',
-        'tl': 'Tagalog',
-        'tr': 'Turkish',
-        'uk': 'Ukrainian',
-        'ur': 'Urdu',
-        'vi': 'Vietnamese',
-        'zh-cn': 'Chinese (Simplified)',
-        'zh-tw': 'Chinese (Traditional)'
-        }        
+        self.LANGUAGE_NAMES = reference.LANGUAGE_NAMES
         
         # Document type classification
-        self.DOCUMENT_TYPES = {
-        'Announcement': ['announcement', 'notification', 'bulletin'],
-        'Expert Report': ['expert report', 'technical report', 'scientific opinion'],
-        'Amendment': ['amendment', 'regulation change', 'regulatory update'],
-        'Law': ['law', 'legislation', 'statute'],
-        'Directive': ['directive', 'guideline', 'policy'],
-        'Order': ['order', 'decision', 'ruling', 'decree'],
-        'Information Note': ['information note', 'information bulletin', 'notice'],
-        'Q&A': ['questions and answers', 'q&a', 'faq', 'frequently asked'],
-        'Instructions': ['instructions', 'manual', 'guidance', 'procedure'],
-        'Resolution': ['resolution', 'conclusion', 'determination'],
-        'Consultation': ['consultation', 'public hearing', 'stakeholder input'],
-        'Product Info': ['product information', 'package leaflet', 'product update'],
-        'Regulatory Decision': ['regulatory decision', 'approval summary', 'assessment'],
-        'Evaluation': ['evaluation report', 'assessment report', 'review report'],
-        'Recommendation': ['recommendation', 'advice', 'suggestion'],
-        'Checklist': ['checklist', 'verification list', 'review points'],
-        'Approval Tracker': ['approval tracker', 'authorization status', 'timeline'],
-        'CHMP Opinion': ['chmp opinion', 'committee opinion', 'scientific opinion'],
-        'Committee': ['committee', 'working group', 'task force'],
-        'CV': ['curriculum vitae', 'resume'],
-        'EPAR': ['epar', 'european public assessment report'],
-        'Letter': ['letter', 'correspondence', 'official communication'],
-        'Meeting': ['meeting', 'conference', 'session'],
-        'Withdrawal': ['withdrawn application', 'cancelled submission'],
-        'Communication': ['communication', 'announcement', 'message'],
-        'Decree': ['decree', 'royal decree', 'official order'],
-        'Form': ['form', 'application form', 'submission form'],
-        'Regulatory History': ['regulatory history', 'dossier history', 'timeline'],
-        'Press Release': ['press release', 'news release', 'media statement'],
-        'Ordinance': ['ordinance', 'local regulation', 'municipal law'],
-        'Advisory Committee': ['advisory committee', 'committee profile'],
-        'Voting': ['voting', 'committee vote', 'decision outcome'],
-        'Petition': ['citizen petition', 'public petition', 'request'],
-        'Federal Register': ['federal register', 'official gazette', 'journal'],
-        'Inspection': ['inspection report', 'audit report', 'site visit'],
-        'SOP': ['sop', 'standard procedure', 'operating protocol'],
-        'BLA Approval': ['bla', 'biologics license application'],
-        'BLA Supplement': ['supplemental bla', 'bla amendment'],
-        'NDA Supplement': ['supplemental nda', 'nda amendment'],
-        '510(k)': ['510(k)', 'premarket notification'],
-        'NDA Approval': ['new drug application'],
-        'Other Type': []
-    }
+        self.DOCUMENT_TYPES = DOCUMENT_TYPES
         
         # Product type classification
-        self.PRODUCT_TYPES = {
-        'Biological': [
-            'biological', 'biologic', 'monoclonal antibody', 'mab', 'recombinant',
-            'cell therapy', 'gene therapy', 'blood product', 'plasma derived'
-        ],
-        'Drug Product': [
-            'drug product', 'finished product', 'formulation', 'dosage form',
-            'tablet', 'capsule', 'injection', 'solution'
-        ],
-        'Drug Substance': [
-            'drug substance', 'active substance', 'api', 'active ingredient',
-            'bulk drug', 'chemical entity', 'reference standard'
-            ],
-        'Vaccine': [
-            'vaccine', 'vaccination', 'immunization', 'antigen', 'adjuvant',
-            'mmr', 'dtap', 'hpv', 'influenza', 'covid-19', 'sars-cov-2'
-            ],
-        'Small Molecule': [
-            'small molecule', 'chemical drug', 'synthetic', 'organic compound',
-            'nme', 'new molecular entity', 'low molecular weight'
-            ],
-        'Medical Device': [
-            'medical device', 'implant', 'stent', 'catheter', 'prosthesis',
-            'pacemaker', 'defibrillator', 'surgical instrument'
-            ],
-        'IVD': [
-            'ivd', 'in vitro diagnostic', 'diagnostic test', 'assay',
-            'reagent', 'test kit', 'analyzer', 'rapid test'
-            ],
-        'Other': []
-    }
+        self.PRODUCT_TYPES = reference.PRODUCT_TYPES
         
         # Country patterns for detection in text
-        self.COUNTRY_PATTERNS = {
-        # Europe (Complete list)
-        'Albania': ['albania', 'shqipëria', 'tirana'],
-        'Andorra': ['andorra', 'andorre'],
-        'Austria': ['austria', 'österreich', 'vienna'],
-        'Belarus': ['belarus', 'belarús', 'minsk'],
-        'Belgium': ['belgium', 'belgique', 'belgie', 'brussels'],
-        'Bosnia and Herzegovina': ['bosnia', 'herzegovina', 'sarajevo'],
-        'Bulgaria': ['bulgaria', 'българия', 'sofia'],
-        'Croatia': ['croatia', 'hrvatska', 'zagreb'],
-        'Cyprus': ['cyprus', 'κύπρος', 'lefkosia'],
-        'Czech Republic': ['czech republic', 'česko', 'prague'],
-        'Denmark': ['denmark', 'danmark', 'copenhagen'],
-        'Estonia': ['estonia', 'eesti', 'tallinn'],
-        'Finland': ['finland', 'suomi', 'helsinki'],
-        'France': ['france', 'french', 'paris'],
-        'Germany': ['germany', 'deutschland', 'berlin'],
-        'Greece': ['greece', 'ελλάδα', 'athens'],
-        'Hungary': ['hungary', 'magyarország', 'budapest'],
-        'Iceland': ['iceland', 'ísland', 'reykjavik'],
-        'Ireland': ['ireland', 'éire', 'dublin'],
-        'Italy': ['italy', 'italia', 'rome'],
-        'Latvia': ['latvia', 'latvija', 'riga'],
-        'Liechtenstein': ['liechtenstein', 'vaduz'],
-        'Lithuania': ['lithuania', 'lietuva', 'vilnius'],
-        'Luxembourg': ['luxembourg', 'luxemburg', 'luxembourg city'],
-        'Malta': ['malta', 'valletta'],
-        'Moldova': ['moldova', 'chișinău'],
-        'Monaco': ['monaco', 'monaco-ville'],
-        'Montenegro': ['montenegro', 'crna gora', 'podgorica'],
-        'Netherlands': ['netherlands', 'nederland', 'holland', 'amsterdam'],
-        'North Macedonia': ['north macedonia', 'macedonia', 'skopje'],
-        'Norway': ['norway', 'norge', 'oslo'],
-        'Poland': ['poland', 'polska', 'warsaw'],
-        'Portugal': ['portugal', 'lisbon'],
-        'Romania': ['romania', 'românia', 'bucharest'],
-        'Russia': ['russia', 'россия', 'moscow'],
-        'San Marino': ['san marino'],
-        'Serbia': ['serbia', 'srbija', 'belgrade'],
-        'Slovakia': ['slovakia', 'slovensko', 'bratislava'],
-        'Slovenia': ['slovenia', 'slovenija', 'ljubljana'],
-        'Spain': ['spain', 'españa', 'madrid'],
-        'Sweden': ['sweden', 'sverige', 'stockholm'],
-        'Switzerland': ['switzerland', 'suisse', 'schweiz', 'bern'],
-        'Ukraine': ['ukraine', 'україна', 'kyiv'],
-        'United Kingdom': ['uk', 'united kingdom', 'britain', 'london'],
-        'Vatican City': ['vatican', 'holy see'],
-
-        # Americas (Complete list)
-        'Antigua and Barbuda': ['antigua', 'barbuda', "antigua and barbuda", 'saint john'],
-        'Argentina': ['argentina', 'buenos aires', 'argentine republic'],
-        'Bahamas': ['bahamas', 'nassau', 'commonwealth of the bahamas'],
-        'Barbados': ['barbados', 'bridgetown'],
-        'Belize': ['belize', 'belmopan'],
-        'Bolivia': ['bolivia', 'sucre', 'la paz', 'plurinational state'],
-        'Brazil': ['brazil', 'brasil', 'brasília', 'rio de janeiro', 'federative republic'],
-        'Canada': ['canada', 'ottawa', 'toronto', 'ontario', 'quebec'],
-        'Chile': ['chile', 'santiago', 'republic of chile'],
-        'Colombia': ['colombia', 'bogotá', 'bogota', 'republic of colombia'],
-        'Costa Rica': ['costa rica', 'san josé', 'san jose'],
-        'Cuba': ['cuba', 'havana', 'republic of cuba'],
-        'Dominica': ['dominica', 'roseau', 'commonwealth of dominica'],
-        'Dominican Republic': ['dominican republic', 'santo domingo'],
-        'Ecuador': ['ecuador', 'quito', 'republic of ecuador'],
-        'El Salvador': ['el salvador', 'san salvador', 'republic of el salvador'],
-        'Grenada': ['grenada', "saint george"],
-        'Guatemala': ['guatemala', 'guatemala city', 'republic of guatemala'],
-        'Guyana': ['guyana', 'georgetown', 'cooperative republic'],
-        'Haiti': ['haiti', 'port-au-prince', 'republic of haiti'],
-        'Honduras': ['honduras', 'tegucigalpa', 'republic of honduras'],
-        'Jamaica': ['jamaica', 'kingston'],
-        'Mexico': ['mexico', 'méxico', 'mexico city', 'cdmx', 'estados unidos mexicanos'],
-        'Nicaragua': ['nicaragua', 'managua', 'republic of nicaragua'],
-        'Panama': ['panama', 'panama city', 'republic of panama'],
-        'Paraguay': ['paraguay', 'asunción', 'asunción', 'republic of paraguay'],
-        'Peru': ['peru', 'lima', 'republic of peru'],
-        'Saint Kitts and Nevis': ['saint kitts', 'nevis', 'basseterre'],
-        'Saint Lucia': ['saint lucia', 'castries'],
-        'Saint Vincent and the Grenadines': ['saint vincent', 'grenadines', 'kingstown'],
-        'Suriname': ['suriname', 'paramaribo', 'republic of suriname'],
-        'Trinidad and Tobago': ['trinidad', 'tobago', 'port of spain'],
-        'United States': ['usa', 'u\\.s\\.', 'united states', 'america', 'washington dc', 'new york', 'california'],
-        'Uruguay': ['uruguay', 'montevideo', 'oriental republic'],
-        'Venezuela': ['venezuela', 'caracas', 'bolivarian republic'],
-
-        # Asia (Complete list)
-        'Afghanistan': ['afghanistan', 'kabul', 'islamic emirate'],
-        'Armenia': ['armenia', 'yerevan', 'republic of armenia'],
-        'Azerbaijan': ['azerbaijan', 'baku', 'republic of azerbaijan'],
-        'Bahrain': ['bahrain', 'manama', 'kingdom of bahrain'],
-        'Bangladesh': ['bangladesh', 'dhaka', "people's republic"],
-        'Bhutan': ['bhutan', 'thimphu', 'kingdom of bhutan'],
-        'Brunei': ['brunei', 'bandar seri begawan', 'darussalam'],
-        'Cambodia': ['cambodia', 'phnom penh', 'kingdom of cambodia'],
-        'China': ['china', 'zhongguo', 'beijing', 'shanghai', "people's republic"],
-        'Cyprus': ['cyprus', 'nicosia', 'republic of cyprus'],
-        'Georgia': ['georgia', 'tbilisi'],
-        'India': ['india', 'bharat', 'new delhi', 'mumbai', 'republic of india'],
-        'Indonesia': ['indonesia', 'jakarta', 'republic of indonesia'],
-        'Iran': ['iran', 'tehran', 'islamic republic'],
-        'Iraq': ['iraq', 'baghdad', 'republic of iraq'],
-        'Israel': ['israel', 'jerusalem', 'state of israel'],
-        'Japan': ['japan', 'nippon', 'tokyo'],
-        'Jordan': ['jordan', 'amman', 'hashemite kingdom'],
-        'Kazakhstan': ['kazakhstan', 'nur-sultan', 'astana', 'republic of kazakhstan'],
-        'Kuwait': ['kuwait', 'kuwait city', 'state of kuwait'],
-        'Kyrgyzstan': ['kyrgyzstan', 'bishkek', 'kyrgyz republic'],
-        'Laos': ['laos', 'vientiane', "lao people's republic"],
-        'Lebanon': ['lebanon', 'beirut', 'lebanese republic'],
-        'Malaysia': ['malaysia', 'kuala lumpur', 'putrajaya'],
-        'Maldives': ['maldives', 'malé', 'republic of maldives'],
-        'Mongolia': ['mongolia', 'ulaanbaatar'],
-        'Myanmar': ['myanmar', 'burma', 'naypyidaw', 'republic of the union'],
-        'Nepal': ['nepal', 'kathmandu', 'federal democratic republic'],
-        'North Korea': ['north korea', 'dprk', 'pyongyang', "democratic people's republic"],
-        'Oman': ['oman', 'muscat', 'sultanate of oman'],
-        'Pakistan': ['pakistan', 'islamabad', 'islamic republic'],
-        'Palestine': ['palestine', 'ramallah', 'state of palestine'],
-        'Philippines': ['philippines', 'manila', 'republic of the philippines'],
-        'Qatar': ['qatar', 'doha', 'state of qatar'],
-        'Russia': ['russia', 'russian federation', 'moscow'],
-        'Saudi Arabia': ['saudi arabia', 'riyadh', 'kingdom of saudi arabia'],
-        'Singapore': ['singapore', 'republic of singapore'],
-        'South Korea': ['south korea', 'korea republic', 'seoul', 'republic of korea'],
-        'Sri Lanka': ['sri lanka', 'colombo', 'sri jayawardenepura kotte'],
-        'Syria': ['syria', 'damascus', 'syrian arab republic'],
-        'Taiwan': ['taiwan', 'taipei', 'republic of china'],
-        'Tajikistan': ['tajikistan', 'dushanbe', 'republic of tajikistan'],
-        'Thailand': ['thailand', 'bangkok', 'kingdom of thailand'],
-        'Timor-Leste': ['timor-leste', 'east timor', 'dili', 'democratic republic'],
-        'Turkey': ['turkey', 'türkiye', 'ankara', 'republic of turkey'],
-        'Turkmenistan': ['turkmenistan', 'ashgabat'],
-        'United Arab Emirates': ['uae', 'united arab emirates', 'dubai', 'abu dhabi'],
-        'Uzbekistan': ['uzbekistan', 'tashkent', 'republic of uzbekistan'],
-        'Vietnam': ['vietnam', 'hanoi', 'socialist republic'],
-        'Yemen': ['yemen', "sana'a", 'republic of yemen'],
-
-        # Africa (Complete list)
-        'Algeria': ['algeria', 'algiers', "people's democratic republic"],
-        'Angola': ['angola', 'luanda', 'republic of angola'],
-        'Benin': ['benin', 'porto-novo', 'republic of benin'],
-        'Botswana': ['botswana', 'gaborone', 'republic of botswana'],
-        'Burkina Faso': ['burkina faso', 'ouagadougou'],
-        'Burundi': ['burundi', 'gitega', 'republic of burundi'],
-        'Cameroon': ['cameroon', 'yaoundé', 'republic of cameroon'],
-        'Cape Verde': ['cape verde', 'cabo verde', 'praia', 'republic of cape verde'],
-        'Central African Republic': ['central african republic', 'bangui'],
-        'Chad': ['chad', "n'djamena", 'republic of chad'],
-        'Comoros': ['comoros', 'moroni', 'union of the comoros'],
-        'Congo (Brazzaville)': ['republic of the congo', 'congo-brazzaville', 'brazzaville'],
-        'Congo (Kinshasa)': ['democratic republic of the congo', 'drc', 'kinshasa'],
-        "Côte d'Ivoire": ["côte d'ivoire", 'ivory coast', 'yamoussoukro'],
-        'Djibouti': ['djibouti', 'republic of djibouti'],
-        'Egypt': ['egypt', 'cairo', 'arab republic of egypt'],
-        'Equatorial Guinea': ['equatorial guinea', 'malabo', 'republic of equatorial guinea'],
-        'Eritrea': ['eritrea', 'asmara', 'state of eritrea'],
-        'Eswatini': ['eswatini', 'swaziland', 'mbabane', 'kingdom of eswatini'],
-        'Ethiopia': ['ethiopia', 'addis ababa', 'federal democratic republic'],
-        'Gabon': ['gabon', 'libreville', 'gabonese republic'],
-        'Gambia': ['gambia', 'banjul', 'republic of the gambia'],
-        'Ghana': ['ghana', 'accra', 'republic of ghana'],
-        'Guinea': ['guinea', 'conakry', 'republic of guinea'],
-        'Guinea-Bissau': ['guinea-bissau', 'bissau', 'republic of guinea-bissau'],
-        'Kenya': ['kenya', 'nairobi', 'republic of kenya'],
-        'Lesotho': ['lesotho', 'maseru', 'kingdom of lesotho'],
-        'Liberia': ['liberia', 'monrovia', 'republic of liberia'],
-        'Libya': ['libya', 'tripoli', 'state of libya'],
-        'Madagascar': ['madagascar', 'antananarivo', 'republic of madagascar'],
-        'Malawi': ['malawi', 'lilongwe', 'republic of malawi'],
-        'Mali': ['mali', 'bamako', 'republic of mali'],
-        'Mauritania': ['mauritania', 'nouakchott', 'islamic republic'],
-        'Mauritius': ['mauritius', 'port louis', 'republic of mauritius'],
-        'Morocco': ['morocco', 'rabat', 'kingdom of morocco'],
-        'Mozambique': ['mozambique', 'maputo', 'republic of mozambique'],
-        'Namibia': ['namibia', 'windhoek', 'republic of namibia'],
-        'Niger': ['niger', 'niamey', 'republic of niger'],
-        'Nigeria': ['nigeria', 'abuja', 'federal republic of nigeria'],
-        'Rwanda': ['rwanda', 'kigali', 'republic of rwanda'],
-        'Sao Tome and Principe': ['são tomé and príncipe', 'sao tome', 'são tomé'],
-        'Senegal': ['senegal', 'dakar', 'republic of senegal'],
-        'Seychelles': ['seychelles', 'victoria', 'republic of seychelles'],
-        'Sierra Leone': ['sierra leone', 'freetown', 'republic of sierra leone'],
-        'Somalia': ['somalia', 'mogadishu', 'federal republic of somalia'],
-        'South Africa': ['south africa', 'pretoria', 'cape town', 'republic of south africa'],
-        'South Sudan': ['south sudan', 'juba', 'republic of south sudan'],
-        'Sudan': ['sudan', 'khartoum', 'republic of the sudan'],
-        'Tanzania': ['tanzania', 'dodoma', 'united republic of tanzania'],
-        'Togo': ['togo', 'lomé', 'togolese republic'],
-        'Tunisia': ['tunisia', 'tunis', 'republic of tunisia'],
-        'Uganda': ['uganda', 'kampala', 'republic of uganda'],
-        'Zambia': ['zambia', 'lusaka', 'republic of zambia'],
-        'Zimbabwe': ['zimbabwe', 'harare', 'republic of zimbabwe'],
-
-        # International/Regional
-        'European Union': ['eu', 'european union', 'e\\.u\\.', 'brussels eu'],
-        'African Union': ['african union', 'au', 'addis ababa'],
-        'ASEAN': ['asean', 'southeast asia', 'jakarta'],
-        'Global': ['who', 'world health organization', 'united nations', 'international'],
-    }
+        self.COUNTRY_PATTERNS = reference.COUNTRY_PATTERNS
         # Mapping of regions to countries
-        self.REGION_MAPPING = {
-        # Europe
-        'Albania': 'Southern Europe',
-        'Andorra': 'Southern Europe',
-        'Austria': 'Central Europe',
-        'Belarus': 'Eastern Europe',
-        'Belgium': 'Western Europe',
-        'Bosnia and Herzegovina': 'Southern Europe',
-        'Bulgaria': 'Eastern Europe',
-        'Croatia': 'Southern Europe',
-        'Cyprus': 'Southern Europe',
-        'Czech Republic': 'Central Europe',
-        'Denmark': 'Northern Europe',
-        'Estonia': 'Northern Europe',
-        'Finland': 'Northern Europe',
-        'France': 'Western Europe',
-        'Germany': 'Central Europe',
-        'Greece': 'Southern Europe',
-        'Hungary': 'Central Europe',
-        'Iceland': 'Northern Europe',
-        'Ireland': 'Northern Europe',
-        'Italy': 'Southern Europe',
-        'Latvia': 'Northern Europe',
-        'Liechtenstein': 'Central Europe',
-        'Lithuania': 'Northern Europe',
-        'Luxembourg': 'Western Europe',
-        'Malta': 'Southern Europe',
-        'Moldova': 'Eastern Europe',
-        'Monaco': 'Western Europe',
-        'Montenegro': 'Southern Europe',
-        'Netherlands': 'Western Europe',
-        'North Macedonia': 'Southern Europe',
-        'Norway': 'Northern Europe',
-        'Poland': 'Central Europe',
-        'Portugal': 'Southern Europe',
-        'Romania': 'Eastern Europe',
-        'Russia': 'Eastern Europe',  # Transcontinental
-        'San Marino': 'Southern Europe',
-        'Serbia': 'Southern Europe',
-        'Slovakia': 'Central Europe',
-        'Slovenia': 'Southern Europe',
-        'Spain': 'Southern Europe',
-        'Sweden': 'Northern Europe',
-        'Switzerland': 'Central Europe',
-        'Ukraine': 'Eastern Europe',
-        'United Kingdom': 'Northern Europe',
-        'Vatican City': 'Southern Europe',
-
-        # Americas
-        # North America
-        'Canada': 'North America',
-        'United States': 'North America',
-        'Mexico': 'North America',
-        
-        # Central America
-        'Belize': 'Central America',
-        'Costa Rica': 'Central America',
-        'El Salvador': 'Central America',
-        'Guatemala': 'Central America',
-        'Honduras': 'Central America',
-        'Nicaragua': 'Central America',
-        'Panama': 'Central America',
-        
-        # Caribbean
-        'Antigua and Barbuda': 'Caribbean',
-        'Bahamas': 'Caribbean',
-        'Barbados': 'Caribbean',
-        'Cuba': 'Caribbean',
-        'Dominica': 'Caribbean',
-        'Dominican Republic': 'Caribbean',
-        'Grenada': 'Caribbean',
-        'Haiti': 'Caribbean',
-        'Jamaica': 'Caribbean',
-        'Saint Kitts and Nevis': 'Caribbean',
-        'Saint Lucia': 'Caribbean',
-        'Saint Vincent and the Grenadines': 'Caribbean',
-        'Trinidad and Tobago': 'Caribbean',
-        
-        # South America
-        'Argentina': 'South America',
-        'Bolivia': 'South America',
-        'Brazil': 'South America',
-        'Chile': 'South America',
-        'Colombia': 'South America',
-        'Ecuador': 'South America',
-        'Guyana': 'South America',
-        'Paraguay': 'South America',
-        'Peru': 'South America',
-        'Suriname': 'South America',
-        'Uruguay': 'South America',
-        'Venezuela': 'South America',
-
-        # Asia
-        # Central Asia
-        'Kazakhstan': 'Central Asia',
-        'Kyrgyzstan': 'Central Asia',
-        'Tajikistan': 'Central Asia',
-        'Turkmenistan': 'Central Asia',
-        'Uzbekistan': 'Central Asia',
-        
-        # East Asia
-        'China': 'East Asia',
-        'Japan': 'East Asia',
-        'Mongolia': 'East Asia',
-        'North Korea': 'East Asia',
-        'South Korea': 'East Asia',
-        'Taiwan': 'East Asia',
-        
-        # South Asia
-        'Afghanistan': 'South Asia',
-        'Bangladesh': 'South Asia',
-        'Bhutan': 'South Asia',
-        'India': 'South Asia',
-        'Maldives': 'South Asia',
-        'Nepal': 'South Asia',
-        'Pakistan': 'South Asia',
-        'Sri Lanka': 'South Asia',
-        
-        # Southeast Asia
-        'Brunei': 'Southeast Asia',
-        'Cambodia': 'Southeast Asia',
-        'Indonesia': 'Southeast Asia',
-        'Laos': 'Southeast Asia',
-        'Malaysia': 'Southeast Asia',
-        'Myanmar': 'Southeast Asia',
-        'Philippines': 'Southeast Asia',
-        'Singapore': 'Southeast Asia',
-        'Thailand': 'Southeast Asia',
-        'Timor-Leste': 'Southeast Asia',
-        'Vietnam': 'Southeast Asia',
-        
-        # Middle East (West Asia)
-        'Armenia': 'Middle East',
-        'Azerbaijan': 'Middle East',
-        'Bahrain': 'Middle East',
-        'Cyprus': 'Middle East',
-        'Georgia': 'Middle East',
-        'Iran': 'Middle East',
-        'Iraq': 'Middle East',
-        'Israel': 'Middle East',
-        'Jordan': 'Middle East',
-        'Kuwait': 'Middle East',
-        'Lebanon': 'Middle East',
-        'Oman': 'Middle East',
-        'Palestine': 'Middle East',
-        'Qatar': 'Middle East',
-        'Saudi Arabia': 'Middle East',
-        'Syria': 'Middle East',
-        'Turkey': 'Middle East',
-        'United Arab Emirates': 'Middle East',
-        'Yemen': 'Middle East',
-
-        # ====== AFRICA ====== #
-        # Northern Africa
-        'Algeria': 'Northern Africa',
-        'Egypt': 'Northern Africa',
-        'Libya': 'Northern Africa',
-        'Morocco': 'Northern Africa',
-        'Sudan': 'Northern Africa',
-        'Tunisia': 'Northern Africa',
-        
-        # Sub-Saharan Africa
-        # Western Africa
-        'Benin': 'Western Africa',
-        'Burkina Faso': 'Western Africa',
-        'Cape Verde': 'Western Africa',
-        "Côte d'Ivoire": 'Western Africa',
-        'Gambia': 'Western Africa',
-        'Ghana': 'Western Africa',
-        'Guinea': 'Western Africa',
-        'Guinea-Bissau': 'Western Africa',
-        'Liberia': 'Western Africa',
-        'Mali': 'Western Africa',
-        'Mauritania': 'Western Africa',
-        'Niger': 'Western Africa',
-        'Nigeria': 'Western Africa',
-        'Senegal': 'Western Africa',
-        'Sierra Leone': 'Western Africa',
-        'Togo': 'Western Africa',
-        
-        # Central Africa
-        'Angola': 'Central Africa',
-        'Cameroon': 'Central Africa',
-        'Central African Republic': 'Central Africa',
-        'Chad': 'Central Africa',
-        'Congo (Brazzaville)': 'Central Africa',
-        'Congo (Kinshasa)': 'Central Africa',
-        'Equatorial Guinea': 'Central Africa',
-        'Gabon': 'Central Africa',
-        'Sao Tome and Principe': 'Central Africa',
-        
-        # Eastern Africa
-        'Burundi': 'Eastern Africa',
-        'Comoros': 'Eastern Africa',
-        'Djibouti': 'Eastern Africa',
-        'Eritrea': 'Eastern Africa',
-        'Ethiopia': 'Eastern Africa',
-        'Kenya': 'Eastern Africa',
-        'Madagascar': 'Eastern Africa',
-        'Malawi': 'Eastern Africa',
-        'Mauritius': 'Eastern Africa',
-        'Mozambique': 'Eastern Africa',
-        'Rwanda': 'Eastern Africa',
-        'Seychelles': 'Eastern Africa',
-        'Somalia': 'Eastern Africa',
-        'South Sudan': 'Eastern Africa',
-        'Tanzania': 'Eastern Africa',
-        'Uganda': 'Eastern Africa',
-        'Zambia': 'Eastern Africa',
-        'Zimbabwe': 'Eastern Africa',
-        
-        # Southern Africa
-        'Botswana': 'Southern Africa',
-        'Eswatini': 'Southern Africa',
-        'Lesotho': 'Southern Africa',
-        'Namibia': 'Southern Africa',
-        'South Africa': 'Southern Africa',
-
-        # Oceania
-        'Australia': 'Australia and New Zealand',
-        'New Zealand': 'Australia and New Zealand',
-        'Fiji': 'Pacific Islands',
-        'Papua New Guinea': 'Pacific Islands',
-        'Solomon Islands': 'Pacific Islands',
-        'Vanuatu': 'Pacific Islands',
-
-        # Special Regions
-        'European Union': 'European Union',
-        'African Union': 'African Union',
-        'ASEAN': 'ASEAN',
-        'Global': 'Global'
-    }
+        self.REGION_MAPPING = reference.REGION_MAPPING
 
     def extract_drug_names(self, text: str, title: str = None) -> List[str]:
         """Find known drug names in the article text using exact match"""
         process_text = f"{title} {text}" if title else text
         text_lower = process_text.lower()
 
-        found = []
-        for drug in self.known_drug_names:
-            if re.search(r'\b' + re.escape(drug) + r'\b', text_lower):
-                found.append(drug)
-        return sorted(set(found), key=len, reverse=True)
+        found = self.drug_matcher.find_all(text_lower)
+        return sorted(found, key=len, reverse=True)
 
     
     def run(self):
@@ -712,7 +129,7 @@ class DEnews:
             try:
                 self.logger.info(f"Scraping page {page_num}: {next_page}")
                 self.driver.get(next_page)
-                time.sleep(0.5)
+                wait_ready(self.driver, 'bfarm.de', 'listing')
 
                 try:
                     WebDriverWait(self.driver, 10).until(
@@ -722,41 +139,62 @@ class DEnews:
                 except Exception as e:
                     self.logger.warning(f"Consent button not clickable: {e}")
 
-                rows = self.driver.find_elements(By.XPATH, "//table[@class='textualData links']//tr[td[2]/a]")
+                # One page_source read per listing page instead of several driver calls per row
+                listing = snapshot(self.driver)
+                listing_url = self.driver.current_url
+                rows = listing.xpath("//table[@class='textualData links']//tr[td[2]/a]")
                 self.logger.info(f"Found {len(rows)} articles on page {page_num}")
 
-                main_tab = self.driver.current_window_handle
+                listed = []
 
                 for row in rows:
                     try:
-                        link_elem = row.find_element(By.XPATH, ".//td[2]/a")
-                        date_elem = row.find_element(By.XPATH, ".//td[1]")
-
-                        title = link_elem.text.strip()
-                        link = link_elem.get_attribute("href")
-                        date_str = date_elem.text.strip()
+                        title = text_of(row, ".//td[2]/a")
+                        link = url_of(row, ".//td[2]/a/@href", listing_url)
+                        date_str = text_of(row, ".//td[1]")
 
                         if link in seen_urls:
                             continue
+                        seen_urls.add(link)
+                        listed.append((title, link, date_str))
+
+                    except Exception as e:
+                        self.logger.warning(f"❌ Failed to process row: {str(e)}")
+                        continue
+
+                # Article pages are server-rendered: fetch them over HTTP, the browser stays on the listing
+                pages = fetch_pages([link for _, link, _ in listed], 'bfarm.de', driver=self.driver)
+                page_articles = []
+
+                for title, link, date_str in listed:
+                    page = pages.get(link)
+                    if page is None:
+                        continue
 
-                        # Open in new tab
-                        self.driver.execute_script("window.open(arguments[0]);", link)
-                        self.driver.switch_to.window(self.driver.window_handles[-1])
-                        time.sleep(2)
+                    # Extract content
+                    paragraphs1 = page.xpath("//p[@class='c-intro-content__text']")
+                    paragraphs2 = page.xpath("//main/div/p")
+                    paragraphs = [element_text(p) for p in paragraphs1 + paragraphs2]
+                    full_text = "\n".join([p for p in paragraphs if p])
 
-                        # Extract content
-                        paragraphs1 = self.driver.find_elements(By.XPATH, "//p[@class='c-intro-content__text']")
-                        paragraphs2 = self.driver.find_elements(By.XPATH, "//main/div/p")
-                        paragraphs = paragraphs1 + paragraphs2
-                        full_text = "\n".join([p.text.strip() for p in paragraphs if p.text.strip()])
+                    pdf_link = page.xpath("//main//a[contains(@href, '.pdf')]/@href").get()
 
-                        pdf_links = self.driver.find_elements(By.XPATH, "//main//a[contains(@href, '.pdf')]")
-                        linkpdf = {'link': pdf_links[0].get_attribute("href")} if pdf_links else {'link': link}
+                    page_articles.append({
+                        'title': title,
+                        'full_text': full_text,
+                        'link': link,
+                        'pdf_link': urljoin(link, pdf_link) if pdf_link else link,
+                        'date': date_str
+                    })
 
-                        # Process content
-                        title_en = self.translate_to_english(title)
-                        full_text_en = self.translate_to_english(full_text)
-                        summary_en = self.translate_to_english(self.generate_summary(full_text_en))
+                # Translate titles and texts of the whole page in packed requests
+                translated = translate_batch(
+                    [field for article in page_articles for field in (article['title'], article['full_text'])])
+
+                for article, title_en, full_text_en in zip(page_articles, translated[0::2], translated[1::2]):
+                    try:
+                        # Cut from the translated text, so it is already English
+                        summary_en = self.generate_summary(full_text_en)
                         classification = self._classify_article(f"{title_en} {full_text_en}")
                         drug_names = self.extract_drug_names(full_text_en, title_en)
                         countries = self.detect_countries(full_text_en.lower())
@@ -766,29 +204,23 @@ class DEnews:
                         article_data = {
                             'Title': title_en,
                             'Summary': summary_en,
-                            'Article URL': linkpdf['link'],
-                            'Date': self.format_date(date_str),
+                            'Article URL': article['pdf_link'],
+                            'Date': self.format_date(article['date']),
                             'Document_Type': classification['document_type'],
                             'Product_Type': classification['product_type'],
                             'Countries': ', '.join(set(countries)) if countries else "None",
                             'Regions': ', '.join(set(regions)) if countries else "None",
                             'Drug_names': ', '.join(drug_names) if drug_names else "None",
                             'Language': detected_language,
-                            'Source URL': link
+                            'Source URL': article['link']
                         }
 
                         self.data_rows.append(article_data)
-                        seen_urls.add(link)
 
                         self.logger.info(f"✅ Added article: {title_en[:60]}...")
 
-                        # Close tab and go back
-                        self.driver.close()
-                        self.driver.switch_to.window(main_tab)
-
                     except Exception as e:
-                        self.logger.warning(f"❌ Failed to process row: {str(e)}")
-                        self.driver.switch_to.window(main_tab)
+                        self.logger.warning(f"❌ Failed to process article {article['link']}: {str(e)}")
                         continue
 
             except Exception as e:
@@ -799,35 +231,15 @@ class DEnews:
 
     def _classify_article(self, text):
         """Classify article text into document and product types"""
-        text = text.lower()
-        classification = {
-            'document_type': 'Other Type',
-            'product_type': 'Other',
-            'document_confidence': 0,
-            'product_confidence': 0
+        keywords = keyword_classifier(document=self.DOCUMENT_TYPES, product=self.PRODUCT_TYPES)
+        document_type, document_confidence = keywords.best(text, 'document', default='Other Type')
+        product_type, product_confidence = keywords.best(text, 'product', default='Other')
+        return {
+            'document_type': document_type,
+            'product_type': product_type,
+            'document_confidence': document_confidence,
+            'product_confidence': product_confidence
         }
-        
-        # Document classification
-        for doc_type, keywords in self.DOCUMENT_TYPES.items():
-            matches = sum(1 for kw in keywords if kw in text)
-            confidence = min(100, (matches / len(keywords)) * 100 if keywords else 0)
-            if confidence > classification['document_confidence']:
-                classification.update({
-                    'document_type': doc_type,
-                    'document_confidence': round(confidence, 1)
-                })
-        
-        # Product classification
-        for prod_type, keywords in self.PRODUCT_TYPES.items():
-            matches = sum(1 for kw in keywords if kw in text)
-            confidence = min(100, (matches / len(keywords)) * 100 if keywords else 0)
-            if confidence > classification['product_confidence']:
-                classification.update({
-                    'product_type': prod_type,
-                    'product_confidence': round(confidence, 1)
-                })
-                
-        return classification
 
     def _process_article(self, article: Dict, base_url: str) -> Optional[Dict]:
         """Process article with drug extraction from English text"""
@@ -838,9 +250,8 @@ class DEnews:
                 return None
                 
             # Translate to English first
-            title_en = self.translate_to_english(article['title'])
-            full_text_en = self.translate_to_english(full_text)
-            summary_en = self.translate_to_english(self.generate_summary(full_text))
+            title_en, full_text_en, summary_en = translate_batch(
+                [article['title'], full_text, self.generate_summary(full_text)])
             
             # Extract drug names from ENGLISH text
             drug_names = self.extract_drug_names(full_text_en, title_en)
@@ -890,7 +301,7 @@ class DEnews:
                 EC.element_to_be_clickable((By.XPATH, "//button[contains(., 'Accept')]"))
             )
             consent_button.click()
-            time.sleep(1)
+            wait_hidden(self.driver, consent_button, site='bfarm.de')
         except Exception:
             pass  # No popup found or already accepted
         
@@ -1072,7 +483,7 @@ class DEnews:
         if not text.strip():
             return text
         try:
-            return GoogleTranslator(source='auto', target='en').translate(text)
+            return translate(text)
         except Exception as e:
             print(f"Translation failed: {e}. Using original text.")
             return text  # Fallback to original           
@@ -1098,11 +509,7 @@ class DEnews:
     
     def detect_countries(self, text):
         """Detect countries/regions mentioned in text"""
-        detected = []
-        text = text.lower()
-        for country, patterns in self.COUNTRY_PATTERNS.items():
-            if any(re.search(r'\b' + pattern + r'\b', text) for pattern in patterns):
-                detected.append(country)
+        detected = country_gazetteer(self.COUNTRY_PATTERNS).detect(text)
         return detected if detected else ['Global']
     
     def map_regions(self, countries: List[str]) -> List[str]:
@@ -1119,20 +526,17 @@ class DEnews:
 
     def classify_document(self, text):
         """Classify document based on keywords"""
-        text = text.lower()
-        for doc_type, keywords in self.DOCUMENT_TYPES.items():
-            if any(keyword in text for keyword in keywords):
-                return doc_type
-        return 'Other Type'
+        return keyword_classifier(document=self.DOCUMENT_TYPES, product=self.PRODUCT_TYPES).classify(text, 'document', default='Other Type')
 
     def classify_product(self, text):
         """Classify product based on keywords"""
-        text = text.lower()
-        for product_type, keywords in self.PRODUCT_TYPES.items():
-            if any(keyword in text for keyword in keywords):
-                return product_type
-        return 'Other'
+        return keyword_classifier(document=self.DOCUMENT_TYPES, product=self.PRODUCT_TYPES).classify(text, 'product', default='Other')
 
-if __name__ == "__main__":
+
+def main():
     scraper = DEnews(output_file='DE.xlsx')
     scraper.run()
+
+
+if __name__ == "__main__":
+    main()
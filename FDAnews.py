@@ -1,22 +1,20 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import NoSuchElementException, TimeoutException, StaleElementReferenceException
 from deep_translator import GoogleTranslator
-from transformers import pipeline
 import pandas as pd
-import time
-import re
 import os
 import logging
 from urllib.parse import urljoin
 from datetime import datetime
 from typing import List, Dict, Optional
-from scrapy.crawler import CrawlerProcess
+from common.drug_terms import profile_columns
+from common.term_index import open_term_index
+from common.translation import translate
+from common.browser import driver_pool
+from common.readiness import wait_network_idle
+from common.dom import snapshot, text_of, url_of
 
 class FDAnews:
     def __init__(self, output_file='FDA_news.xlsx'):
@@ -32,51 +30,23 @@ class FDAnews:
         self.data_rows = []
         self.translator = GoogleTranslator(source='auto', target='en')
 
-        tsv_url = "https://raw.githubusercontent.com/MariaKlap/Drug-Name-Database/refs/heads/main/drug.target.interaction.tsv"                   
-
-        try:
-            df = pd.read_csv(tsv_url, sep='\t')
-        except UnicodeDecodeError:
-            df = pd.read_csv(tsv_url, sep='\t', encoding='ISO-8859-1')
-
-        print(f"📊 DRUG_NAME column row count (including duplicates and empty): {len(df['DRUG_NAME'])}")
-
-        # Limit to specific columns only
-        allowed_columns = {'DRUG_NAME', 'GENE', 'SWISSPROT', 'ACTION_TYPE', 'TARGET_CLASS', 'TARGET_NAME'}
-        allowed_columns = [col for col in df.columns if col in allowed_columns]
-
-        terms = set()
-        for col in allowed_columns:
-            col_terms = df[col].dropna().astype(str)
-            col_terms = {t.strip().lower() for t in col_terms if t.strip()}
-            terms.update(col_terms)
+        # ✅ LOAD drug terms as a read-only, memory-mapped index shared with other running scrapers
+        allowed_columns = profile_columns('all_terms')
+        terms = open_term_index('all_terms', boundary='lookaround', min_length=4)
 
 
         self.drug_terms_set = terms
+        self.drug_matcher = self.drug_terms_set
         print(f"✅ Loaded {len(self.drug_terms_set)} drug terms from TSV columns: {', '.join(allowed_columns)}")
 
         # Combine all column values into one lowercase set
-        self.match_terms = set()
+        self.match_terms = terms
 
-        for col in allowed_columns:
-            if col in df.columns:
-                self.match_terms.update(df[col].dropna().astype(str).str.lower().unique())
 
 
 
-
-        # Browser setup
-        options = Options()
-        prefs = {
-            "profile.default_content_settings.popups": 0,
-            "profile.content_settings.exceptions.automatic_downloads.*.setting": 1,
-            "profile.default_content_setting_values.automatic_downloads": 1,
-            "profile.default_content_setting_values.popups": 0
-        }
-        options.add_experimental_option("prefs", prefs)
-        
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=options)
+        # Warm browser from the shared pool (common.browser), returned when the scraper is done
+        self.driver = driver_pool().acquire(site='fda.gov')
 
     def run(self):
         try:
@@ -88,7 +58,7 @@ class FDAnews:
 
     def cleanup(self):
         try:
-            self.driver.quit()
+            driver_pool().release(self.driver)
         except Exception as e:
             self.logger.warning(f"Driver cleanup error: {e}")
 
@@ -118,34 +88,27 @@ class FDAnews:
             EC.element_to_be_clickable((By.XPATH, "//option[contains(text(), 'All')]"))
         ).click()
 
-        time.sleep(3)
+        # The table is redrawn client-side with all rows: wait for the XHRs to settle
+        wait_network_idle(self.driver, site='fda.gov')
 
-        try:
-            table = self.driver.find_element(By.XPATH, "//table[@id='DataTables_Table_0']/tbody")
-        except Exception as e:
-            self.logger.error(f"Could not locate data table: {e}")
+        # Read the whole table from one DOM snapshot instead of a round trip per cell
+        page = snapshot(self.driver)
+        page_url = self.driver.current_url
+        table = page.xpath("//table[@id='DataTables_Table_0']/tbody")
+        if not table:
+            self.logger.error("Could not locate data table")
             return
 
-        rows = table.find_elements(By.TAG_NAME, "tr")
+        rows = table[0].xpath(".//tr")
         self.logger.info(f"Found {len(rows)} FDA entries")
 
         for row in rows:
-            try:
-                summary_element = row.find_element(By.XPATH, "./td[@tabindex]/a")
-                summary_text = summary_element.text
-                summary_link = summary_element.get_attribute("href")
-            except:
-                summary_text = ""
-                summary_link = ""
+            summary_text = text_of(row, "./td[@tabindex]/a", default="")
+            summary_link = url_of(row, "./td[@tabindex]/a/@href", page_url, default="")
+            doc_link = url_of(row, "./td[2]/a/@href", page_url, default=None)
 
             try:
-                doc_element = row.find_element(By.XPATH, "./td[2]/a")
-                doc_link = doc_element.get_attribute("href")
-            except:
-                doc_link = None
-
-            try:
-                date_text = row.find_element(By.CLASS_NAME, "sorting_1").text.strip()
+                date_text = text_of(row, ".sorting_1")
                 # Convert date format from MM/DD/YYYY to DD/MM/YYYY
                 date_obj = datetime.strptime(date_text, "%m/%d/%Y")
                 formatted_date = date_obj.strftime("%d/%m/%Y")
@@ -178,31 +141,18 @@ class FDAnews:
         if not text.strip():
             return []
 
-        matched = set()  # Using set to avoid duplicates
-        
         # Combine title and text for better context
         full_text = f"{title or ''} {text}".lower()
-        
-        for term in self.drug_terms_set:
-            # Skip very short terms to reduce false positives
-            if len(term) < 4:
-                continue
-                
-            # Create a regex pattern that matches whole words only
-            pattern = r'(?<!\w)' + re.escape(term.lower()) + r'(?!\w)'
-            
-            # Search in the full text
-            if re.search(pattern, full_text, flags=re.IGNORECASE):
-                matched.add(term)
-                
-        return list(matched)
+
+        # Terms shorter than 4 characters are skipped by the matcher to reduce false positives
+        return self.drug_matcher.find_all(full_text)
 
 
     def translate_to_english(self, text):
         if not text.strip():
             return text
         try:
-            return self.translator.translate(text)
+            return translate(text)
         except Exception as e:
             self.logger.warning(f"Translation failed: {e}")
             return text
@@ -223,6 +173,11 @@ class FDAnews:
         except Exception as e:
             self.logger.error(f"Failed to save Excel: {e}")
 
-if __name__ == "__main__":
+
+def main():
     scraper = FDAnews()
     scraper.run()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,24 +1,31 @@
 import scrapy
-from langdetect import detect, LangDetectException
-from transformers import pipeline, MarianMTModel, MarianTokenizer
+from langdetect import LangDetectException
 import os
 from datetime import datetime
 from typing import Dict, List
-import re
 from urllib.parse import urljoin
 import hashlib
 from openpyxl import Workbook
 from openpyxl.styles import Font
-from transformers import pipeline as translation_pipeline
-from scrapy import Spider, Selector, Request
-from selenium import webdriver
+from scrapy import Spider, Request
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
-import time
 from scrapy.crawler import CrawlerProcess
-import pandas as pd
+from scrapy.utils.defer import maybe_deferred_to_future
+from twisted.internet.threads import deferToThread
+from common.drug_terms import profile_columns
+from common.term_index import open_term_index
+from common.gazetteer import country_gazetteer
+from common.translation import translate
+from common.language_id import detect_language_code
+from common.summarization import summarization_service
+from common.keyword_classifier import keyword_classifier
+from common import reference
+from common.browser import ACQUIRE_TIMEOUT, driver_pool
+from common.readiness import wait_stale
+from common.dom import snapshot
 
 
 class ICHnewsSpider(scrapy.Spider):
@@ -49,29 +56,18 @@ class ICHnewsSpider(scrapy.Spider):
         self.current_page = 1
         self.seen_urls = set() 
         
-        tsv_url = "https://raw.githubusercontent.com/MariaKlap/Drug-Name-Database/refs/heads/main/drug.target.interaction.tsv"                   
-
-        try:
-            df = pd.read_csv(tsv_url, sep='\t')
-        except UnicodeDecodeError:
-            df = pd.read_csv(tsv_url, sep='\t', encoding='ISO-8859-1')
-
-        print(f"📊 DRUG_NAME column row count (including duplicates and empty): {len(df['DRUG_NAME'])}")
-
-        # Limit to specific columns only
-        allowed_columns = {'DRUG_NAME', 'GENE', 'SWISSPROT', 'ACTION_TYPE', 'TARGET_CLASS', 'TARGET_NAME'}
-        allowed_columns = [col for col in df.columns if col in allowed_columns]
-
-        terms = set()
-        for col in allowed_columns:
-            col_terms = df[col].dropna().astype(str)
-            col_terms = {t.strip().lower() for t in col_terms if t.strip()}
-            terms.update(col_terms)
+        # ✅ LOAD drug terms as a read-only, memory-mapped index shared with other running scrapers
+        allowed_columns = profile_columns('all_terms')
+        terms = open_term_index('all_terms', boundary='lookaround', min_length=4)
 
 
         self.drug_terms_set = terms
+        self.drug_matcher = self.drug_terms_set
         print(f"✅ Loaded {len(self.drug_terms_set)} drug terms from TSV columns: {', '.join(allowed_columns)}")
 
+        # Shared batched summarizer; the model is loaded on the first uncached article
+        self.summarizer = summarization_service()
+
         
         
         # Initialize Excel workbook
@@ -94,584 +90,38 @@ class ICHnewsSpider(scrapy.Spider):
         self.row_count = 2
         
         # Language code to full name mapping
-        self.LANGUAGE_NAMES = {
-            'af': 'Afrikaans',
-            'ar': 'Arabic',
-            'bg': 'Bulgarian',
-            'bn': 'Bengali',
-            'ca': 'Catalan',
-            'cs': 'Czech',
-            'cy': 'Welsh',
-            'da': 'Danish',
-            'de': 'German',
-            'el': 'Greek',
-            'en': 'English',
-            'es': 'Spanish',
-            'et': 'Estonian',
-            'fa': 'Persian',
-            'fi': 'Finnish',
-            'fr': 'French',
-            'gu': 'Gujarati',
-            'he': 'Hebrew',
-            'hi': 'Hindi',
-            'hr': 'Croatian',
-            'hu': 'Hungarian',
-            'id': 'Indonesian',
-            'it': 'Italian',
-            'ja': 'Japanese',
-            'kn': 'Kannada',
-            'ko': 'Korean',
-            'lt': 'Lithuanian',
-            'lv': 'Latvian',
-            'mk': 'Macedonian',
-            'ml': 'Malayalam',
-            'mr': 'Marathi',
-            'ne': 'Nepali',
-            'nl': 'Dutch',
-            'no': 'Norwegian',
-            'pa': 'Punjabi',
-            'pl': 'Polish',
-            'pt': 'Portuguese',
-            'ro': 'Romanian',
-            'ru': 'Russian',
-            'sk': 'Slovak',
-            'sl': 'Slovenian',
-            'so': 'Somali',
-            'sq': 'Albanian',
-            'sv': 'Swedish',
-            'sw': 'Swahili',
-            'ta': 'Tamil',
-            'te': 'Telugu',
-            'th': 'Thai',
-            'tl': 'Tagalog',
-            'tr': 'Turkish',
-            'uk': 'Ukrainian',
-            'ur': 'Urdu',
-            'vi': 'Vietnamese',
-            'zh-cn': 'Chinese (Simplified)',
-            'zh-tw': 'Chinese (Traditional)'
-        }        
+        self.LANGUAGE_NAMES = reference.LANGUAGE_NAMES
             
         # Document type classification
-        self.DOCUMENT_TYPES = {
-            'Announcement': ['announcement', 'notification', 'bulletin'],
-            'Expert Report': ['expert report', 'technical report', 'scientific opinion'],
-            'Amendment': ['amendment', 'regulation change', 'regulatory update'],
-            'Law': ['law', 'legislation', 'statute', 'act'],
-            'Directive': ['directive', 'guideline', 'policy'],
-            'Order': ['order', 'decision', 'ruling', 'decree'],
-            'Information Note': ['information note', 'information bulletin', 'notice'],
-            'Q&A': ['questions and answers', 'q&a', 'faq', 'frequently asked'],
-            'Instructions': ['instructions', 'manual', 'guidance', 'procedure'],
-            'Resolution': ['resolution', 'conclusion', 'determination'],
-            'Consultation': ['consultation', 'public hearing', 'stakeholder input'],
-            'Product Info': ['product information', 'package leaflet', 'product update'],
-            'Regulatory Decision': ['regulatory decision', 'approval summary', 'assessment'],
-            'Evaluation': ['evaluation report', 'assessment report', 'review report'],
-            'Recommendation': ['recommendation', 'advice', 'suggestion'],
-            'Checklist': ['checklist', 'verification list', 'review points'],
-            'Approval Tracker': ['approval tracker', 'authorization status', 'timeline'],
-            'CHMP Opinion': ['chmp opinion', 'committee opinion', 'scientific opinion'],
-            'Committee': ['committee', 'working group', 'task force'],
-            'CV': ['curriculum vitae', 'cv', 'resume'],
-            'EPAR': ['epar', 'european public assessment report'],
-            'Letter': ['letter', 'correspondence', 'official communication'],
-            'Meeting': ['meeting', 'conference', 'session'],
-            'Withdrawal': ['withdrawn application', 'cancelled submission'],
-            'Communication': ['communication', 'announcement', 'message'],
-            'Decree': ['decree', 'royal decree', 'official order'],
-            'Form': ['form', 'application form', 'submission form'],
-            'Regulatory History': ['regulatory history', 'dossier history', 'timeline'],
-            'Press Release': ['press release', 'news release', 'media statement'],
-            'Ordinance': ['ordinance', 'local regulation', 'municipal law'],
-            'Advisory Committee': ['advisory committee', 'committee profile'],
-            'Voting': ['voting', 'committee vote', 'decision outcome'],
-            'Petition': ['citizen petition', 'public petition', 'request'],
-            'Federal Register': ['federal register', 'official gazette', 'journal'],
-            'Inspection': ['inspection report', 'audit report', 'site visit'],
-            'SOP': ['sop', 'standard procedure', 'operating protocol'],
-            'BLA Approval': ['bla', 'biologics license application'],
-            'BLA Supplement': ['supplemental bla', 'bla amendment'],
-            'NDA Supplement': ['supplemental nda', 'nda amendment'],
-            '510(k)': ['510(k)', 'premarket notification'],
-            'NDA Approval': ['nda', 'new drug application'],
-            'Other Type': []
-        }
+        self.DOCUMENT_TYPES = reference.DOCUMENT_TYPES
 
         # Product type classification
-        self.PRODUCT_TYPES = {
-            'Biological': [
-                'biological', 'biologic',
-                'monoclonal antibody', 'mab', 'recombinant', 'cell therapy',
-                'gene therapy', 'blood product', 'plasma derived',
-                'therapeutic protein', 'insulin', 'erythropoietin',
-                'immunoglobulin', 'stem cell'
-            ],
-            'Drug Product': [
-                'drug product', 'finished product', 'formulation', 'dosage form',
-                'tablet', 'capsule', 'injection', 'solution', 'suspension', 'biopharmaceutical', 'biosimilar',
-                'cream', 'ointment', 'gel', 'suppository', 'inhalation'
-            ],
-            'Drug Substance': [
-                'drug substance', 'active substance', 'api', 'active ingredient',
-                'bulk drug', 'chemical entity', 'reference standard'
-            ],
-            'Vaccine': [
-                'vaccine', 'vaccination', 'immunization', 'antigen', 'adjuvant',
-                'mmr', 'dtap', 'hpv', 'influenza', 'covid-19', 'sars-cov-2'
-            ],
-            'Small Molecule': [
-                'small molecule', 'chemical drug', 'synthetic', 'organic compound',
-                'nme', 'new molecular entity', 'low molecular weight'
-            ],
-            'Medical Device': [
-                'medical device', 'implant', 'stent', 'catheter', 'prosthesis',
-                'pacemaker', 'defibrillator', 'surgical instrument'
-            ],
-            'IVD': [
-                'ivd', 'in vitro diagnostic', 'diagnostic test', 'assay',
-                'reagent', 'test kit', 'analyzer', 'rapid test'
-            ],
-            'Other': []
-        }
+        self.PRODUCT_TYPES = reference.PRODUCT_TYPES_EXTENDED
 
         # Country patterns for detection in text
-        self.COUNTRY_PATTERNS = {
-            # Europe (Complete list)
-            'Albania': ['albania', 'shqipëria', 'tirana'],
-            'Andorra': ['andorra', 'andorre'],
-        'Austria': ['austria', 'österreich', 'vienna'],
-        'Belarus': ['belarus', 'belarús', 'minsk'],
-        'Belgium': ['belgium', 'belgique', 'belgie', 'brussels'],
-        'Bosnia and Herzegovina': ['bosnia', 'herzegovina', 'sarajevo'],
-        'Bulgaria': ['bulgaria', 'българия', 'sofia'],
-        'Croatia': ['croatia', 'hrvatska', 'zagreb'],
-        'Cyprus': ['cyprus', 'κύπρος', 'lefkosia'],
-        'Czech Republic': ['czech republic', 'česko', 'prague'],
-        'Denmark': ['denmark', 'danmark', 'copenhagen'],
-        'Estonia': ['estonia', 'eesti', 'tallinn'],
-        'Finland': ['finland', 'suomi', 'helsinki'],
-        'France': ['france', 'french', 'paris'],
-        'Germany': ['germany', 'deutschland', 'berlin'],
-        'Greece': ['greece', 'ελλάδα', 'athens'],
-        'Hungary': ['hungary', 'magyarország', 'budapest'],
-        'Iceland': ['iceland', 'ísland', 'reykjavik'],
-        'Ireland': ['ireland', 'éire', 'dublin'],
-        'Italy': ['italy', 'italia', 'rome'],
-        'Latvia': ['latvia', 'latvija', 'riga'],
-        'Liechtenstein': ['liechtenstein', 'vaduz'],
-        'Lithuania': ['lithuania', 'lietuva', 'vilnius'],
-        'Luxembourg': ['luxembourg', 'luxemburg', 'luxembourg city'],
-        'Malta': ['malta', 'valletta'],
-        'Moldova': ['moldova', 'chișinău'],
-        'Monaco': ['monaco', 'monaco-ville'],
-        'Montenegro': ['montenegro', 'crna gora', 'podgorica'],
-        'Netherlands': ['netherlands', 'nederland', 'holland', 'amsterdam'],
-        'North Macedonia': ['north macedonia', 'macedonia', 'skopje'],
-        'Norway': ['norway', 'norge', 'oslo'],
-        'Poland': ['poland', 'polska', 'warsaw'],
-        'Portugal': ['portugal', 'lisbon'],
-        'Romania': ['romania', 'românia', 'bucharest'],
-        'Russia': ['russia', 'россия', 'moscow'],
-        'San Marino': ['san marino'],
-        'Serbia': ['serbia', 'srbija', 'belgrade'],
-        'Slovakia': ['slovakia', 'slovensko', 'bratislava'],
-        'Slovenia': ['slovenia', 'slovenija', 'ljubljana'],
-        'Spain': ['spain', 'españa', 'madrid'],
-        'Sweden': ['sweden', 'sverige', 'stockholm'],
-        'Switzerland': ['switzerland', 'suisse', 'schweiz', 'bern'],
-        'Ukraine': ['ukraine', 'україна', 'kyiv'],
-        'United Kingdom': ['uk', 'united kingdom', 'britain', 'london'],
-        'Vatican City': ['vatican', 'holy see'],
-
-        # Americas (Complete list)
-        'Antigua and Barbuda': ['antigua', 'barbuda', "antigua and barbuda", 'saint john'],
-        'Argentina': ['argentina', 'buenos aires', 'argentine republic'],
-        'Bahamas': ['bahamas', 'nassau', 'commonwealth of the bahamas'],
-        'Barbados': ['barbados', 'bridgetown'],
-        'Belize': ['belize', 'belmopan'],
-        'Bolivia': ['bolivia', 'sucre', 'la paz', 'plurinational state'],
-        'Brazil': ['brazil', 'brasil', 'brasília', 'rio de janeiro', 'federative republic'],
-        'Canada': ['canada', 'ottawa', 'toronto', 'ontario', 'quebec'],
-        'Chile': ['chile', 'santiago', 'republic of chile'],
-        'Colombia': ['colombia', 'bogotá', 'bogota', 'republic of colombia'],
-        'Costa Rica': ['costa rica', 'san josé', 'san jose'],
-        'Cuba': ['cuba', 'havana', 'republic of cuba'],
-        'Dominica': ['dominica', 'roseau', 'commonwealth of dominica'],
-        'Dominican Republic': ['dominican republic', 'santo domingo'],
-        'Ecuador': ['ecuador', 'quito', 'republic of ecuador'],
-        'El Salvador': ['el salvador', 'san salvador', 'republic of el salvador'],
-        'Grenada': ['grenada', "saint george"],
-        'Guatemala': ['guatemala', 'guatemala city', 'republic of guatemala'],
-        'Guyana': ['guyana', 'georgetown', 'cooperative republic'],
-        'Haiti': ['haiti', 'port-au-prince', 'republic of haiti'],
-        'Honduras': ['honduras', 'tegucigalpa', 'republic of honduras'],
-        'Jamaica': ['jamaica', 'kingston'],
-        'Mexico': ['mexico', 'méxico', 'mexico city', 'cdmx', 'estados unidos mexicanos'],
-        'Nicaragua': ['nicaragua', 'managua', 'republic of nicaragua'],
-        'Panama': ['panama', 'panama city', 'republic of panama'],
-        'Paraguay': ['paraguay', 'asunción', 'asunción', 'republic of paraguay'],
-        'Peru': ['peru', 'lima', 'republic of peru'],
-        'Saint Kitts and Nevis': ['saint kitts', 'nevis', 'basseterre'],
-        'Saint Lucia': ['saint lucia', 'castries'],
-        'Saint Vincent and the Grenadines': ['saint vincent', 'grenadines', 'kingstown'],
-        'Suriname': ['suriname', 'paramaribo', 'republic of suriname'],
-        'Trinidad and Tobago': ['trinidad', 'tobago', 'port of spain'],
-        'United States': ['usa', 'u\\.s\\.', 'united states', 'america', 'washington dc', 'new york', 'california'],
-        'Uruguay': ['uruguay', 'montevideo', 'oriental republic'],
-        'Venezuela': ['venezuela', 'caracas', 'bolivarian republic'],
-
-        # Asia (Complete list)
-        'Afghanistan': ['afghanistan', 'kabul', 'islamic emirate'],
-        'Armenia': ['armenia', 'yerevan', 'republic of armenia'],
-        'Azerbaijan': ['azerbaijan', 'baku', 'republic of azerbaijan'],
-        'Bahrain': ['bahrain', 'manama', 'kingdom of bahrain'],
-        'Bangladesh': ['bangladesh', 'dhaka', "people's republic"],
-        'Bhutan': ['bhutan', 'thimphu', 'kingdom of bhutan'],
-        'Brunei': ['brunei', 'bandar seri begawan', 'darussalam'],
-        'Cambodia': ['cambodia', 'phnom penh', 'kingdom of cambodia'],
-        'China': ['china', 'zhongguo', 'beijing', 'shanghai', "people's republic"],
-        'Cyprus': ['cyprus', 'nicosia', 'republic of cyprus'],
-        'Georgia': ['georgia', 'tbilisi'],
-        'India': ['india', 'bharat', 'new delhi', 'mumbai', 'republic of india'],
-        'Indonesia': ['indonesia', 'jakarta', 'republic of indonesia'],
-        'Iran': ['iran', 'tehran', 'islamic republic'],
-        'Iraq': ['iraq', 'baghdad', 'republic of iraq'],
-        'Israel': ['israel', 'jerusalem', 'state of israel'],
-        'Japan': ['japan', 'nippon', 'tokyo'],
-        'Jordan': ['jordan', 'amman', 'hashemite kingdom'],
-        'Kazakhstan': ['kazakhstan', 'nur-sultan', 'astana', 'republic of kazakhstan'],
-        'Kuwait': ['kuwait', 'kuwait city', 'state of kuwait'],
-        'Kyrgyzstan': ['kyrgyzstan', 'bishkek', 'kyrgyz republic'],
-        'Laos': ['laos', 'vientiane', "lao people's republic"],
-        'Lebanon': ['lebanon', 'beirut', 'lebanese republic'],
-        'Malaysia': ['malaysia', 'kuala lumpur', 'putrajaya'],
-        'Maldives': ['maldives', 'malé', 'republic of maldives'],
-        'Mongolia': ['mongolia', 'ulaanbaatar'],
-        'Myanmar': ['myanmar', 'burma', 'naypyidaw', 'republic of the union'],
-        'Nepal': ['nepal', 'kathmandu', 'federal democratic republic'],
-        'North Korea': ['north korea', 'dprk', 'pyongyang', "democratic people's republic"],
-        'Oman': ['oman', 'muscat', 'sultanate of oman'],
-        'Pakistan': ['pakistan', 'islamabad', 'islamic republic'],
-        'Palestine': ['palestine', 'ramallah', 'state of palestine'],
-        'Philippines': ['philippines', 'manila', 'republic of the philippines'],
-        'Qatar': ['qatar', 'doha', 'state of qatar'],
-        'Russia': ['russia', 'russian federation', 'moscow'],
-        'Saudi Arabia': ['saudi arabia', 'riyadh', 'kingdom of saudi arabia'],
-        'Singapore': ['singapore', 'republic of singapore'],
-        'South Korea': ['south korea', 'korea republic', 'seoul', 'republic of korea'],
-        'Sri Lanka': ['sri lanka', 'colombo', 'sri jayawardenepura kotte'],
-        'Syria': ['syria', 'damascus', 'syrian arab republic'],
-        'Taiwan': ['taiwan', 'taipei', 'republic of china'],
-        'Tajikistan': ['tajikistan', 'dushanbe', 'republic of tajikistan'],
-        'Thailand': ['thailand', 'bangkok', 'kingdom of thailand'],
-        'Timor-Leste': ['timor-leste', 'east timor', 'dili', 'democratic republic'],
-        'Turkey': ['turkey', 'türkiye', 'ankara', 'republic of turkey'],
-        'Turkmenistan': ['turkmenistan', 'ashgabat'],
-        'United Arab Emirates': ['uae', 'united arab emirates', 'dubai', 'abu dhabi'],
-        'Uzbekistan': ['uzbekistan', 'tashkent', 'republic of uzbekistan'],
-        'Vietnam': ['vietnam', 'hanoi', 'socialist republic'],
-        'Yemen': ['yemen', "sana'a", 'republic of yemen'],
-
-        # Africa (Complete list)
-        'Algeria': ['algeria', 'algiers', "people's democratic republic"],
-        'Angola': ['angola', 'luanda', 'republic of angola'],
-        'Benin': ['benin', 'porto-novo', 'republic of benin'],
-        'Botswana': ['botswana', 'gaborone', 'republic of botswana'],
-        'Burkina Faso': ['burkina faso', 'ouagadougou'],
-        'Burundi': ['burundi', 'gitega', 'republic of burundi'],
-        'Cameroon': ['cameroon', 'yaoundé', 'republic of cameroon'],
-        'Cape Verde': ['cape verde', 'cabo verde', 'praia', 'republic of cape verde'],
-        'Central African Republic': ['central african republic', 'bangui'],
-        'Chad': ['chad', "n'djamena", 'republic of chad'],
-        'Comoros': ['comoros', 'moroni', 'union of the comoros'],
-        'Congo (Brazzaville)': ['republic of the congo', 'congo-brazzaville', 'brazzaville'],
-        'Congo (Kinshasa)': ['democratic republic of the congo', 'drc', 'kinshasa'],
-        "Côte d'Ivoire": ["côte d'ivoire", 'ivory coast', 'yamoussoukro'],
-        'Djibouti': ['djibouti', 'republic of djibouti'],
-        'Egypt': ['egypt', 'cairo', 'arab republic of egypt'],
-        'Equatorial Guinea': ['equatorial guinea', 'malabo', 'republic of equatorial guinea'],
-        'Eritrea': ['eritrea', 'asmara', 'state of eritrea'],
-        'Eswatini': ['eswatini', 'swaziland', 'mbabane', 'kingdom of eswatini'],
-        'Ethiopia': ['ethiopia', 'addis ababa', 'federal democratic republic'],
-        'Gabon': ['gabon', 'libreville', 'gabonese republic'],
-        'Gambia': ['gambia', 'banjul', 'republic of the gambia'],
-        'Ghana': ['ghana', 'accra', 'republic of ghana'],
-        'Guinea': ['guinea', 'conakry', 'republic of guinea'],
-        'Guinea-Bissau': ['guinea-bissau', 'bissau', 'republic of guinea-bissau'],
-        'Kenya': ['kenya', 'nairobi', 'republic of kenya'],
-        'Lesotho': ['lesotho', 'maseru', 'kingdom of lesotho'],
-        'Liberia': ['liberia', 'monrovia', 'republic of liberia'],
-        'Libya': ['libya', 'tripoli', 'state of libya'],
-        'Madagascar': ['madagascar', 'antananarivo', 'republic of madagascar'],
-        'Malawi': ['malawi', 'lilongwe', 'republic of malawi'],
-        'Mali': ['mali', 'bamako', 'republic of mali'],
-        'Mauritania': ['mauritania', 'nouakchott', 'islamic republic'],
-        'Mauritius': ['mauritius', 'port louis', 'republic of mauritius'],
-        'Morocco': ['morocco', 'rabat', 'kingdom of morocco'],
-        'Mozambique': ['mozambique', 'maputo', 'republic of mozambique'],
-        'Namibia': ['namibia', 'windhoek', 'republic of namibia'],
-        'Niger': ['niger', 'niamey', 'republic of niger'],
-        'Nigeria': ['nigeria', 'abuja', 'federal republic of nigeria'],
-        'Rwanda': ['rwanda', 'kigali', 'republic of rwanda'],
-        'Sao Tome and Principe': ['são tomé and príncipe', 'sao tome', 'são tomé'],
-        'Senegal': ['senegal', 'dakar', 'republic of senegal'],
-        'Seychelles': ['seychelles', 'victoria', 'republic of seychelles'],
-        'Sierra Leone': ['sierra leone', 'freetown', 'republic of sierra leone'],
-        'Somalia': ['somalia', 'mogadishu', 'federal republic of somalia'],
-        'South Africa': ['south africa', 'pretoria', 'cape town', 'republic of south africa'],
-        'South Sudan': ['south sudan', 'juba', 'republic of south sudan'],
-        'Sudan': ['sudan', 'khartoum', 'republic of the sudan'],
-        'Tanzania': ['tanzania', 'dodoma', 'united republic of tanzania'],
-        'Togo': ['togo', 'lomé', 'togolese republic'],
-        'Tunisia': ['tunisia', 'tunis', 'republic of tunisia'],
-        'Uganda': ['uganda', 'kampala', 'republic of uganda'],
-        'Zambia': ['zambia', 'lusaka', 'republic of zambia'],
-        'Zimbabwe': ['zimbabwe', 'harare', 'republic of zimbabwe'],
-
-        # International/Regional
-        'European Union': ['eu', 'european union', 'e\\.u\\.', 'brussels eu'],
-        'African Union': ['african union', 'au', 'addis ababa'],
-        'ASEAN': ['asean', 'southeast asia', 'jakarta'],
-        'Global': ['who', 'world health organization', 'united nations', 'international'],
-        }
+        self.COUNTRY_PATTERNS = reference.COUNTRY_PATTERNS
         
         # Mapping of regions to countries
-        self.REGION_MAPPING = {
-        # Europe
-        'Albania': 'Southern Europe',
-        'Andorra': 'Southern Europe',
-        'Austria': 'Central Europe',
-        'Belarus': 'Eastern Europe',
-        'Belgium': 'Western Europe',
-        'Bosnia and Herzegovina': 'Southern Europe',
-        'Bulgaria': 'Eastern Europe',
-        'Croatia': 'Southern Europe',
-        'Cyprus': 'Southern Europe',
-        'Czech Republic': 'Central Europe',
-        'Denmark': 'Northern Europe',
-        'Estonia': 'Northern Europe',
-        'Finland': 'Northern Europe',
-        'France': 'Western Europe',
-        'Germany': 'Central Europe',
-        'Greece': 'Southern Europe',
-        'Hungary': 'Central Europe',
-        'Iceland': 'Northern Europe',
-        'Ireland': 'Northern Europe',
-        'Italy': 'Southern Europe',
-        'Latvia': 'Northern Europe',
-        'Liechtenstein': 'Central Europe',
-        'Lithuania': 'Northern Europe',
-        'Luxembourg': 'Western Europe',
-        'Malta': 'Southern Europe',
-        'Moldova': 'Eastern Europe',
-        'Monaco': 'Western Europe',
-        'Montenegro': 'Southern Europe',
-        'Netherlands': 'Western Europe',
-        'North Macedonia': 'Southern Europe',
-        'Norway': 'Northern Europe',
-        'Poland': 'Central Europe',
-        'Portugal': 'Southern Europe',
-        'Romania': 'Eastern Europe',
-        'Russia': 'Eastern Europe',  # Transcontinental
-        'San Marino': 'Southern Europe',
-        'Serbia': 'Southern Europe',
-        'Slovakia': 'Central Europe',
-        'Slovenia': 'Southern Europe',
-        'Spain': 'Southern Europe',
-        'Sweden': 'Northern Europe',
-        'Switzerland': 'Central Europe',
-        'Ukraine': 'Eastern Europe',
-        'United Kingdom': 'Northern Europe',
-        'Vatican City': 'Southern Europe',
+        self.REGION_MAPPING = reference.REGION_MAPPING
 
-        # Americas
-        # North America
-        'Canada': 'North America',
-        'United States': 'North America',
-        'Mexico': 'North America',
-        
-        # Central America
-        'Belize': 'Central America',
-        'Costa Rica': 'Central America',
-        'El Salvador': 'Central America',
-        'Guatemala': 'Central America',
-        'Honduras': 'Central America',
-        'Nicaragua': 'Central America',
-        'Panama': 'Central America',
-        
-        # Caribbean
-        'Antigua and Barbuda': 'Caribbean',
-        'Bahamas': 'Caribbean',
-        'Barbados': 'Caribbean',
-        'Cuba': 'Caribbean',
-        'Dominica': 'Caribbean',
-        'Dominican Republic': 'Caribbean',
-        'Grenada': 'Caribbean',
-        'Haiti': 'Caribbean',
-        'Jamaica': 'Caribbean',
-        'Saint Kitts and Nevis': 'Caribbean',
-        'Saint Lucia': 'Caribbean',
-        'Saint Vincent and the Grenadines': 'Caribbean',
-        'Trinidad and Tobago': 'Caribbean',
-        
-        # South America
-        'Argentina': 'South America',
-        'Bolivia': 'South America',
-        'Brazil': 'South America',
-        'Chile': 'South America',
-        'Colombia': 'South America',
-        'Ecuador': 'South America',
-        'Guyana': 'South America',
-        'Paraguay': 'South America',
-        'Peru': 'South America',
-        'Suriname': 'South America',
-        'Uruguay': 'South America',
-        'Venezuela': 'South America',
-
-        # Asia
-        # Central Asia
-        'Kazakhstan': 'Central Asia',
-        'Kyrgyzstan': 'Central Asia',
-        'Tajikistan': 'Central Asia',
-        'Turkmenistan': 'Central Asia',
-        'Uzbekistan': 'Central Asia',
-        
-        # East Asia
-        'China': 'East Asia',
-        'Japan': 'East Asia',
-        'Mongolia': 'East Asia',
-        'North Korea': 'East Asia',
-        'South Korea': 'East Asia',
-        'Taiwan': 'East Asia',
-        
-        # South Asia
-        'Afghanistan': 'South Asia',
-        'Bangladesh': 'South Asia',
-        'Bhutan': 'South Asia',
-        'India': 'South Asia',
-        'Maldives': 'South Asia',
-        'Nepal': 'South Asia',
-        'Pakistan': 'South Asia',
-        'Sri Lanka': 'South Asia',
-        
-        # Southeast Asia
-        'Brunei': 'Southeast Asia',
-        'Cambodia': 'Southeast Asia',
-        'Indonesia': 'Southeast Asia',
-        'Laos': 'Southeast Asia',
-        'Malaysia': 'Southeast Asia',
-        'Myanmar': 'Southeast Asia',
-        'Philippines': 'Southeast Asia',
-        'Singapore': 'Southeast Asia',
-        'Thailand': 'Southeast Asia',
-        'Timor-Leste': 'Southeast Asia',
-        'Vietnam': 'Southeast Asia',
-        
-        # Middle East (West Asia)
-        'Armenia': 'Middle East',
-        'Azerbaijan': 'Middle East',
-        'Bahrain': 'Middle East',
-        'Cyprus': 'Middle East',
-        'Georgia': 'Middle East',
-        'Iran': 'Middle East',
-        'Iraq': 'Middle East',
-        'Israel': 'Middle East',
-        'Jordan': 'Middle East',
-        'Kuwait': 'Middle East',
-        'Lebanon': 'Middle East',
-        'Oman': 'Middle East',
-        'Palestine': 'Middle East',
-        'Qatar': 'Middle East',
-        'Saudi Arabia': 'Middle East',
-        'Syria': 'Middle East',
-        'Turkey': 'Middle East',
-        'United Arab Emirates': 'Middle East',
-        'Yemen': 'Middle East',
-
-        # ====== AFRICA ====== #
-        # Northern Africa
-        'Algeria': 'Northern Africa',
-        'Egypt': 'Northern Africa',
-        'Libya': 'Northern Africa',
-        'Morocco': 'Northern Africa',
-        'Sudan': 'Northern Africa',
-        'Tunisia': 'Northern Africa',
-        
-        # Sub-Saharan Africa
-        # Western Africa
-        'Benin': 'Western Africa',
-        'Burkina Faso': 'Western Africa',
-        'Cape Verde': 'Western Africa',
-        "Côte d'Ivoire": 'Western Africa',
-        'Gambia': 'Western Africa',
-        'Ghana': 'Western Africa',
-        'Guinea': 'Western Africa',
-        'Guinea-Bissau': 'Western Africa',
-        'Liberia': 'Western Africa',
-        'Mali': 'Western Africa',
-        'Mauritania': 'Western Africa',
-        'Niger': 'Western Africa',
-        'Nigeria': 'Western Africa',
-        'Senegal': 'Western Africa',
-        'Sierra Leone': 'Western Africa',
-        'Togo': 'Western Africa',
-        
-        # Central Africa
-        'Angola': 'Central Africa',
-        'Cameroon': 'Central Africa',
-        'Central African Republic': 'Central Africa',
-        'Chad': 'Central Africa',
-        'Congo (Brazzaville)': 'Central Africa',
-        'Congo (Kinshasa)': 'Central Africa',
-        'Equatorial Guinea': 'Central Africa',
-        'Gabon': 'Central Africa',
-        'Sao Tome and Principe': 'Central Africa',
-        
-        # Eastern Africa
-        'Burundi': 'Eastern Africa',
-        'Comoros': 'Eastern Africa',
-        'Djibouti': 'Eastern Africa',
-        'Eritrea': 'Eastern Africa',
-        'Ethiopia': 'Eastern Africa',
-        'Kenya': 'Eastern Africa',
-        'Madagascar': 'Eastern Africa',
-        'Malawi': 'Eastern Africa',
-        'Mauritius': 'Eastern Africa',
-        'Mozambique': 'Eastern Africa',
-        'Rwanda': 'Eastern Africa',
-        'Seychelles': 'Eastern Africa',
-        'Somalia': 'Eastern Africa',
-        'South Sudan': 'Eastern Africa',
-        'Tanzania': 'Eastern Africa',
-        'Uganda': 'Eastern Africa',
-        'Zambia': 'Eastern Africa',
-        'Zimbabwe': 'Eastern Africa',
-        
-        # Southern Africa
-        'Botswana': 'Southern Africa',
-        'Eswatini': 'Southern Africa',
-        'Lesotho': 'Southern Africa',
-        'Namibia': 'Southern Africa',
-        'South Africa': 'Southern Africa',
-
-        # Oceania
-        'Australia': 'Australia and New Zealand',
-        'New Zealand': 'Australia and New Zealand',
-        'Fiji': 'Pacific Islands',
-        'Papua New Guinea': 'Pacific Islands',
-        'Solomon Islands': 'Pacific Islands',
-        'Vanuatu': 'Pacific Islands',
-
-        # Special Regions
-        'European Union': 'European Union',
-        'African Union': 'African Union',
-        'ASEAN': 'ASEAN',
-        'Global': 'Global'
-    }
+    async def start(self):
+        # The listing walk blocks on the browser for seconds per page: run it on a reactor
+        # worker thread so the other spiders of a shared sweep keep crawling meanwhile
+        for request in await maybe_deferred_to_future(deferToThread(self.listing_requests)):
+            yield request
 
     def start_requests(self):
-        self.driver = webdriver.Chrome()
+        # Scrapy before 2.13 has no async start() and walks the listing on the reactor thread
+        yield from self.listing_requests()
+
+    def listing_requests(self) -> List[scrapy.Request]:
+        """Walk the Selenium listing; the browser is back in the pool before the requests are returned"""
+        try:
+            self.driver = driver_pool().acquire(site='ich.org', timeout=ACQUIRE_TIMEOUT)
+        except TimeoutError as e:
+            self.logger.error(f"No browser free in the shared pool: {e}")
+            return []
+        requests = []
         try:
             self.driver.get(self.start_urls[0])
             
@@ -686,8 +136,8 @@ class ICHnewsSpider(scrapy.Spider):
                     break
                 
                 # Process current page
-                sel = Selector(text=self.driver.page_source)
-                yield from self.parse_selenium_page(sel)
+                sel = snapshot(self.driver)
+                requests.extend(self.parse_selenium_page(sel))
                 
                 # Check if we've reached the last page
                 if self.current_page >= self.max_pages:
@@ -710,13 +160,13 @@ class ICHnewsSpider(scrapy.Spider):
                     
                     # Scroll to and click the element
                     self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", next_button)
-                    time.sleep(0.5)  # Small pause for scroll to complete
                     
                     # Added explicit wait for element to be clickable
                     WebDriverWait(self.driver, 10).until(
                         EC.element_to_be_clickable((By.XPATH, 
                         f"//div[contains(@class, 'pagination-button')]/span[text()='{next_page_num}']/..")))
                     
+                    old_items = self.driver.find_elements(By.CSS_SELECTOR, "section.news-summary")
                     self.driver.execute_script("arguments[0].click();", next_button)
                     
                     # Wait for content to update with longer timeout
@@ -729,7 +179,7 @@ class ICHnewsSpider(scrapy.Spider):
                     
                     self.current_page += 1
                     self.logger.info(f"Successfully navigated to page {self.current_page}")
-                    time.sleep(2)  # Increased delay for page to stabilize
+                    wait_stale(self.driver, old_items[0] if old_items else None, site='ich.org')
                     
                 except TimeoutException:
                     self.logger.warning(f"Timed out waiting for page {next_page_num} to load")
@@ -738,7 +188,8 @@ class ICHnewsSpider(scrapy.Spider):
                     self.logger.error(f"Pagination error: {str(e)}")
                     break
         finally:
-            self.driver.quit()
+            driver_pool().release(self.driver)
+        return requests
 
     def parse_selenium_page(self, sel):
         """Parse a page loaded by Selenium"""
@@ -802,7 +253,7 @@ class ICHnewsSpider(scrapy.Spider):
         if ' swissmedic ' in text.lower():
             return "German"
         try:
-            lang_code = detect(text)
+            lang_code = detect_language_code(text, site='ich.org')
             return self.LANGUAGE_NAMES.get(lang_code, f"Unknown ({lang_code})")
         except LangDetectException:
             
@@ -818,26 +269,13 @@ class ICHnewsSpider(scrapy.Spider):
         if not text.strip():
             return []
 
-        matched = set()  # Using set to avoid duplicates
-        
         # Combine title and text for better context
         full_text = f"{title or ''} {text}".lower()
-        
-        for term in self.drug_terms_set:
-            # Skip very short terms to reduce false positives
-            if len(term) < 4:
-                continue
-                
-            # Create a regex pattern that matches whole words only
-            pattern = r'(?<!\w)' + re.escape(term.lower()) + r'(?!\w)'
-            
-            # Search in the full text
-            if re.search(pattern, full_text, flags=re.IGNORECASE):
-                matched.add(term)
-                
-        return list(matched)
+
+        # Terms shorter than 4 characters are skipped by the matcher to reduce false positives
+        return self.drug_matcher.find_all(full_text)
     
-    def generate_summary(self, item):
+    async def generate_summary(self, item):
         """Generate a summary of the content using the summarization pipeline"""
         content = item.get('Content', '')
         if not content:
@@ -846,12 +284,11 @@ class ICHnewsSpider(scrapy.Spider):
         
         try:
             # Generate summary - adjust max_length/min_length as needed
-            summary = self.summarizer(
+            summary = await maybe_deferred_to_future(self.summarizer.summarize_deferred(
                 content,
                 max_length=150,
-                min_length=30,
-                do_sample=False
-            )[0]['summary_text']
+                min_length=30
+            ))
             item['Summary'] = summary
         except Exception as e:
             self.logger.error(f"Summary generation failed: {str(e)}")
@@ -887,17 +324,9 @@ class ICHnewsSpider(scrapy.Spider):
             if "English" in lang:
                 return text
             
-            # Calculate dynamic max_length (input length + buffer)
-            input_length = len(text)
-            max_length = min(input_length + 500, 4096) # 4096 is typical model max
-            
-            # Single translation attempt with dynamic length
-            translated = self.translator(
-                text,
-                max_length=max_length,
-                truncation=True # Allow truncation if absolutely necessary
-            )[0]['translation_text']
-            return translated
+            # Local MarianMT model when RI_TRANSLATION_BACKEND=marian, Google otherwise
+            source = reference.LANGUAGE_CODES.get(lang, 'auto')
+            return translate(text, source=source)
         
         except Exception as e:
             self.logger.error(f"Translation failed: {str(e)}")
@@ -906,11 +335,8 @@ class ICHnewsSpider(scrapy.Spider):
     
     def classify_document_type(self, item):
         """Classify the document type based on text content."""
-        text_lower = f"{item.get('Title', '').lower()} {item.get('Summary', '').lower()} {item.get('Content', '').lower()}"
-        for doc_type, keywords in self.DOCUMENT_TYPES.items():
-            if any(keyword in text_lower for keyword in keywords):
-                return doc_type
-        return "Other Type"
+        text = f"{item.get('Title', '')} {item.get('Summary', '')} {item.get('Content', '')}"
+        return keyword_classifier(document=self.DOCUMENT_TYPES, product=self.PRODUCT_TYPES).classify(text, 'document', default="Other Type")
     
     def format_date(self, date_str):
         """Convert date formats like '22.04.2025' and '6 January 2025' to 'dd/mm/yyyy'"""
@@ -945,29 +371,17 @@ class ICHnewsSpider(scrapy.Spider):
         if not text.strip():
             return []
 
-        mentioned = []
-        text_lower = text.lower()
-        
-        for country, patterns in self.COUNTRY_PATTERNS.items():
-            # Skip special handling for organizations if you want more matches
-            for pattern in patterns:
-                # Use regex with word boundaries for more precise matching
-                if re.search(r'\b' + pattern + r'\b', text_lower):
-                    mentioned.append(country)
-                    break  # No need to check other patterns for this country
-                    
-        return mentioned
+        # One scan with word boundaries over every pattern of every country
+        return country_gazetteer(self.COUNTRY_PATTERNS).detect(text)
 
     
     def infer_primary_country(self, mentioned_countries, text):
         if not mentioned_countries:
             return None
         from collections import Counter
-        text_lower = text.lower()
-        counts = Counter()
-        for country in mentioned_countries:
-            for pattern in self.COUNTRY_PATTERNS[country]:
-                counts[country] += text_lower.count(pattern)
+        # Reuses the hit counts of the scan done by detect_mentioned_countries
+        hits = country_gazetteer(self.COUNTRY_PATTERNS).scan(text)
+        counts = Counter({country: hits[country] for country in mentioned_countries})
         return counts.most_common(1)[0][0] if counts else None
 
     def export_to_excel(self, item):
@@ -994,7 +408,7 @@ class ICHnewsSpider(scrapy.Spider):
         
         self.row_count += 1
 
-    def parse_detail_page(self, response):
+    async def parse_detail_page(self, response):
         item = response.meta['item']
         
         # Extract content - improved selection
@@ -1026,7 +440,7 @@ class ICHnewsSpider(scrapy.Spider):
         )
         item['Regions'] = self.detect_mentioned_regions(item['Mentioned_Countries'])
         
-        self.generate_summary(item)
+        await self.generate_summary(item)
         item['Source URL'] = self.start_urls[0]
         self.export_to_excel(item)
         
@@ -1034,11 +448,7 @@ class ICHnewsSpider(scrapy.Spider):
 
     def classify_product_type(self, text: str) -> str:
         """Classify the product type based on text content."""
-        text_lower = text.lower()
-        for product_type, keywords in self.PRODUCT_TYPES.items():
-            if any(keyword in text_lower for keyword in keywords):
-                return product_type
-        return "Other"
+        return keyword_classifier(document=self.DOCUMENT_TYPES, product=self.PRODUCT_TYPES).classify(text, 'product', default="Other")
 
     def detect_mentioned_regions(self, mentioned_countries):
         """Detect regions based on mentioned countries"""
@@ -1,25 +1,27 @@
 from datetime import datetime
-import os
 import re
 import logging
 from typing import Dict, List, Optional, Tuple, Any, Generator
 from urllib.parse import urljoin
-import fasttext
 import scrapy
 from deep_translator import GoogleTranslator
 from langcodes import Language as Lang
-from langdetect import DetectorFactory, detect
-from sumy.nlp.tokenizers import Tokenizer
-from sumy.parsers.plaintext import PlaintextParser
-from sumy.summarizers.lsa import LsaSummarizer
+from langdetect import DetectorFactory
 from scrapy.http import Response
 import traceback
 from openpyxl import Workbook
 from openpyxl.styles import Font, Alignment, Border, Side
 from openpyxl.utils import get_column_letter
-import pandas as pd
 from scrapy.crawler import CrawlerProcess
 import re
+from common.drug_terms import profile_columns
+from common.term_index import open_term_index
+from common.gazetteer import country_gazetteer
+from common.translation import translate
+from common.language_id import language_identifier
+from common.lsa_summary import lsa_summary
+from common.keyword_classifier import keyword_classifier
+from common import reference
 
 # Initialize language detection
 DetectorFactory.seed = 0
@@ -123,27 +125,12 @@ class DocumentClassifier:
 
 
     def _initialize_drug_lookup(self):
-                # ✅ LOAD drug terms from .tsv file
-        tsv_path = 'https://raw.githubusercontent.com/MariaKlap/Drug-Name-Database/refs/heads/main/drug.target.interaction.tsv'  
-        
-
-        try:
-            df = pd.read_csv(tsv_path, sep='\t')
-        except UnicodeDecodeError:
-            df = pd.read_csv(tsv_path, sep='\t', encoding='ISO-8859-1')
-        print(f"📊 DRUG_NAME column row count (including duplicates and empty): {len(df['DRUG_NAME'])}")
-
-        # Limit to specific columns only
-        allowed_columns = {'DRUG_NAME', 'SWISSPROT', 'ACTION_TYPE', 'TARGET_CLASS', 'TARGET_NAME'}
-        allowed_columns = [col for col in df.columns if col in allowed_columns]
-
-        terms = set()
-        for col in allowed_columns:
-            col_terms = df[col].dropna().astype(str)
-            col_terms = {t.strip().lower() for t in col_terms if len(t.strip()) > 3}
-            terms.update(col_terms)
+        # ✅ LOAD drug terms as a read-only, memory-mapped index shared with other running scrapers
+        allowed_columns = profile_columns('long_terms_no_gene')
+        terms = open_term_index('long_terms_no_gene', boundary='word')
 
         self.drug_terms_set = terms
+        self.drug_matcher = self.drug_terms_set
         print(f"✅ Loaded {len(self.drug_terms_set)} drug terms from TSV columns: {', '.join(allowed_columns)}")
 
     def classify_document(self, text: str) -> Dict[str, str]:
@@ -154,17 +141,14 @@ class DocumentClassifier:
                 'matched_keywords': 'empty text'
             }
             
-        text_lower = text.lower()
-        for doc_type, keywords in self.document_types.items():
-            matched = [
-                kw for kw in keywords 
-                if re.search(rf'\b{re.escape(kw)}\b', text_lower)
-            ]
-            if matched:
-                return {
-                    'document_type': doc_type,
-                    'matched_keywords': ", ".join(matched[:3])
-                }
+        keywords = keyword_classifier('word', document=self.document_types, product=self.product_types)
+            
+        doc_type, matched = keywords.first_match(text, 'document')
+        if matched:
+            return {
+                'document_type': doc_type,
+                'matched_keywords': ", ".join(matched[:3])
+            }
         return {
             'document_type': 'Other Type', 
             'matched_keywords': 'unclassified'
@@ -179,24 +163,17 @@ class DocumentClassifier:
                 'drug_names': 'None'  # Changed from None to 'None'
             }
             
-        text_lower = text.lower()
         drug_names = self.extract_drug_names(text)
         
         # First check specific product types (excluding Drug Product)
-        for product_type, keywords in self.product_types.items():
-            if product_type == 'Drug Product':
-                continue
-                
-            matched = [
-                kw for kw in keywords 
-                if re.search(rf'\b{re.escape(kw)}\b', text_lower)
-            ]
-            if matched:
-                return {
-                    'product_type': product_type,
-                    'product_keywords': ", ".join(matched[:3]),
-                    'drug_names': ", ".join(drug_names) if drug_names != 'None' else 'None'  # Changed handling here
-                }
+        keywords = keyword_classifier('word', document=self.document_types, product=self.product_types)
+        product_type, matched = keywords.first_match(text, 'product', skip=('Drug Product',))
+        if matched:
+            return {
+                'product_type': product_type,
+                'product_keywords': ", ".join(matched[:3]),
+                'drug_names': ", ".join(drug_names) if drug_names != 'None' else 'None'  # Changed handling here
+            }
 
         # Default to Drug Product if drug names found
         if drug_names != 'None':  # Changed condition here
@@ -218,13 +195,7 @@ class DocumentClassifier:
         if not text.strip():
             return []
 
-        matched = []
-        for term in self.drug_terms_set:
-            # Escape regex special chars and match as whole word/phrase
-            pattern = r'\b' + re.escape(term) + r'\b'
-            if re.search(pattern, text, flags=re.IGNORECASE):
-                matched.append(term)
-        return matched
+        return self.drug_matcher.find_all(text)
 
         return sorted(found_terms) if found_terms else 'None'  # Changed from None to 'None'
         
@@ -268,90 +239,13 @@ class DocumentClassifier:
         return criteria_met >= 2
 
 
-    def _get_document_types(self) -> Dict[str, List[str]]:
+    def _get_document_types(self) -> reference.KeywordTable:
         """Return document type classification dictionary with improved keywords."""
-        return {
-            'Announcement': ['announcement', 'notification', 'bulletin'],
-            'Expert Report': ['expert report', 'technical report', 'scientific opinion'],
-            'Amendment': ['amendment', 'regulation change', 'regulatory update'],
-            'Law': ['law', 'legislation', 'statute'],
-            'Directive': ['directive', 'guideline', 'policy'],
-            'Order': ['order', 'decision', 'ruling', 'decree'],
-            'Information Note': ['information note', 'information bulletin', 'notice'],
-            'Q&A': ['questions and answers', 'q&a', 'faq', 'frequently asked'],
-            'Instructions': ['instructions', 'manual', 'guidance', 'procedure'],
-            'Resolution': ['resolution', 'conclusion', 'determination'],
-            'Consultation': ['consultation', 'public hearing', 'stakeholder input'],
-            'Product Info': ['product information', 'package leaflet', 'product update'],
-            'Regulatory Decision': ['regulatory decision', 'approval summary', 'assessment'],
-            'Evaluation': ['evaluation report', 'assessment report', 'review report'],
-            'Recommendation': ['recommendation', 'advice', 'suggestion'],
-            'Checklist': ['checklist', 'verification list', 'review points'],
-            'Approval Tracker': ['approval tracker', 'authorization status', 'timeline'],
-            'CHMP Opinion': ['chmp opinion', 'committee opinion', 'scientific opinion'],
-            'Committee': ['committee', 'working group', 'task force'],
-            'CV': ['curriculum vitae', 'cv', 'resume'],
-            'EPAR': ['epar', 'european public assessment report'],
-            'Letter': ['letter', 'correspondence', 'official communication'],
-            'Meeting': ['meeting', 'conference', 'session'],
-            'Withdrawal': ['withdrawn application', 'cancelled submission'],
-            'Communication': ['communication', 'announcement', 'message'],
-            'Decree': ['decree', 'royal decree', 'official order'],
-            'Form': ['form', 'application form', 'submission form'],
-            'Regulatory History': ['regulatory history', 'dossier history', 'timeline'],
-            'Press Release': ['press release', 'news release', 'media statement'],
-            'Ordinance': ['ordinance', 'local regulation', 'municipal law'],
-            'Advisory Committee': ['advisory committee', 'committee profile'],
-            'Voting': ['voting', 'committee vote', 'decision outcome'],
-            'Petition': ['citizen petition', 'public petition', 'request'],
-            'Federal Register': ['federal register', 'official gazette', 'journal'],
-            'Inspection': ['inspection report', 'audit report', 'site visit'],
-            'SOP': ['sop', 'standard procedure', 'operating protocol'],
-            'BLA Approval': ['bla', 'biologics license application'],
-            'BLA Supplement': ['supplemental bla', 'bla amendment'],
-            'NDA Supplement': ['supplemental nda', 'nda amendment'],
-            '510(k)': ['510(k)', 'premarket notification'],
-            'NDA Approval': ['new drug application'],
-            'Other Type': []
-        }
+        return reference.DOCUMENT_TYPES_STRICT
 
-    def _get_product_types(self) -> Dict[str, List[str]]:
+    def _get_product_types(self) -> reference.KeywordTable:
         """Return product type classification dictionary with improved keywords."""
-        return {
-            'Biological': [
-                'biological', 'biologic', 'monoclonal antibody', 'mab', 
-                'recombinant', 'cell therapy', 'gene therapy', 'blood product', 
-                'plasma derived', 'therapeutic protein', 'insulin', 'erythropoietin',
-                'immunoglobulin', 'stem cell'
-            ],
-            'Drug Product': [
-                'drug product', 'finished product', 'formulation', 'dosage form',
-                'tablet', 'capsule', 'injection', 'solution', 'suspension', 
-                'biopharmaceutical', 'biosimilar', 'cream', 'ointment', 'gel', 
-                'suppository', 'inhalation'
-            ],
-            'Drug Substance': [
-                'drug substance', 'active substance', 'api', 'active ingredient',
-                'bulk drug', 'chemical entity', 'reference standard'
-            ],
-            'Vaccine': [
-                'vaccine', 'vaccination', 'immunization', 'antigen', 'adjuvant',
-                'mmr', 'dtap', 'hpv', 'influenza', 'covid-19', 'sars-cov-2'
-            ],
-            'Small Molecule': [
-                'small molecule', 'chemical drug', 'synthetic', 'organic compound',
-                'nme', 'new molecular entity', 'low molecular weight'
-            ],
-            'Medical Device': [
-                'medical device', 'implant', 'stent', 'catheter', 'prosthesis',
-                'pacemaker', 'defibrillator', 'surgical instrument'
-            ],
-            'IVD': [
-                'ivd', 'in vitro diagnostic', 'diagnostic test', 'assay',
-                'reagent', 'test kit', 'analyzer', 'rapid test'
-            ],
-            'Other': []
-        }
+        return reference.PRODUCT_TYPES_EXTENDED
 
     def translate_text(self, text: str, source_lang: str) -> str:
         """Translate text to English using Google Translate API with improved error handling."""
@@ -376,17 +270,8 @@ class DocumentClassifier:
                 logging.warning(f"No ISO639-1 code for language: {source_lang}")
                 return text
             
-            # Split long text to avoid API limits
-            if len(text) > 5000:
-                parts = [text[i:i+4000] for i in range(0, len(text), 4000)]
-                translated_parts = []
-                for part in parts:
-                    translated = GoogleTranslator(source=lang_code, target='en').translate(part)
-                    if translated:
-                        translated_parts.append(translated)
-                return " ".join(translated_parts)
-            
-            return GoogleTranslator(source=lang_code, target='en').translate(text)
+            # Long text is split at sentence boundaries by translate()
+            return translate(text, source=lang_code)
         except Exception as e:
             logging.warning(f"Translation failed ({source_lang}): {str(e)}")
             return text
@@ -403,19 +288,12 @@ class DocumentProcessor:
             return text
             
         try:
-            # First try fasttext for language detection if available
-            if hasattr(self, 'fasttext_model') and self.fasttext_model:
-                prediction = self.fasttext_model.predict(text.replace("\n", " "))
-                lang_code = prediction[0][0].replace('__label__', '')
-                if lang_code == 'en':
-                    return text
-            else:
-                # Fallback to langdetect
-                if detect(text) == 'en':
-                    return text
+            # Shared fastText model, falling back to langdetect when unsure
+            if language_identifier().detect(text) == 'en':
+                return text
             
             # Translate using deep_translator
-            translation = GoogleTranslator(source='auto', target='en').translate(text)
+            translation = translate(text)
             return translation if translation else text
         except Exception as e:
             logging.warning(f"Translation failed: {e}")
@@ -430,12 +308,8 @@ class CountryDetector:
         self.language_to_country = self._load_language_mapping()
         self.country_tlds = self._load_tld_mapping()
         
-        # Precompile regex patterns for faster matching
-        self.country_regex = {
-            country: [re.compile(rf'\b{re.escape(pattern)}\b', re.IGNORECASE) 
-                     for pattern in patterns]
-            for country, patterns in self.country_patterns.items()
-        }
+        # All country patterns compiled into one gazetteer, scanned once per text
+        self.country_gazetteer = country_gazetteer(self.country_patterns, literal=True)
     
     def translate_to_english(self, text: str) -> str:
         """Helper method to translate text to English."""
@@ -443,19 +317,12 @@ class CountryDetector:
             return text
             
         try:
-            # First try fasttext for language detection if available
-            if hasattr(self, 'fasttext_model') and self.fasttext_model:
-                prediction = self.fasttext_model.predict(text[:500].replace("\n", " "))
-                lang_code = prediction[0][0].replace('__label__', '')
-                if lang_code == 'en':
-                    return text
-            else:
-                # Fallback to langdetect
-                if detect(text[:500]) == 'en':
-                    return text
+            # Shared fastText model, falling back to langdetect when unsure
+            if language_identifier().detect(text[:500]) == 'en':
+                return text
             
             # Translate using deep_translator
-            translation = GoogleTranslator(source='auto', target='en').translate(text)
+            translation = translate(text)
             return translation if translation else text
         except Exception as e:
             logging.warning(f"Translation failed: {e}")
@@ -1068,11 +935,7 @@ class CountryDetector:
             }
             
         text_lower = english_text.lower()
-        mentioned_countries = []
-        
-        for country, patterns in self.country_regex.items():
-            if any(pattern.search(text_lower) for pattern in patterns):
-                mentioned_countries.append(country)
+        mentioned_countries = self.country_gazetteer.detect(text_lower)
         
         # Get unique regions for mentioned countries
         mentioned_regions = list(set(
@@ -1125,9 +988,9 @@ class InfarmedNewsSpider(scrapy.Spider):
         self._initialize_nltk()
         self.classifier = DocumentClassifier()
         self.country_detector = CountryDetector()
-        self.summarizer = LsaSummarizer()
+        self.summarizer = lsa_summary()
         self.summary_sentences = 3
-        self.fasttext_model = self._load_fasttext_model()
+        self.language_id = language_identifier()
         self.exporter = ExcelExporter()
         self.page_count = 0 
         
@@ -1146,29 +1009,6 @@ class InfarmedNewsSpider(scrapy.Spider):
         except Exception as e:
             logging.warning(f"NLTK initialization failed: {e}")
 
-    def _load_fasttext_model(self):
-        """Load FastText language detection model with improved error handling."""
-        try:
-            model_path = os.path.join(os.path.dirname(__file__), 'lid.176.ftz')
-            if os.path.exists(model_path):
-                return fasttext.load_model(model_path)
-            
-            # Try downloading if not found locally
-            import requests
-            url = "https://dl.fbaipublicfiles.com/fasttext/supervised-models/lid.176.ftz"
-            response = requests.get(url, stream=True)
-            if response.status_code == 200:
-                with open(model_path, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        f.write(chunk)
-                return fasttext.load_model(model_path)
-                
-            logging.warning("FastText model download failed")
-            return None
-        except Exception as e:
-            logging.warning(f"Fasttext model error: {e}")
-            return None
-
     def detect_language(self, text: str, context_url: str = "") -> str:
         """More robust language detection with fallbacks."""
         if not text or len(text.strip()) < 3:
@@ -1179,21 +1019,8 @@ class InfarmedNewsSpider(scrapy.Spider):
             return 'Portuguese'
             
         try:
-            # Try FastText first
-            if self.fasttext_model:
-                prediction = self.fasttext_model.predict(text.replace("\n", " "))
-                lang_code = prediction[0][0].replace('__label__', '')
-                try:
-                    lang_name = Lang(lang_code).name
-                    # Handle special cases
-                    if lang_name.lower() == 'portuguese (brazil)':
-                        return 'Portuguese'
-                    return lang_name
-                except:
-                    pass  # Fall through to langdetect
-        
-            # Fallback to langdetect
-            lang_code = detect(text)
+            # Shared fastText model; langdetect only for low-confidence predictions
+            lang_code = self.language_id.detect(text)
             lang_name = Lang(alpha2=lang_code).name
             
             # Special case for Portuguese
@@ -1214,19 +1041,9 @@ class InfarmedNewsSpider(scrapy.Spider):
         if len(text.split()) <= 15:
             return text
         try:
-            try:
-                tokenizer = Tokenizer(language)
-                parser = PlaintextParser.from_string(text, tokenizer)
-                summarizer = LsaSummarizer()
-                summary = summarizer(parser.document, self.summary_sentences)
-                summary_text = " ".join(str(s) for s in summary)
-                
-            except:
-                tokenizer = Tokenizer('english')
-                parser = PlaintextParser.from_string(text, tokenizer)
-                summarizer = LsaSummarizer()
-                summary = summarizer(parser.document, self.summary_sentences)
-                summary_text = " ".join(str(s) for s in summary)
+            # Unsupported languages fall back to English inside the shared summarizer
+            summary = self.summarizer.summarize(text, self.summary_sentences, language)
+            summary_text = " ".join(summary)
             
             return summary_text[:600].rsplit(' ', 1)[0] + ("..." if len(summary_text) > 600 else "")
         except Exception as e:
@@ -0,0 +1,369 @@
+"""Pool of warm Chrome instances shared by the Selenium scrapers.
+
+Starting Chrome takes seconds and each browser-based scraper used to start
+its own in `__init__` and quit it at the end. The pool keeps up to POOL_SIZE
+browsers running for the life of the process. A scraper checks one out, uses
+it like a normal WebDriver and hands it back. Run in one process by
+`common.browser_sweep`, the scrapers share the pool: browser start-up is paid
+once per sweep and up to POOL_SIZE sites render in parallel:
+
+    with driver_pool().checkout(site='who.int') as driver:
+        driver.get(url)
+
+or, for scrapers that hold a driver for their whole run:
+
+    self.driver = driver_pool().acquire(site='who.int')
+    ...
+    driver_pool().release(self.driver)
+
+Scrapy spiders that drive a browser walk their listing on a reactor worker
+thread (`deferToThread` from an async `start`), acquire with
+`timeout=ACQUIRE_TIMEOUT` and release it before yielding: a browser held
+across yields could not come back while another spider waits for one.
+
+Checked-in browsers are reset (extra tabs closed, cookies cleared, blank
+page) and recycled after RECYCLE_AFTER page loads. A browser that fails its
+health check is replaced. The driver path is resolved once per process.
+
+Browsers run headless with the 'eager' page load strategy, and each checkout
+blocks images, fonts, media and third-party trackers for the site through
+DevTools (`Network.setBlockedURLs`); SITE_ALLOWLIST holds per-site exceptions.
+"""
+import atexit
+import functools
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+from common.lazy import timed
+
+POOL_SIZE = int(os.environ.get('RI_DRIVER_POOL_SIZE', '3'))
+RECYCLE_AFTER = int(os.environ.get('RI_DRIVER_MAX_PAGES', '200'))
+HEADLESS = os.environ.get('RI_HEADLESS', '1') != '0'
+# 'eager' returns once the DOM is parsed instead of waiting for every image and script
+PAGE_LOAD_STRATEGY = os.environ.get('RI_PAGE_LOAD_STRATEGY', 'eager')
+BLOCK_RESOURCES = os.environ.get('RI_BLOCK_RESOURCES', '1') != '0'
+PAGE_LOAD_TIMEOUT = 60
+# Longest a caller on the Twisted reactor thread should wait for a free browser:
+# blocking there also stops the spiders that would return one
+ACQUIRE_TIMEOUT = float(os.environ.get('RI_DRIVER_ACQUIRE_TIMEOUT', '120'))
+
+CHROME_PREFS = {
+    "profile.default_content_settings.popups": 0,
+    "profile.content_settings.exceptions.automatic_downloads.*.setting": 1,
+    "profile.default_content_setting_values.automatic_downloads": 1,
+    "profile.default_content_setting_values.popups": 0,
+}
+
+CHROME_ARGUMENTS = (
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-blink-features=AutomationControlled',
+    '--window-size=1366,900',
+)
+
+# Downloads that never carry article text. Stylesheets are kept: Selenium's
+# element text and clickability depend on computed visibility.
+BLOCKED_RESOURCES = (
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.avif', '*.bmp', '*.ico', '*.svg',
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',
+    '*.mp4', '*.webm', '*.ogg', '*.mp3', '*.m4a', '*.wav', '*.mov', '*.m3u8',
+)
+
+# Third-party analytics, ad, social and video hosts (consent managers are left alone,
+# several scrapers click their accept buttons)
+BLOCKED_HOSTS = (
+    '*google-analytics.com*', '*googletagmanager.com*', '*googlesyndication.com*', '*doubleclick.net*',
+    '*googleadservices.com*', '*connect.facebook.net*', '*facebook.com/tr*', '*hotjar.com*',
+    '*clarity.ms*', '*siteimproveanalytics.*', '*matomo.cloud*', '*piwik.pro*', '*newrelic.com*',
+    '*nr-data.net*', '*youtube.com/embed*', '*youtube-nocookie.com*', '*ytimg.com*', '*player.vimeo.com*',
+    '*platform.twitter.com*', '*snap.licdn.com*', '*addthis.com*', '*sharethis.com*',
+)
+
+# Patterns a site needs despite the lists above, keyed by the site name the
+# scrapers pass to acquire(); None disables blocking for the site. Blocking keeps
+# the elements in the DOM, so readiness selectors and extracted text never need
+# an exception (none of them use images, SVG or embeds). Native clicks do: an
+# icon-only control must render its icon to have a size Selenium can click.
+SITE_ALLOWLIST: Dict[str, Optional[Tuple[str, ...]]] = {
+    # Kendo pager arrows (a.k-pager-nav) are icon-font or SVG glyphs without text
+    'who.int': ('*.svg', '*.woff', '*.woff2', '*.ttf'),
+    # 'Neste side' (button#next-button) is an icon-only button
+    'dmp.no': ('*.svg',),
+}
+
+logger = logging.getLogger(__name__)
+
+
+def blocked_urls(site: Optional[str] = None) -> List[str]:
+    """URL patterns blocked for a site"""
+    if not BLOCK_RESOURCES or (site in SITE_ALLOWLIST and SITE_ALLOWLIST[site] is None):
+        return []
+    allowed = set(SITE_ALLOWLIST.get(site) or ())
+    return [pattern for pattern in BLOCKED_RESOURCES + BLOCKED_HOSTS if pattern not in allowed]
+
+
+def apply_profile(driver, site: Optional[str] = None):
+    """Block the heavy resources and trackers for a site through the DevTools protocol"""
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': blocked_urls(site)})
+    except Exception as e:
+        logger.debug(f"Could not set blocked URLs: {e}")
+
+
+def chrome_options(page_load_strategy: str = PAGE_LOAD_STRATEGY, headless: bool = HEADLESS):
+    """Chrome options shared by all pooled browsers"""
+    from selenium.webdriver.chrome.options import Options
+
+    options = Options()
+    options.page_load_strategy = page_load_strategy
+    options.add_experimental_option("prefs", CHROME_PREFS)
+    for argument in CHROME_ARGUMENTS:
+        options.add_argument(argument)
+    if headless:
+        options.add_argument('--headless=new')
+    return options
+
+
+@functools.lru_cache(maxsize=None)
+def _driver_path() -> Optional[str]:
+    try:
+        from webdriver_manager.chrome import ChromeDriverManager
+    except ImportError:
+        return None  # Selenium Manager finds the driver
+    with timed('chromedriver install'):
+        return ChromeDriverManager().install()
+
+
+def new_driver(page_load_strategy: str = PAGE_LOAD_STRATEGY):
+    """Start a Chrome instance (not pooled)"""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+
+    path = _driver_path()
+    service = Service(path) if path else Service()
+    with timed('chrome start'):
+        driver = webdriver.Chrome(service=service, options=chrome_options(page_load_strategy))
+    driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+    return driver
+
+
+class PooledDriver:
+    """A pooled WebDriver; behaves like the driver, counts page loads, and `quit()` returns it to the pool"""
+
+    def __init__(self, pool: 'DriverPool', driver):
+        self._pool = pool
+        self._driver = driver
+        self.pages = 0
+        self.site = None
+        self.owner = None  # thread that checked it out
+        self.started = time.monotonic()
+
+    def get(self, url: str):
+        self.pages += 1
+        return self._driver.get(url)
+
+    def quit(self):
+        self._pool.release(self)
+
+    @property
+    def wrapped_driver(self):
+        return self._driver
+
+    def __getattr__(self, name):
+        return getattr(self._driver, name)
+
+
+class DriverPool:
+    """Up to `size` Chrome instances, started on demand and reused across scrapers"""
+
+    def __init__(self, size: int = POOL_SIZE, recycle_after: int = RECYCLE_AFTER,
+                 page_load_strategy: str = PAGE_LOAD_STRATEGY):
+        self.size = max(1, size)
+        self.recycle_after = recycle_after
+        self.page_load_strategy = page_load_strategy
+        self._idle: List[PooledDriver] = []
+        self._busy = set()
+        self._starting = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self.started = 0
+        self.recycled = 0
+
+    def _start(self) -> PooledDriver:
+        self.started += 1
+        return PooledDriver(self, new_driver(self.page_load_strategy))
+
+    @staticmethod
+    def _healthy(driver: PooledDriver) -> bool:
+        try:
+            driver.execute_script('return 1')
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _dispose(driver: PooledDriver):
+        try:
+            driver.wrapped_driver.quit()
+        except Exception as e:
+            logger.debug(f"Error quitting browser: {e}")
+
+    def acquire(self, site: Optional[str] = None, timeout: Optional[float] = None) -> PooledDriver:
+        """A healthy browser with the site's blocking profile; waits for one if the pool is exhausted"""
+        driver = self._take(timeout)
+        apply_profile(driver, site)
+        driver.site = site
+        driver.owner = threading.get_ident()
+        return driver
+
+    def _take(self, timeout: Optional[float]) -> PooledDriver:
+        """A healthy browser, started if the pool is not full; waits for one to be returned otherwise"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._cond:
+                while True:
+                    if self._closed:
+                        raise RuntimeError("Driver pool is closed")
+                    if self._idle:
+                        driver = self._idle.pop()
+                        start = False
+                        break
+                    if len(self._busy) + self._starting < self.size:
+                        self._starting += 1
+                        driver, start = None, True
+                        break
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise TimeoutError(f"No browser free after {timeout}s")
+                    self._cond.wait(remaining)
+
+            if start:
+                try:
+                    driver = self._start()
+                finally:
+                    with self._cond:
+                        self._starting -= 1
+                        if driver is not None:
+                            self._busy.add(driver)
+                        self._cond.notify()
+                return driver
+
+            if self._healthy(driver):
+                with self._cond:
+                    self._busy.add(driver)
+                return driver
+            logger.warning("Discarding unresponsive browser")
+            self._dispose(driver)
+            with self._cond:
+                self._cond.notify()
+
+    def _reset(self, driver: PooledDriver) -> bool:
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+            # delete_all_cookies() only covers the current document's domain
+            driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+            driver.wrapped_driver.get('about:blank')
+            driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+            return True
+        except Exception as e:
+            logger.debug(f"Browser reset failed: {e}")
+            return False
+
+    def release(self, driver: PooledDriver, discard: bool = False):
+        """Return a browser; it is quit instead if discarded, worn out or broken"""
+        with self._cond:
+            if driver not in self._busy:
+                return
+            self._busy.discard(driver)
+        keep = not discard and not self._closed and driver.pages < self.recycle_after and self._reset(driver)
+        if not keep:
+            if driver.pages >= self.recycle_after:
+                self.recycled += 1
+            self._dispose(driver)
+        with self._cond:
+            if keep:
+                self._idle.append(driver)
+            self._cond.notify()
+
+    def release_held(self, thread_id: Optional[int] = None):
+        """Return every browser a thread (default: this one) still has checked out"""
+        thread_id = threading.get_ident() if thread_id is None else thread_id
+        with self._cond:
+            held = [driver for driver in self._busy if driver.owner == thread_id]
+        for driver in held:
+            self.release(driver, discard=not self._healthy(driver))
+
+    @contextmanager
+    def checkout(self, site: Optional[str] = None, timeout: Optional[float] = None):
+        """Borrow a browser for the duration of the block"""
+        driver = self.acquire(site, timeout)
+        try:
+            yield driver
+        except Exception:
+            self.release(driver, discard=not self._healthy(driver))
+            raise
+        else:
+            self.release(driver)
+
+    def warm(self, count: Optional[int] = None):
+        """Start browsers in parallel ahead of use, up to `count` (default: the pool size)"""
+        count = min(self.size, count or self.size)
+        drivers = []
+
+        def start():
+            drivers.append(self.acquire())
+
+        threads = [threading.Thread(target=start) for _ in range(count - len(self._idle) - len(self._busy))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for driver in drivers:
+            self.release(driver)
+
+    def close(self, include_busy: bool = False):
+        """Quit every idle browser (and checked-out ones with include_busy); others are quit when returned"""
+        with self._cond:
+            self._closed = True
+            drivers, self._idle = self._idle, []
+            if include_busy:
+                drivers += list(self._busy)
+                self._busy.clear()
+            self._cond.notify_all()
+        for driver in drivers:
+            self._dispose(driver)
+
+    def stats(self) -> Dict[str, int]:
+        with self._cond:
+            return {'idle': len(self._idle), 'busy': len(self._busy), 'started': self.started,
+                    'recycled': self.recycled}
+
+
+_pools: Dict[str, DriverPool] = {}
+_pools_lock = threading.Lock()
+
+
+def driver_pool(page_load_strategy: str = PAGE_LOAD_STRATEGY) -> DriverPool:
+    """Process-wide pool of browsers with the given page load strategy"""
+    with _pools_lock:
+        pool = _pools.get(page_load_strategy)
+        if pool is None:
+            pool = _pools[page_load_strategy] = DriverPool(page_load_strategy=page_load_strategy)
+        return pool
+
+
+@atexit.register
+def _close_pools():
+    for strategy, pool in list(_pools.items()):
+        stats = pool.stats()
+        logger.info(f"Browser pool ({strategy}): {stats['started']} started, {stats['recycled']} recycled")
+        pool.close(include_busy=True)
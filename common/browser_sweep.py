@@ -0,0 +1,78 @@
+"""Run the Selenium scrapers in one process against one browser pool.
+
+Run one by one as scripts, every Selenium scraper started its own process
+with a pool of one browser, so Chrome start-up was paid per site and the
+sites rendered one after another. The sweep loads the scripts into one
+process, starts the pool's browsers in parallel and runs each script's
+`main()` on a worker thread, one thread per pooled browser:
+
+    python -m common.browser_sweep              # every script in BROWSER_SCRIPTS
+    python -m common.browser_sweep CY.py DE.py  # just these
+
+A script that fails is logged and does not stop the others; any browser it
+still holds goes back to the pool.
+"""
+import logging
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Sequence
+
+from common.browser import driver_pool
+from common.lazy import mark
+
+BROWSER_SCRIPTS = (
+    'CY.py', 'DE.py', 'FDAnews.py', 'FInew.py', 'GMP.py', 'IE.py', 'Luxnews.py', 'Maltanews.py',
+    'Norwnews (2).py', 'SEn.py', 'SEns.py', 'SEnsa.py', 'WHOnews.py', 'raps-2.py',
+)
+
+logger = logging.getLogger(__name__)
+
+
+def run_script(module) -> bool:
+    """Run a loaded script's main() on this thread; False if it raised"""
+    name = os.path.basename(module.__file__)
+    try:
+        module.main()
+        mark(f"{name} finished")
+        return True
+    except Exception:
+        logger.exception(f"❌ {name} failed")
+        return False
+    finally:
+        driver_pool().release_held()
+
+
+def run_scripts(scripts: Sequence[str] = BROWSER_SCRIPTS, workers: Optional[int] = None) -> Dict[str, bool]:
+    """Run the scripts side by side, as many at a time as the pool has browsers"""
+    # Imported here: the sweep only borrows the script loader, not the Scrapy orchestrator
+    from common.crawl import load_script
+
+    modules = {}
+    for script in scripts:
+        try:
+            modules[script] = load_script(script)
+        except Exception as e:
+            logger.error(f"❌ Could not load {script}: {e}")
+    if not modules:
+        return {script: False for script in scripts}
+
+    pool = driver_pool()
+    workers = max(1, min(workers or pool.size, len(modules)))
+    pool.warm(workers)
+    mark('browser sweep start')
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='scraper') as executor:
+        results = dict(zip(modules, executor.map(run_script, modules.values())))
+    return {script: results.get(script, False) for script in scripts}
+
+
+def main(argv: Sequence[str] = ()) -> int:
+    results = run_scripts(argv or BROWSER_SCRIPTS)
+    for script, ok in results.items():
+        logger.info(f"{'✅' if ok else '❌'} {script}")
+    return 0 if all(results.values()) else 1
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,147 @@
+"""Run every Scrapy spider in one process.
+
+Each spider script starts its own CrawlerProcess when run directly. A sweep
+over all of them runs the spiders side by side on one reactor instead, so it
+takes about as long as the slowest site rather than the sum of all sites, and
+the process-wide resources (the memory-mapped drug index, compiled keyword
+classifiers and gazetteers, the translation and summary caches, the NER
+worker) are loaded once and shared by every spider.
+
+Politeness stays per site: Scrapy keeps one download slot per domain, the
+spider's own `custom_settings` (DOWNLOAD_DELAY etc.) still apply to it, and
+SITE_BUDGETS can tighten or relax a single spider without editing its script.
+
+    python -m common.crawl                # every script in SPIDER_SCRIPTS
+    python -m common.crawl AT.py MHRA.py  # just these
+"""
+import importlib.util
+import inspect
+import logging
+import os
+import re
+import sys
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Type
+
+import scrapy
+from scrapy.crawler import CrawlerProcess
+
+from common.lazy import mark
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SPIDER_SCRIPTS = (
+    'AT.py', 'ICR.py', 'EC-Updates.py', 'EC-Medical.py', 'ECnews11.py', 'EMAnews2.py', 'HMA6news.py',
+    'MHRA.py', 'MHRANews.py', 'MHRAPolicy.py', 'RQAnews4.py', 'Topra.py', 'BEnews1.py', 'DK3newswin.py',
+    'CBGnewsfinal5win.py', 'Infarmed6news.py', 'IS1.py', 'ICHnews.py', 'SWISS5.py',
+)
+
+# Process-wide limits; a spider's custom_settings override the per-domain ones
+SWEEP_SETTINGS = {
+    'CONCURRENT_REQUESTS': 64,
+    'CONCURRENT_REQUESTS_PER_DOMAIN': 4,
+    'DOWNLOAD_DELAY': 1,
+    'RANDOMIZE_DOWNLOAD_DELAY': True,
+    'AUTOTHROTTLE_ENABLED': True,
+    'AUTOTHROTTLE_TARGET_CONCURRENCY': 2.0,
+    'REACTOR_THREADPOOL_MAXSIZE': 20,
+    'TELNETCONSOLE_ENABLED': False,
+    'LOG_LEVEL': 'INFO',
+}
+
+# Per-spider overrides, keyed by spider name, applied on top of its custom_settings.
+# Every spider gets its own downloader, so spiders that share a host each get a
+# slot of their own there: their budgets split what one polite client would use.
+SITE_BUDGETS: Dict[str, Dict[str, object]] = {
+    # health.ec.europa.eu, three spiders
+    'EC-Updates': {'CONCURRENT_REQUESTS_PER_DOMAIN': 1, 'DOWNLOAD_DELAY': 2},
+    'EC': {'CONCURRENT_REQUESTS_PER_DOMAIN': 1, 'DOWNLOAD_DELAY': 2},
+    'ECnews11': {'CONCURRENT_REQUESTS_PER_DOMAIN': 1, 'DOWNLOAD_DELAY': 2},
+    # www.gov.uk answers bursts with 429, two spiders
+    'MHRANews': {'CONCURRENT_REQUESTS_PER_DOMAIN': 1, 'DOWNLOAD_DELAY': 3},
+    'MHRAPolicy': {'CONCURRENT_REQUESTS_PER_DOMAIN': 1, 'DOWNLOAD_DELAY': 3},
+    # www.ema.europa.eu rate-limits (EMAnews2 handles its 429s)
+    'EMA2': {'CONCURRENT_REQUESTS_PER_DOMAIN': 1, 'DOWNLOAD_DELAY': 3, 'AUTOTHROTTLE_TARGET_CONCURRENCY': 1.0},
+    # Slow sites that time out under load and retry 429s
+    'DK3': {'CONCURRENT_REQUESTS_PER_DOMAIN': 2, 'DOWNLOAD_TIMEOUT': 90},
+    'infarmed7': {'CONCURRENT_REQUESTS_PER_DOMAIN': 2, 'AUTOTHROTTLE_TARGET_CONCURRENCY': 1.0},
+}
+
+logger = logging.getLogger(__name__)
+
+
+def load_script(path: str):
+    """Import a spider script by path (the file names are not valid module names)"""
+    path = os.path.join(SCRIPTS_DIR, path) if not os.path.isabs(path) else path
+    module_name = 'spider_' + re.sub(r'\W', '_', os.path.splitext(os.path.basename(path))[0])
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[module_name]
+        raise
+    return module
+
+
+def script_spiders(path: str) -> List[Type[scrapy.Spider]]:
+    """Spider classes defined in a script"""
+    module = load_script(path)
+    return [cls for _, cls in inspect.getmembers(module, inspect.isclass)
+            if issubclass(cls, scrapy.Spider) and cls.__module__ == module.__name__ and getattr(cls, 'name', None)]
+
+
+def with_budget(spider_cls: Type[scrapy.Spider], budget: Optional[Mapping[str, object]]) -> Type[scrapy.Spider]:
+    """The spider class, or a subclass whose custom_settings include the budget"""
+    if not budget:
+        return spider_cls
+    settings = {**(spider_cls.custom_settings or {}), **budget}
+    return type(spider_cls.__name__, (spider_cls,), {'custom_settings': settings})
+
+
+def crawl(spiders: Iterable[Type[scrapy.Spider]], settings: Optional[Mapping[str, object]] = None,
+          budgets: Optional[Mapping[str, Mapping[str, object]]] = None) -> Dict[str, str]:
+    """Run the spiders concurrently in one reactor; returns each spider's finish reason"""
+    budgets = SITE_BUDGETS if budgets is None else budgets
+    process = CrawlerProcess({**SWEEP_SETTINGS, **(settings or {})})
+    crawlers = []
+    for spider_cls in spiders:
+        crawler = process.create_crawler(with_budget(spider_cls, budgets.get(spider_cls.name)))
+        crawlers.append(crawler)
+        process.crawl(crawler)
+
+    mark('crawl start')
+    process.start()
+    mark('crawl finished')
+
+    results = {}
+    for crawler in crawlers:
+        stats = crawler.stats.get_stats() if crawler.stats else {}
+        results[crawler.spidercls.name] = stats.get('finish_reason', 'not started')
+    return results
+
+
+def crawl_scripts(scripts: Sequence[str] = SPIDER_SCRIPTS, **kwargs) -> Dict[str, str]:
+    """Load the spiders of the given scripts and run them all in one sweep"""
+    spiders = []
+    for script in scripts:
+        try:
+            spiders.extend(script_spiders(script))
+        except Exception as e:
+            logger.error(f"❌ Could not load {script}: {e}")
+    return crawl(spiders, **kwargs)
+
+
+def main(argv: Sequence[str] = ()) -> int:
+    results = crawl_scripts(argv or SPIDER_SCRIPTS)
+    for name, reason in results.items():
+        logger.info(f"{'✅' if reason == 'finished' else '❌'} {name}: {reason}")
+    return 0 if all(reason == 'finished' for reason in results.values()) else 1
+
+
+if __name__ == '__main__':
+    # Scripts that import common.crawl must get this module, not a second copy of its state
+    sys.modules.setdefault('common.crawl', sys.modules[__name__])
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,89 @@
+"""In-process extraction from a snapshot of the browser's DOM.
+
+Every `find_element`, `.text` and `get_attribute` on a WebElement is a
+wire-protocol round trip to chromedriver, so reading a listing field by field
+costs rows x fields round trips. `snapshot()` takes `driver.page_source`
+once and returns a Scrapy `Selector`; everything after that runs in lxml:
+
+    page = snapshot(self.driver)
+    for row in page.xpath("//table[@id='DataTables_Table_0']/tbody/tr"):
+        title = text_of(row, './td[@tabindex]/a')
+        link = url_of(row, './td[2]/a/@href', page_url, default=None)
+
+Queries starting with '/', '(', './' or '..' are XPath, anything else CSS.
+Like `find_element`, `text_of` and `url_of` raise when nothing matches,
+unless a default is given. The snapshot does not follow later changes to the
+page: take a new one after clicks and pagination.
+"""
+from typing import Any, Optional
+from urllib.parse import urljoin
+
+# Tags whose text a browser does not render, and tags that start a new line in innerText
+_SKIPPED_TAGS = frozenset({'script', 'style', 'noscript', 'template', 'head'})
+_BLOCK_TAGS = frozenset({
+    'address', 'article', 'aside', 'blockquote', 'dd', 'div', 'dl', 'dt', 'fieldset', 'figcaption', 'figure',
+    'footer', 'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header', 'hr', 'li', 'main', 'nav', 'ol', 'p', 'pre',
+    'section', 'table', 'td', 'th', 'tr', 'ul',
+})
+
+_MISSING = object()
+
+
+def snapshot(driver):
+    """Selector over the driver's current DOM, taken in one round trip"""
+    from scrapy import Selector
+
+    return Selector(text=driver.page_source)
+
+
+def select(node, query: str):
+    """Matches of an XPath or CSS query below node"""
+    if query.startswith(('/', '(', './', '..')):
+        return node.xpath(query)
+    return node.css(query)
+
+
+def element_text(node) -> str:
+    """Text of a Selector node laid out like Selenium's `element.text`: one line per block element"""
+    parts = []
+
+    def walk(element):
+        tag = element.tag.lower() if isinstance(element.tag, str) else None
+        if tag is not None and tag not in _SKIPPED_TAGS:
+            block = tag in _BLOCK_TAGS
+            if block or tag == 'br':
+                parts.append('\n')
+            if element.text:
+                parts.append(element.text)
+            for child in element:
+                walk(child)
+            if block:
+                parts.append('\n')
+        if element.tail and element is not node.root:
+            parts.append(element.tail)
+
+    if isinstance(node.root, str):
+        return node.root.strip()
+    walk(node.root)
+    lines = (' '.join(line.split()) for line in ''.join(parts).split('\n'))
+    return '\n'.join(line for line in lines if line)
+
+
+def text_of(node, query: str, default: Any = _MISSING) -> str:
+    """Text of the first match of query, like `find_element(...).text.strip()`"""
+    matches = select(node, query)
+    if not matches:
+        if default is _MISSING:
+            raise LookupError(f"No element matches {query}")
+        return default
+    return element_text(matches[0])
+
+
+def url_of(node, query: str, base_url: str, default: Any = _MISSING) -> Optional[str]:
+    """Absolute URL from the first attribute matched by query, like `get_attribute('href')`"""
+    value = select(node, query).get()
+    if not value or not value.strip():
+        if default is _MISSING:
+            raise LookupError(f"No URL matches {query}")
+        return default
+    return urljoin(base_url, value.strip())
@@ -0,0 +1,119 @@
+"""Multi-pattern drug term matching with a single Aho-Corasick automaton."""
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+# Boundary modes mirroring the match styles used by the scrapers:
+#   'word'       -> r'\b' + re.escape(term) + r'\b'
+#   'lookaround' -> r'(?<!\w)' + re.escape(term) + r'(?!\w)'
+#   'none'       -> plain substring test (term in text)
+BOUNDARY_MODES = ('word', 'lookaround', 'none')
+
+
+def is_word_char(ch: str) -> bool:
+    """Same definition as the `\\w` class of the `re` module for str patterns"""
+    return ch.isalnum() or ch == '_'
+
+
+class BaseTermMatcher:
+    """Boundary checks and result collection shared by the matcher implementations"""
+
+    boundary = 'lookaround'
+
+    def finditer(self, text: str) -> Iterator[Tuple[int, int, str]]:
+        raise NotImplementedError
+
+    def _boundary_ok(self, text: str, start: int, end: int) -> bool:
+        if self.boundary == 'none':
+            return True
+        before = is_word_char(text[start - 1]) if start > 0 else False
+        after = is_word_char(text[end]) if end < len(text) else False
+        if self.boundary == 'lookaround':
+            return not before and not after
+        # r'\b' on both sides: a transition between word and non-word characters
+        return (before != is_word_char(text[start])) and (after != is_word_char(text[end - 1]))
+
+    def find_all(self, text: str) -> List[str]:
+        """Return the distinct matched terms in order of first occurrence"""
+        seen = {}
+        for _, _, term in self.finditer(text):
+            if term not in seen:
+                seen[term] = True
+        return list(seen)
+
+
+class DrugTermMatcher(BaseTermMatcher):
+    """Find every known term in a text in one linear pass, whole words only.
+
+    Matching is case-insensitive (terms and text are lowercased) and gives the
+    same hits as running one `re.search` per term with the chosen boundary mode.
+    """
+
+    def __init__(self, terms: Iterable[str], boundary: str = 'lookaround', min_length: int = 0):
+        if boundary not in BOUNDARY_MODES:
+            raise ValueError(f"Unknown boundary mode: {boundary}")
+        self.boundary = boundary
+        self.min_length = min_length
+
+        unique_terms = {t.lower() for t in terms if t and len(t) >= min_length}
+        self.terms: List[str] = sorted(unique_terms)
+
+        self._goto: List[Dict[str, int]] = [{}]
+        self._term_at: List[int] = [-1]
+        self._fail: List[int] = [0]
+        self._dict_link: List[int] = [0]
+        self._build()
+
+    def __len__(self):
+        return len(self.terms)
+
+    def _build(self):
+        goto, term_at = self._goto, self._term_at
+        for idx, term in enumerate(self.terms):
+            node = 0
+            for ch in term:
+                nxt = goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[node][ch] = nxt
+                    goto.append({})
+                    term_at.append(-1)
+                node = nxt
+            term_at[node] = idx
+
+        # Breadth-first pass for failure links and output (dictionary suffix) links
+        fail = [0] * len(goto)
+        dict_link = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in goto[node].items():
+                f = fail[node]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                target = goto[f].get(ch, 0)
+                fail[child] = target if target != child else 0
+                link = fail[child]
+                dict_link[child] = link if term_at[link] >= 0 else dict_link[link]
+                queue.append(child)
+        self._fail = fail
+        self._dict_link = dict_link
+
+    def finditer(self, text: str) -> Iterator[Tuple[int, int, str]]:
+        """Yield (start, end, term) for each whole-word occurrence in the lowercased text"""
+        if not text or not self.terms:
+            return
+        text = text.lower()
+        goto, fail, term_at, dict_link = self._goto, self._fail, self._term_at, self._dict_link
+        terms = self.terms
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            out = node if term_at[node] >= 0 else dict_link[node]
+            while out:
+                term = terms[term_at[out]]
+                start = i + 1 - len(term)
+                if self._boundary_ok(text, start, i + 1):
+                    yield start, i + 1, term
+                out = dict_link[out]
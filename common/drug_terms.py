@@ -0,0 +1,259 @@
+"""Local, versioned cache of the drug-target TSV and its preprocessed term sets.
+
+The raw TSV is revalidated against GitHub with ETag / Last-Modified headers at
+most once per `max_age` seconds. Each filter profile is stored as a ready-made
+JSON list of terms next to the TSV, keyed by the TSV content hash, so scrapers
+load their term set without pandas and usually without touching the network.
+
+Set RI_DRUG_TERMS_OFFLINE=1 to never contact the network (the cache must exist),
+and RI_CACHE_DIR to move the cache away from ~/.cache/ri.
+"""
+import csv
+import gzip
+import hashlib
+import io
+import json
+import logging
+import os
+import tempfile
+import time
+from typing import Dict, Optional, Set
+
+import requests
+
+from common.paths import cache_root
+
+DRUG_TSV_URL = 'https://raw.githubusercontent.com/MariaKlap/Drug-Name-Database/refs/heads/main/drug.target.interaction.tsv'
+
+# Column selection and length filter used by each group of scrapers
+DRUG_TERM_PROFILES = {
+    # FDAnews, ICHnews, ECnews11: every non-empty value
+    'all_terms': {
+        'columns': ('DRUG_NAME', 'GENE', 'SWISSPROT', 'ACTION_TYPE', 'TARGET_CLASS', 'TARGET_NAME'),
+        'min_length': 1,
+    },
+    # Scrapy spiders such as AT, EMAnews2, GMP, WHOnews: values longer than 3 characters
+    'long_terms': {
+        'columns': ('DRUG_NAME', 'GENE', 'SWISSPROT', 'ACTION_TYPE', 'TARGET_CLASS', 'TARGET_NAME'),
+        'min_length': 4,
+    },
+    # Selenium scrapers such as DE, CY, MHRA, SEn: as above without the GENE column
+    'long_terms_no_gene': {
+        'columns': ('DRUG_NAME', 'SWISSPROT', 'ACTION_TYPE', 'TARGET_CLASS', 'TARGET_NAME'),
+        'min_length': 4,
+    },
+}
+
+DEFAULT_MAX_AGE = 6 * 60 * 60
+
+# Values that pandas.read_csv treats as missing by default
+_NA_VALUES = {
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND',
+    '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null',
+}
+
+logger = logging.getLogger(__name__)
+
+
+class DrugTermCacheError(RuntimeError):
+    """Raised when no usable copy of the drug TSV is available"""
+
+
+def default_cache_dir() -> str:
+    return os.path.join(cache_root(), 'drug_terms')
+
+
+def is_offline() -> bool:
+    return os.environ.get('RI_DRUG_TERMS_OFFLINE', '').lower() in ('1', 'true', 'yes')
+
+
+def atomic_write(path: str, data: bytes):
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.tmp-')
+    try:
+        with os.fdopen(fd, 'wb') as fh:
+            fh.write(data)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def extract_terms(raw: bytes, columns, min_length: int = 1) -> Set[str]:
+    """Apply a profile filter to the raw TSV bytes (same rules as the old pandas code)"""
+    try:
+        text = raw.decode('utf-8')
+    except UnicodeDecodeError:
+        text = raw.decode('ISO-8859-1')
+
+    reader = csv.DictReader(io.StringIO(text), delimiter='\t')
+    wanted = [col for col in (reader.fieldnames or []) if col in columns]
+
+    terms = set()
+    for row in reader:
+        for col in wanted:
+            value = row.get(col)
+            if value is None or value in _NA_VALUES:
+                continue
+            value = value.strip()
+            if len(value) >= min_length:
+                terms.add(value.lower())
+    return terms
+
+
+class DrugTermCache:
+    """On-disk copy of the drug TSV with conditional revalidation"""
+
+    def __init__(self, cache_dir: Optional[str] = None, url: str = DRUG_TSV_URL,
+                 max_age: int = DEFAULT_MAX_AGE, offline: Optional[bool] = None, timeout: int = 30):
+        self.cache_dir = cache_dir or default_cache_dir()
+        self.url = url
+        self.max_age = max_age
+        self.offline = is_offline() if offline is None else offline
+        self.timeout = timeout
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        self.meta_path = os.path.join(self.cache_dir, 'meta.json')
+        self.tsv_path = os.path.join(self.cache_dir, 'drug.target.interaction.tsv.gz')
+
+    # ---- metadata -------------------------------------------------------
+
+    def _read_meta(self) -> Dict:
+        try:
+            with open(self.meta_path, encoding='utf-8') as fh:
+                return json.load(fh)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_meta(self, meta: Dict):
+        atomic_write(self.meta_path, json.dumps(meta, indent=2).encode('utf-8'))
+
+    def _has_tsv(self) -> bool:
+        return os.path.exists(self.tsv_path)
+
+    def _read_tsv(self) -> bytes:
+        with gzip.open(self.tsv_path, 'rb') as fh:
+            return fh.read()
+
+    def _terms_path(self, profile: str, version: str) -> str:
+        return os.path.join(self.cache_dir, f'terms-{profile}-{version[:16]}.json')
+
+    # ---- revalidation ---------------------------------------------------
+
+    def refresh(self, force: bool = False) -> Dict:
+        """Revalidate the cached TSV against the remote copy and return the metadata"""
+        meta = self._read_meta()
+        fresh = time.time() - meta.get('checked_at', 0) < self.max_age
+        if self.offline or (fresh and not force and self._has_tsv()):
+            if not self._has_tsv():
+                raise DrugTermCacheError(f"Offline mode and no cached drug TSV in {self.cache_dir}")
+            return meta
+
+        headers = {}
+        if self._has_tsv() and meta.get('url') == self.url:
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+
+        try:
+            response = requests.get(self.url, headers=headers, timeout=self.timeout)
+        except requests.RequestException as e:
+            if self._has_tsv():
+                logger.warning(f"Drug TSV revalidation failed ({e}); using cached version {meta.get('version', '?')[:12]}")
+                return meta
+            raise DrugTermCacheError(f"Cannot download drug TSV and no cache available: {e}") from e
+
+        if response.status_code == 304:
+            meta['checked_at'] = time.time()
+            self._write_meta(meta)
+            logger.info("Drug TSV not modified; using cached copy")
+            return meta
+
+        if response.status_code != 200:
+            if self._has_tsv():
+                logger.warning(f"Drug TSV request returned HTTP {response.status_code}; using cached copy")
+                return meta
+            raise DrugTermCacheError(f"Drug TSV request returned HTTP {response.status_code}")
+
+        raw = response.content
+        version = hashlib.sha256(raw).hexdigest()
+        if version != meta.get('version') or not self._has_tsv():
+            atomic_write(self.tsv_path, gzip.compress(raw))
+            self._prune(keep_version=version)
+            logger.info(f"Drug TSV updated to version {version[:12]}")
+
+        meta = {
+            'url': self.url,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'version': version,
+            'checked_at': time.time(),
+        }
+        self._write_meta(meta)
+        return meta
+
+    def _prune(self, keep_version: str):
+        """Remove term files derived from older TSV versions"""
+        suffix = f'-{keep_version[:16]}.json'
+        for name in os.listdir(self.cache_dir):
+            if name.startswith('terms-') and not name.endswith(suffix):
+                try:
+                    os.remove(os.path.join(self.cache_dir, name))
+                except OSError:
+                    pass
+
+    def version(self) -> str:
+        """Content hash of the cached TSV, revalidating first when stale"""
+        meta = self.refresh()
+        return meta.get('version') or hashlib.sha256(self._read_tsv()).hexdigest()
+
+    # ---- term sets ------------------------------------------------------
+
+    def terms(self, profile: str = 'long_terms') -> Set[str]:
+        """Return the preprocessed term set for a profile, building it on first use"""
+        if profile not in DRUG_TERM_PROFILES:
+            raise ValueError(f"Unknown drug term profile: {profile}")
+
+        path = self._terms_path(profile, self.version())
+
+        if os.path.exists(path):
+            try:
+                with open(path, encoding='utf-8') as fh:
+                    return set(json.load(fh))
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable term cache {path}: {e}")
+
+        spec = DRUG_TERM_PROFILES[profile]
+        terms = extract_terms(self._read_tsv(), spec['columns'], spec['min_length'])
+        atomic_write(path, json.dumps(sorted(terms), ensure_ascii=False).encode('utf-8'))
+        return terms
+
+
+_default_cache = None
+
+
+def load_drug_terms(profile: str = 'long_terms', offline: Optional[bool] = None) -> Set[str]:
+    """Load the drug term set for a profile from the shared local cache"""
+    global _default_cache
+    if _default_cache is None or (offline is not None and offline != _default_cache.offline):
+        _default_cache = DrugTermCache(offline=offline)
+    return _default_cache.terms(profile)
+
+
+def profile_columns(profile: str):
+    return DRUG_TERM_PROFILES[profile]['columns']
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Refresh the local drug term cache')
+    parser.add_argument('--force', action='store_true', help='revalidate even if the cache is fresh')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    cache = DrugTermCache()
+    meta = cache.refresh(force=args.force)
+    for name in DRUG_TERM_PROFILES:
+        print(f"✅ {name}: {len(cache.terms(name))} terms (version {meta.get('version', '?')[:12]})")
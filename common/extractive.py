@@ -0,0 +1,142 @@
+"""Frequency-based extractive summaries.
+
+Sentences are scored by the corpus frequency of their words (3+ letters),
+boosted for each distinct agency abbreviation they mention, and the best ones
+are packed into a word budget. The text is tokenized once: every word gets an
+integer ID and the index of its sentence, so sentence scores are a single
+weighted `bincount` (the term-frequency matrix times the word weights) and
+abbreviations come from one compiled pattern instead of a search per term.
+
+    summary = extractive_summary(text, word_limit=40)
+"""
+import re
+import threading
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+DEFAULT_BOOST_TERMS = ('ema', 'eu', 'hma', 'atmp')
+DEFAULT_BOOST = 0.3
+
+# Sentence ends after . or ?, but not after initials ("e.g.") or "Dr."-style titles
+SENTENCE_SPLIT_RE = re.compile(r'(?<!\w\.\w.)(?<![A-Z][a-z]\.)(?<=\.|\?)\s')
+WORD_RE = re.compile(r'\b\w{3,}\b')
+
+ABBR_TAGS = ('abbr', 'acronym')
+
+
+def _collect_text(element, pieces: List[str]):
+    for child in element:
+        if not isinstance(child.tag, str):
+            pass  # comments and processing instructions
+        elif child.tag in ABBR_TAGS and child.text and child.text.strip() and child.get('title'):
+            pieces.append(f"{child.text.strip()} ({child.get('title')})")
+        else:
+            # Other inline tags, and abbreviations without a title, keep their own text
+            if child.text:
+                pieces.append(child.text)
+            _collect_text(child, pieces)
+        if child.tail:
+            pieces.append(child.tail)
+
+
+def paragraph_text(paragraph) -> str:
+    """Text of a paragraph Selector (or lxml element) with <abbr title> expanded as 'EMA (title)'"""
+    element = getattr(paragraph, 'root', paragraph)
+    pieces = [element.text] if element.text else []
+    _collect_text(element, pieces)
+    return ' '.join(piece.strip() for piece in pieces if piece.strip())
+
+
+def sentence_spans(text: str) -> List[Tuple[int, int]]:
+    """(start, end) of each non-blank sentence, whitespace trimmed"""
+    spans, start = [], 0
+    for match in SENTENCE_SPLIT_RE.finditer(text):
+        spans.append((start, match.start()))
+        start = match.end()
+    spans.append((start, len(text)))
+
+    trimmed = []
+    for begin, end in spans:
+        piece = text[begin:end]
+        stripped = piece.strip()
+        if stripped:
+            begin += len(piece) - len(piece.lstrip())
+            trimmed.append((begin, begin + len(stripped)))
+    return trimmed
+
+
+def pack_sentences(sentences: Sequence[str], word_limit: int) -> str:
+    """Take sentences in order until the word budget is spent, cutting the last one if 3+ words fit"""
+    summary, word_count = [], 0
+    for sentence in sentences:
+        words = sentence.split()
+        if word_count + len(words) <= word_limit:
+            summary.append(sentence)
+            word_count += len(words)
+        else:
+            remaining = word_limit - word_count
+            if remaining >= 3:
+                summary.append(' '.join(words[:remaining]) + '...')
+            break
+    return ' '.join(summary).strip()
+
+
+class ExtractiveSummarizer:
+    """Scores sentences by word frequency with a boost for known abbreviations"""
+
+    def __init__(self, boost_terms: Sequence[str] = DEFAULT_BOOST_TERMS, boost: float = DEFAULT_BOOST):
+        self.boost = boost
+        self.boost_terms = [term.lower() for term in boost_terms]
+        alternatives = '|'.join(re.escape(term) for term in sorted(self.boost_terms, key=len, reverse=True))
+        self._boost_re = re.compile(rf'\b(?:{alternatives})\b', re.IGNORECASE) if self.boost_terms else None
+
+    def sentence_scores(self, text: str, spans: Sequence[Tuple[int, int]]) -> np.ndarray:
+        """Score of each sentence span of text"""
+        starts = np.fromiter((start for start, _ in spans), dtype=np.int64, count=len(spans))
+
+        ids: Dict[str, int] = {}
+        word_ids, word_pos = [], []
+        for match in WORD_RE.finditer(text):
+            word_ids.append(ids.setdefault(match.group().lower(), len(ids)))
+            word_pos.append(match.start())
+        if not word_ids:
+            return np.zeros(len(spans))
+
+        word_ids = np.asarray(word_ids)
+        word_sentence = np.searchsorted(starts, np.asarray(word_pos), side='right') - 1
+        frequency = np.bincount(word_ids)
+        # Sum of the corpus frequencies of each sentence's words
+        scores = np.bincount(word_sentence, weights=frequency[word_ids], minlength=len(spans)) / frequency.max()
+
+        if self._boost_re is not None:
+            hits = {(int(np.searchsorted(starts, match.start(), side='right') - 1), match.group().lower())
+                    for match in self._boost_re.finditer(text)}
+            if hits:
+                abbr_counts = np.bincount([sentence for sentence, _ in hits], minlength=len(spans))
+                scores = scores * (1 + self.boost * abbr_counts)
+        return scores
+
+    def summarize(self, text: str, word_limit: int = 40) -> str:
+        """Best-scoring sentences, highest first, packed into word_limit words"""
+        spans = sentence_spans(text)
+        if not spans:
+            return ""
+        scores = self.sentence_scores(text, spans)
+        order = np.argsort(-scores, kind='stable')
+        return pack_sentences([text[spans[i][0]:spans[i][1]] for i in order], word_limit)
+
+
+_summarizers: Dict[Tuple[Tuple[str, ...], float], ExtractiveSummarizer] = {}
+_summarizers_lock = threading.Lock()
+
+
+def extractive_summary(text: str, word_limit: int = 40, boost_terms: Sequence[str] = DEFAULT_BOOST_TERMS,
+                       boost: float = DEFAULT_BOOST) -> str:
+    """Summary of text using a shared summarizer for the given boost terms"""
+    key = (tuple(boost_terms), boost)
+    with _summarizers_lock:
+        summarizer = _summarizers.get(key)
+        if summarizer is None:
+            summarizer = _summarizers[key] = ExtractiveSummarizer(boost_terms, boost)
+    return summarizer.summarize(text, word_limit)
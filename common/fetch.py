@@ -0,0 +1,161 @@
+"""HTTP-first fetching of server-rendered detail pages.
+
+Several Selenium scrapers need a browser for the listing (consent banner,
+JS paginator) but then opened every article in Chrome as well, although the
+article bodies are plain server-rendered HTML. `fetch_pages` fetches the
+detail URLs concurrently over a pooled HTTP session instead, carrying the
+driver's cookies and user agent, and returns a Scrapy `Selector` per URL:
+
+    pages = fetch_pages(links, 'bfarm.de', driver=self.driver)
+    for link, page in pages.items():
+        paragraphs = page.xpath('//main/div/p')
+
+A response counts only if it is a 2xx HTML page that contains the site's
+'article' selector from `common.readiness.READINESS`; anything else (HTTP
+errors, bot challenges, JS-only pages) is loaded in a tab of the driver as
+before. URLs that fail both ways map to None. RI_HTTP_FIRST=0 sends
+every page through the browser.
+"""
+import atexit
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Optional
+
+from common.browser import apply_profile
+from common.dom import select, snapshot
+from common.readiness import READINESS, wait_ready
+
+HTTP_FIRST = os.environ.get('RI_HTTP_FIRST', '1') != '0'
+FETCH_WORKERS = int(os.environ.get('RI_FETCH_WORKERS', '4'))
+FETCH_TIMEOUT = 20
+FETCH_RETRIES = 2
+
+logger = logging.getLogger(__name__)
+
+_sessions: Dict[str, object] = {}
+_sessions_lock = threading.Lock()
+_stats: Dict[str, Dict[str, float]] = {}
+_stats_lock = threading.Lock()
+
+
+def _record(site: str, outcome: str, seconds: float = 0.0):
+    with _stats_lock:
+        entry = _stats.setdefault(site, {'http': 0, 'browser': 0, 'failed': 0, 'seconds': 0.0})
+        entry[outcome] += 1
+        entry['seconds'] += seconds
+
+
+def fetch_stats() -> Dict[str, Dict[str, float]]:
+    """Pages fetched over HTTP, through the browser and failed, with total seconds, per site"""
+    with _stats_lock:
+        return {site: dict(entry) for site, entry in _stats.items()}
+
+
+def http_session(site: str):
+    """Pooled requests session for a site, with keep-alive and retries on 429/5xx"""
+    with _sessions_lock:
+        session = _sessions.get(site)
+        if session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            retries = Retry(total=FETCH_RETRIES, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504),
+                            allowed_methods=('GET', 'HEAD'))
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=FETCH_WORKERS, max_retries=retries)
+            session = requests.Session()
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            _sessions[site] = session
+        return session
+
+
+def share_cookies(session, driver):
+    """Copy the driver's cookies (consent, session) and user agent into an HTTP session"""
+    session.headers['User-Agent'] = driver.execute_script("return navigator.userAgent")
+    for cookie in driver.get_cookies():
+        session.cookies.set(cookie['name'], cookie['value'],
+                            domain=cookie.get('domain'), path=cookie.get('path', '/'))
+
+
+def _is_article(page, site: str) -> bool:
+    selector = READINESS.get(site, {}).get('article')
+    if not selector:
+        return True
+    return bool(select(page, selector))
+
+
+def _http_page(url: str, site: str):
+    from scrapy import Selector
+
+    response = http_session(site).get(url, timeout=FETCH_TIMEOUT)
+    response.raise_for_status()
+    if 'html' not in response.headers.get('Content-Type', 'text/html'):
+        raise ValueError(f"not an HTML page ({response.headers.get('Content-Type')})")
+    if 'charset' not in response.headers.get('Content-Type', ''):
+        # requests defaults to ISO-8859-1 without a charset; use the one the page declares
+        response.encoding = response.apparent_encoding
+    page = Selector(text=response.text)
+    if not _is_article(page, site):
+        raise ValueError("article content not in the served HTML")
+    return page
+
+
+def _browser_page(driver, url: str, site: str):
+    """Load a page in a new tab of the driver, leaving the listing tab as it was"""
+    main_tab = driver.current_window_handle
+    driver.switch_to.new_window('tab')
+    try:
+        # Blocked URLs are set per tab: apply the site's profile before the page starts loading
+        apply_profile(driver, site)
+        driver.get(url)
+        wait_ready(driver, site, 'article', required=True)
+        return snapshot(driver)
+    finally:
+        driver.close()
+        driver.switch_to.window(main_tab)
+
+
+def fetch_pages(urls: Iterable[str], site: str, driver=None, workers: int = FETCH_WORKERS) -> Dict[str, Optional[object]]:
+    """Selector per URL (in input order, duplicates dropped); None where the page could not be loaded"""
+    urls = list(dict.fromkeys(url for url in urls if url))
+    pages: Dict[str, Optional[object]] = dict.fromkeys(urls)
+    if HTTP_FIRST and urls:
+        if driver is not None:
+            share_cookies(http_session(site), driver)
+
+        def fetch(url):
+            started = time.perf_counter()
+            try:
+                page = _http_page(url, site)
+            except Exception as e:
+                logger.info(f"HTTP fetch of {url} failed ({e}), falling back to the browser")
+                return url, None
+            _record(site, 'http', time.perf_counter() - started)
+            return url, page
+
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(urls)))) as executor:
+            pages.update(executor.map(fetch, urls))
+
+    # The driver is not thread-safe: fall back one page at a time
+    for url in [url for url, page in pages.items() if page is None]:
+        started = time.perf_counter()
+        try:
+            if driver is None:
+                raise ValueError("no driver to fall back to")
+            pages[url] = _browser_page(driver, url, site)
+            _record(site, 'browser', time.perf_counter() - started)
+        except Exception as e:
+            logger.warning(f"Could not load {url}: {e}")
+            _record(site, 'failed', time.perf_counter() - started)
+    return pages
+
+
+@atexit.register
+def _report_fetches():
+    for site, entry in sorted(fetch_stats().items()):
+        logger.info(f"Fetched {site}: {entry['http']} over HTTP, {entry['browser']} via browser, "
+                    f"{entry['failed']} failed, {entry['seconds']:.1f}s")
@@ -0,0 +1,107 @@
+"""Country gazetteer: every COUNTRY_PATTERNS entry found in a single scan.
+
+The scrapers used to loop over ~200 countries and run one `re.search` per
+pattern. A gazetteer compiles all patterns of a table into one automaton
+(see common.drug_matcher) and returns per-country hit counts in one pass, so
+`detect_countries` and `infer_primary_country` share the same scan.
+"""
+import re
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from common.drug_matcher import DrugTermMatcher
+
+_REGEX_META = set('.^$*+?{}[]|()')
+
+
+def pattern_to_literal(pattern: str) -> Optional[str]:
+    """Return the literal text a regex pattern matches, or None if it is a real regex"""
+    out = []
+    chars = iter(pattern)
+    for ch in chars:
+        if ch == '\\':
+            nxt = next(chars, None)
+            if nxt is None or nxt.isalnum():
+                return None  # \d, \s, \b ... or a dangling backslash
+            out.append(nxt)
+        elif ch in _REGEX_META:
+            return None
+        else:
+            out.append(ch)
+    return ''.join(out)
+
+
+class CountryGazetteer:
+    """All patterns of a COUNTRY_PATTERNS-style table compiled into one matcher.
+
+    `boundary` follows common.drug_matcher ('word' for the r'\\b...\\b' checks,
+    'none' for plain substring tests). With `literal=False` patterns are read as
+    regex fragments like the old `re.search(r'\\b' + pattern + r'\\b', ...)` code;
+    the rare ones that are not plain text fall back to a compiled regex.
+    """
+
+    def __init__(self, country_patterns: Dict[str, Iterable[str]], boundary: str = 'word', literal: bool = False):
+        self.boundary = boundary
+        self.order = {country: i for i, country in enumerate(country_patterns)}
+        self._owners: Dict[str, List[Tuple[str, str]]] = {}
+        self._regexes: List[Tuple[re.Pattern, str, str]] = []
+
+        for country, patterns in country_patterns.items():
+            for pattern in patterns:
+                text = pattern.lower() if literal else pattern_to_literal(pattern.lower())
+                if text is None:
+                    wrapped = rf'\b{pattern}\b' if boundary == 'word' else pattern
+                    self._regexes.append((re.compile(wrapped, re.IGNORECASE), country, pattern))
+                elif text:
+                    self._owners.setdefault(text, []).append((country, pattern))
+
+        self._matcher = DrugTermMatcher(self._owners, boundary=boundary)
+        self._last: Tuple[Optional[str], Counter, Counter] = (None, Counter(), Counter())
+
+    def _scan(self, text: str) -> Tuple[Counter, Counter]:
+        last_text, countries, patterns = self._last
+        if text == last_text:
+            return countries, patterns
+
+        countries, patterns = Counter(), Counter()
+        for _, _, term in self._matcher.finditer(text):
+            for country, pattern in self._owners[term]:
+                countries[country] += 1
+                patterns[pattern] += 1
+        for regex, country, pattern in self._regexes:
+            hits = len(regex.findall(text))
+            if hits:
+                countries[country] += hits
+                patterns[pattern] += hits
+
+        self._last = (text, countries, patterns)
+        return countries, patterns
+
+    def scan(self, text: str) -> Counter:
+        """Hit count per country; repeated calls with the same text reuse the last scan"""
+        if not text:
+            return Counter()
+        return self._scan(text)[0]
+
+    def matched_patterns(self, text: str) -> Set[str]:
+        """The table patterns that occur in the text"""
+        if not text:
+            return set()
+        return set(self._scan(text)[1])
+
+    def detect(self, text: str) -> List[str]:
+        """Countries mentioned in the text, in table order"""
+        return sorted(self.scan(text), key=self.order.__getitem__)
+
+
+_gazetteers: Dict[Tuple[int, str, bool], Tuple[dict, CountryGazetteer]] = {}
+
+
+def country_gazetteer(country_patterns: Dict[str, Iterable[str]], boundary: str = 'word',
+                      literal: bool = False) -> CountryGazetteer:
+    """Return the gazetteer for a pattern table, compiling it once per process"""
+    key = (id(country_patterns), boundary, literal)
+    entry = _gazetteers.get(key)
+    if entry is None or entry[0] is not country_patterns:
+        entry = _gazetteers[key] = (country_patterns, CountryGazetteer(country_patterns, boundary, literal))
+    return entry[1]
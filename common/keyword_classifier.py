@@ -0,0 +1,97 @@
+"""Keyword classification of articles in a single scan.
+
+The scrapers classify text by walking DOCUMENT_TYPES (~40 categories) and
+PRODUCT_TYPES and testing every keyword separately, once per table and often
+more than once per article. A `KeywordClassifier` compiles the keywords of
+several tables into one automaton (see common.drug_matcher), scans the text
+once, and answers every question about that text from the same scan: the
+first matching category in table order, the matched keywords, hit counts and
+the keyword-share confidence used by `_classify_article`.
+
+    classifier = keyword_classifier(document=self.DOCUMENT_TYPES, product=self.PRODUCT_TYPES)
+    doc_type = classifier.classify(text, 'document', default='Other Type')
+"""
+from typing import Collection, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from common.drug_matcher import DrugTermMatcher
+
+Table = Mapping[str, Iterable[str]]
+
+
+class KeywordClassifier:
+    """Keyword tables ({category: [keywords]}) compiled into one matcher.
+
+    `boundary` follows common.drug_matcher: 'none' gives the old
+    `keyword in text.lower()` tests, 'word' the `re.search(rf'\\b{kw}\\b', ...)` ones.
+    """
+
+    def __init__(self, tables: Mapping[str, Table], boundary: str = 'none'):
+        self.boundary = boundary
+        self.tables: Dict[str, Dict[str, Tuple[str, ...]]] = {
+            name: {category: tuple(kw.lower() for kw in keywords) for category, keywords in table.items()}
+            for name, table in tables.items()
+        }
+        terms = {kw for table in self.tables.values() for keywords in table.values() for kw in keywords}
+        self._matcher = DrugTermMatcher(terms, boundary=boundary)
+        self._last: Tuple[Optional[str], frozenset] = (None, frozenset())
+
+    def found(self, text: str) -> frozenset:
+        """Every keyword of every table that occurs in the text; repeated calls reuse the last scan"""
+        if not text:
+            return frozenset()
+        last_text, found = self._last
+        if text != last_text:
+            found = frozenset(term for _, _, term in self._matcher.finditer(text))
+            self._last = (text, found)
+        return found
+
+    def matches(self, text: str, table: str) -> Dict[str, List[str]]:
+        """Matched keywords of each category with at least one hit, in table order"""
+        found = self.found(text)
+        result = {}
+        for category, keywords in self.tables[table].items():
+            matched = [kw for kw in keywords if kw in found]
+            if matched:
+                result[category] = matched
+        return result
+
+    def first_match(self, text: str, table: str, skip: Collection[str] = ()) -> Tuple[Optional[str], List[str]]:
+        """(first category in table order with a hit, its matched keywords), or (None, [])"""
+        for category, matched in self.matches(text, table).items():
+            if category not in skip:
+                return category, matched
+        return None, []
+
+    def classify(self, text: str, table: str, default: str) -> str:
+        category, _ = self.first_match(text, table)
+        return category if category is not None else default
+
+    def hit_counts(self, text: str, table: str) -> Dict[str, int]:
+        """Number of matched keywords per category"""
+        return {category: len(matched) for category, matched in self.matches(text, table).items()}
+
+    def confidences(self, text: str, table: str) -> Dict[str, float]:
+        """Share of each category's keywords found in the text, in percent"""
+        return {category: min(100, count / len(self.tables[table][category]) * 100)
+                for category, count in self.hit_counts(text, table).items()}
+
+    def best(self, text: str, table: str, default: str) -> Tuple[str, float]:
+        """Category with the highest confidence (first in table order on ties) and its rounded confidence"""
+        best_category, best_confidence = default, 0
+        for category, confidence in self.confidences(text, table).items():
+            if confidence > best_confidence:
+                best_category, best_confidence = category, round(confidence, 1)
+        return best_category, best_confidence
+
+
+_classifiers: Dict[tuple, Tuple[tuple, KeywordClassifier]] = {}
+
+
+def keyword_classifier(boundary: str = 'none', **tables: Table) -> KeywordClassifier:
+    """Return the classifier for these tables, compiling it once per process"""
+    key = (boundary,) + tuple((name, id(table)) for name, table in sorted(tables.items()))
+    owners = tuple(table for _, table in sorted(tables.items()))
+    entry = _classifiers.get(key)
+    if entry is None or any(a is not b for a, b in zip(entry[0], owners)):
+        entry = _classifiers[key] = (owners, KeywordClassifier(tables, boundary))
+    return entry[1]
@@ -0,0 +1,238 @@
+"""Process-wide language identification.
+
+fastText (lid.176.ftz) is loaded once per process on first use, from
+RI_LID_MODEL, a `lid.176.ftz` in the working directory, or the shared cache
+(downloading it there if missing). `predict_many` classifies a whole listing
+page in a single model call; predictions below the confidence threshold, and
+every prediction when the model is unavailable, fall back to langdetect.
+
+`detect_language_code` is a cached, deterministic drop-in for
+`langdetect.detect`: it looks at a bounded prefix of long texts, remembers
+results by text hash, and can lean on the known language of the site.
+"""
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import requests
+
+from common.drug_terms import atomic_write
+from common.lazy import timed
+from common.paths import cache_path
+
+LID_MODEL_URL = 'https://dl.fbaipublicfiles.com/fasttext/supervised-models/lid.176.ftz'
+LID_MODEL_NAME = 'lid.176.ftz'
+
+# fastText probability under which langdetect gets a say
+DEFAULT_THRESHOLD = 0.5
+
+# langdetect only looks at this many leading characters of a text
+DETECT_SAMPLE_CHARS = 2000
+DETECT_CACHE_SIZE = 4096
+
+# A site's prior wins when langdetect is less sure than this ...
+PRIOR_OVERRIDE_BELOW = 0.9
+# ... as long as the prior language is a candidate with at least this probability
+PRIOR_MIN_PROB = 0.2
+
+# Language of the pages scraped from each site (bfarm.de and swissmedic.ch: their English sections)
+SITE_LANGUAGE_PRIORS = {
+    'laegemiddelstyrelsen.dk': 'da',
+    'fagg.be': 'nl',
+    'cbg-meb.nl': 'nl',
+    'bfarm.de': 'en',
+    'swissmedic.ch': 'en',
+    'ima.is': 'is',
+    'dmp.no': 'no',
+    'lakemedelsverket.se': 'sv',
+    'santesecu.public.lu': 'fr',
+    'infarmed.pt': 'pt',
+    'medicinesauthority.gov.mt': 'en',
+    'hpra.ie': 'en',
+    'ema.europa.eu': 'en',
+    'health.ec.europa.eu': 'en',
+    'ich.org': 'en',
+    'who.int': 'en',
+}
+
+logger = logging.getLogger(__name__)
+
+Prediction = Tuple[Optional[str], float]
+
+
+def find_model_path() -> Optional[str]:
+    """First existing copy of the model, or None"""
+    candidates = [os.environ.get('RI_LID_MODEL'), os.path.abspath(LID_MODEL_NAME), cache_path(LID_MODEL_NAME)]
+    for path in candidates:
+        if path and os.path.exists(path):
+            return path
+    return None
+
+
+def download_model(timeout: int = 60) -> str:
+    path = cache_path(LID_MODEL_NAME)
+    logger.info(f"Downloading fastText language model to {path}")
+    response = requests.get(LID_MODEL_URL, timeout=timeout)
+    response.raise_for_status()
+    atomic_write(path, response.content)
+    return path
+
+
+def site_prior(site: Optional[str]) -> Optional[str]:
+    """Language prior for a site given as domain or URL, matched on the domain suffix"""
+    if not site:
+        return None
+    host = site.split('://', 1)[-1].split('/', 1)[0].lower()
+    for domain, lang in SITE_LANGUAGE_PRIORS.items():
+        if host == domain or host.endswith('.' + domain):
+            return lang
+    return None
+
+
+def detection_sample(text: str, limit: int = DETECT_SAMPLE_CHARS) -> str:
+    """Whitespace-normalized prefix of the text, cut at a word boundary"""
+    sample = ' '.join(text[:limit + 200].split())
+    if len(sample) > limit:
+        cut = sample.rfind(' ', 0, limit)
+        sample = sample[:cut if cut > 0 else limit]
+    return sample
+
+
+_rankings: 'OrderedDict[str, List[Tuple[str, float]]]' = OrderedDict()
+_rankings_lock = threading.Lock()
+_detect_stats: Dict[str, int] = {'hits': 0, 'misses': 0}
+
+
+def _ranked_languages(sample: str) -> List[Tuple[str, float]]:
+    """langdetect candidates for a sample, most probable first, memoized by hash (LRU)"""
+    from langdetect import DetectorFactory, LangDetectException, detect_langs
+
+    key = hashlib.sha1(sample.encode('utf-8')).hexdigest()
+    with _rankings_lock:
+        ranking = _rankings.get(key)
+        if ranking is not None:
+            _rankings.move_to_end(key)
+            _detect_stats['hits'] += 1
+            return ranking
+        _detect_stats['misses'] += 1
+
+    # Seeded so the same text gets the same answer on every run
+    DetectorFactory.seed = 0
+    try:
+        ranking = [(lang.lang, lang.prob) for lang in detect_langs(sample)]
+    except LangDetectException:
+        ranking = []
+
+    with _rankings_lock:
+        _rankings[key] = ranking
+        if len(_rankings) > DETECT_CACHE_SIZE:
+            _rankings.popitem(last=False)
+    return ranking
+
+
+def langdetect_predict(text: str, prior: Optional[str] = None) -> Prediction:
+    """Best langdetect guess as (ISO 639-1 code, probability), nudged towards a prior"""
+    ranking = _ranked_languages(detection_sample(text)) if text else []
+    if prior:
+        if not ranking:
+            return prior, 0.0
+        best_prob = ranking[0][1]
+        for lang, prob in ranking:
+            if lang == prior and best_prob < PRIOR_OVERRIDE_BELOW and prob >= PRIOR_MIN_PROB:
+                return lang, prob
+    return ranking[0] if ranking else (None, 0.0)
+
+
+def detect_language_code(text: str, site: Optional[str] = None, prior: Optional[str] = None) -> str:
+    """Cached replacement for langdetect.detect, raising LangDetectException the same way.
+
+    `site` (a domain or URL) selects the prior from SITE_LANGUAGE_PRIORS unless
+    `prior` is given explicitly.
+    """
+    from langdetect.lang_detect_exception import ErrorCode, LangDetectException
+
+    lang, _ = langdetect_predict(text, prior or site_prior(site))
+    if lang is None:
+        raise LangDetectException(ErrorCode.CantDetectError, 'No features in text.')
+    return lang
+
+
+def detection_stats() -> Dict[str, int]:
+    with _rankings_lock:
+        return dict(_detect_stats, size=len(_rankings))
+
+
+class LanguageIdentifier:
+    """fastText language ID with a langdetect fallback for low-confidence texts"""
+
+    def __init__(self, model_path: Optional[str] = None, threshold: float = DEFAULT_THRESHOLD,
+                 download: bool = True):
+        self.model_path = model_path
+        self.threshold = threshold
+        self.download = download
+        self._model = None
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    @property
+    def model(self):
+        """The fastText model, or None if it cannot be loaded"""
+        with self._lock:
+            if not self._loaded:
+                self._loaded = True
+                try:
+                    import fasttext
+
+                    path = self.model_path or find_model_path()
+                    if path is None and self.download:
+                        path = download_model()
+                    if path is None:
+                        logger.warning("FastText model not found, using langdetect only")
+                    else:
+                        with timed(f"load fasttext {os.path.basename(path)}"):
+                            self._model = fasttext.load_model(path)
+                except Exception as e:
+                    logger.warning(f"Fasttext model error: {e}")
+            return self._model
+
+    def predict_many(self, texts: Sequence[str]) -> List[Prediction]:
+        """(ISO 639-1 code, confidence) for each text; (None, 0.0) for empty or undetectable text"""
+        cleaned = [' '.join(text.split()) if text else '' for text in texts]
+        results: List[Prediction] = [(None, 0.0)] * len(cleaned)
+        todo = [i for i, text in enumerate(cleaned) if text]
+
+        model = self.model if todo else None
+        if model is not None:
+            labels, probs = model.predict([cleaned[i] for i in todo], k=1)
+            for i, label, prob in zip(todo, labels, probs):
+                results[i] = (label[0].replace('__label__', ''), float(prob[0]))
+
+        for i in todo:
+            if results[i][1] < self.threshold:
+                fallback = langdetect_predict(cleaned[i])
+                if fallback[0] is not None and (results[i][0] is None or fallback[1] > results[i][1]):
+                    results[i] = fallback
+        return results
+
+    def predict(self, text: str) -> Prediction:
+        return self.predict_many([text])[0]
+
+    def detect(self, text: str) -> Optional[str]:
+        """ISO 639-1 code of the text, or None"""
+        return self.predict(text)[0]
+
+
+_identifier = None
+_identifier_lock = threading.Lock()
+
+
+def language_identifier() -> LanguageIdentifier:
+    """Process-wide LanguageIdentifier; the model is loaded on first prediction"""
+    global _identifier
+    with _identifier_lock:
+        if _identifier is None:
+            _identifier = LanguageIdentifier()
+        return _identifier
@@ -0,0 +1,132 @@
+"""Deferred imports and model loading, with a cold-start report.
+
+transformers, torch, stanza and fastText take seconds to import and hundreds
+of MB to hold, and most scraper runs never touch them, so the shared modules
+import them inside the functions that load a model. `LazyModel` builds a
+model the first time it is called:
+
+    summarizer = LazyModel('bart summarizer', lambda: pipeline('summarization', ...))
+
+It, and anything wrapped in `timed(...)`, records how long the import or
+load took and when it happened relative to process start. The collected
+timings are logged at exit, or can be read with `cold_start_report()`.
+"""
+import atexit
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_imported_at = time.time()
+_events: List[Dict[str, object]] = []
+_events_lock = threading.Lock()
+
+
+def _process_start() -> float:
+    """Wall-clock start of this process (Linux /proc), or the import time of this module"""
+    try:
+        with open('/proc/self/stat') as fh:
+            # Field 22, counted after the parenthesised command name
+            start_ticks = int(fh.read().rsplit(')', 1)[1].split()[19])
+        with open('/proc/uptime') as fh:
+            uptime = float(fh.read().split()[0])
+        return time.time() - uptime + start_ticks / os.sysconf('SC_CLK_TCK')
+    except (OSError, ValueError, IndexError):
+        return _imported_at
+
+
+_started_at = _process_start()
+
+
+def uptime() -> float:
+    """Seconds since the process started"""
+    return time.time() - _started_at
+
+
+def record(name: str, seconds: float = 0.0, kind: str = 'load'):
+    """Add an event ending now that took `seconds`"""
+    with _events_lock:
+        _events.append({'name': name, 'kind': kind, 'seconds': seconds, 'at': uptime()})
+
+
+def mark(name: str):
+    """Record a milestone such as the first page fetched"""
+    record(name, kind='milestone')
+
+
+@contextmanager
+def timed(name: str, kind: str = 'load'):
+    """Record how long the block takes"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(name, time.perf_counter() - started, kind)
+
+
+class LazyModel:
+    """Calls `loader` once, on first use, and forwards calls to the loaded model"""
+
+    def __init__(self, name: str, loader: Callable[[], object]):
+        self.name = name
+        self._loader = loader
+        self._model = None
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    def get(self):
+        if not self._loaded:
+            with self._lock:
+                if not self._loaded:
+                    with timed(f"load {self.name}"):
+                        self._model = self._loader()
+                    self._loaded = True
+        return self._model
+
+    def __call__(self, *args, **kwargs):
+        return self.get()(*args, **kwargs)
+
+    def __getattr__(self, attr: str):
+        if attr.startswith('_'):
+            raise AttributeError(attr)
+        return getattr(self.get(), attr)
+
+    def unload(self):
+        """Drop the model; the next call loads it again"""
+        with self._lock:
+            self._model = None
+            self._loaded = False
+
+
+def cold_start_report() -> Dict[str, object]:
+    """Process uptime plus every import, model load and milestone recorded so far"""
+    with _events_lock:
+        events = [dict(event) for event in _events]
+    return {
+        'uptime': uptime(),
+        'load_seconds': sum(event['seconds'] for event in events),
+        'events': events,
+    }
+
+
+def log_cold_start(log: Optional[logging.Logger] = None):
+    report = cold_start_report()
+    if not report['events']:
+        return
+    log = log or logger
+    log.info(f"Cold start: {report['load_seconds']:.1f}s spent importing/loading models "
+             f"over {report['uptime']:.1f}s of process time")
+    for event in report['events']:
+        took = f" took {event['seconds']:.2f}s" if event['kind'] != 'milestone' else ''
+        log.info(f"  +{event['at']:.2f}s {event['kind']} {event['name']}{took}")
+
+
+atexit.register(log_cold_start)
@@ -0,0 +1,165 @@
+"""Extractive LSA summaries with warm per-language resources.
+
+Scores sentences exactly like sumy's LsaSummarizer (smoothed term frequency,
+sentence rank from the squared singular values), but keeps each language's
+sumy Tokenizer, Stemmer and stop words loaded for the life of the process,
+caches the stemmed form of recent documents by content hash, and bounds the
+cost of long texts:
+
+- only the first MAX_SENTENCES sentences form the term-sentence matrix;
+- sumy keeps every SVD dimension, which makes a sentence's rank the norm of
+  its matrix column, so the default path skips the SVD entirely; a reduced
+  number of dimensions uses a seeded randomized SVD instead of a full one.
+"""
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+MAX_SENTENCES = 200
+SVD_OVERSAMPLE = 10
+SVD_POWER_ITERATIONS = 2
+
+# sumy's LsaSummarizer constants
+MIN_DIMENSIONS = 3
+TF_SMOOTHING = 0.4
+
+DOCUMENT_CACHE_SIZE = 256
+
+logger = logging.getLogger(__name__)
+
+# (sentences, stemmed non-stop words of each sentence)
+Document = Tuple[List[str], List[List[str]]]
+
+
+class _LanguageResources:
+    def __init__(self, language: str):
+        from sumy.nlp.stemmers import Stemmer
+        from sumy.nlp.tokenizers import Tokenizer
+        from sumy.utils import get_stop_words
+
+        self.tokenizer = Tokenizer(language)
+        self.stemmer = Stemmer(language)
+        try:
+            self.stop_words = frozenset(word.lower() for word in get_stop_words(language))
+        except LookupError:
+            self.stop_words = frozenset()
+
+
+def randomized_svd(matrix: np.ndarray, rank: int, oversample: int = SVD_OVERSAMPLE,
+                   power_iterations: int = SVD_POWER_ITERATIONS, seed: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+    """Top `rank` singular values and right singular vectors (Halko et al.), deterministic per seed"""
+    rng = np.random.default_rng(seed)
+    width = min(rank + oversample, min(matrix.shape))
+    sample = matrix @ rng.standard_normal((matrix.shape[1], width))
+    for _ in range(power_iterations):
+        sample, _ = np.linalg.qr(sample)
+        sample = matrix @ (matrix.T @ sample)
+    basis, _ = np.linalg.qr(sample)
+    _, sigma, vt = np.linalg.svd(basis.T @ matrix, full_matrices=False)
+    return sigma[:rank], vt[:rank]
+
+
+def sentence_ranks(matrix: np.ndarray, dimensions: Optional[int] = None) -> np.ndarray:
+    """LSA rank of each sentence (column) of a terms x sentences count matrix.
+
+    With every dimension kept, as sumy does, sqrt(sum_i sigma_i^2 v_ij^2) is
+    the norm of column j of the smoothed matrix, so no SVD is needed. Passing
+    `dimensions` keeps only the strongest topics, using a randomized SVD.
+    """
+    max_counts = matrix.max(axis=0)
+    nonzero = max_counts != 0
+    matrix = matrix.copy()
+    matrix[:, nonzero] = TF_SMOOTHING + (1.0 - TF_SMOOTHING) * matrix[:, nonzero] / max_counts[nonzero]
+
+    if dimensions is None or dimensions >= min(matrix.shape):
+        return np.linalg.norm(matrix, axis=0)
+    sigma, vt = randomized_svd(matrix, max(MIN_DIMENSIONS, dimensions))
+    return np.sqrt(((sigma ** 2)[:, None] * vt ** 2).sum(axis=0))
+
+
+class LsaSummary:
+    """Process-wide LSA summarizer; use `lsa_summary()`"""
+
+    def __init__(self, fallback_language: str = 'english'):
+        self.fallback_language = fallback_language
+        self._resources: Dict[str, _LanguageResources] = {}
+        self._documents: 'OrderedDict[str, Document]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def resources(self, language: str) -> _LanguageResources:
+        """Tokenizer/stemmer/stop words for a language, falling back to English if sumy lacks it"""
+        language = (language or self.fallback_language).lower()
+        with self._lock:
+            res = self._resources.get(language)
+        if res is None:
+            try:
+                res = _LanguageResources(language)
+            except (LookupError, ValueError) as e:
+                if language == self.fallback_language:
+                    raise
+                logger.debug(f"No sumy resources for {language} ({e}), using {self.fallback_language}")
+                res = self.resources(self.fallback_language)
+            with self._lock:
+                res = self._resources.setdefault(language, res)
+        return res
+
+    def document(self, text: str, language: str) -> Document:
+        """Sentences of text and their stemmed terms, memoized by hash (LRU)"""
+        key = hashlib.sha1(f"{language}\x1f{text}".encode('utf-8')).hexdigest()
+        with self._lock:
+            cached = self._documents.get(key)
+            if cached is not None:
+                self._documents.move_to_end(key)
+                return cached
+
+        res = self.resources(language)
+        sentences = [s for s in res.tokenizer.to_sentences(text) if s.strip()][:MAX_SENTENCES]
+        terms = []
+        for sentence in sentences:
+            words = (word.lower() for word in res.tokenizer.to_words(sentence))
+            terms.append([res.stemmer(word) for word in words if word not in res.stop_words])
+
+        with self._lock:
+            self._documents[key] = (sentences, terms)
+            if len(self._documents) > DOCUMENT_CACHE_SIZE:
+                self._documents.popitem(last=False)
+        return sentences, terms
+
+    def summarize(self, text: str, sentences_count: int = 3, language: Optional[str] = None,
+                  dimensions: Optional[int] = None) -> List[str]:
+        """The best `sentences_count` sentences, in document order"""
+        sentences, terms = self.document(text, (language or self.fallback_language).lower())
+        vocabulary: Dict[str, int] = {}
+        for words in terms:
+            for word in words:
+                vocabulary.setdefault(word, len(vocabulary))
+        if not vocabulary:
+            return []
+        if len(sentences) <= sentences_count:
+            return sentences
+
+        matrix = np.zeros((len(vocabulary), len(sentences)))
+        for col, words in enumerate(terms):
+            for word in words:
+                matrix[vocabulary[word], col] += 1
+
+        ranks = sentence_ranks(matrix, dimensions)
+        best = sorted(np.argsort(-ranks, kind='stable')[:sentences_count])
+        return [sentences[i] for i in best]
+
+
+_summary = None
+_summary_lock = threading.Lock()
+
+
+def lsa_summary() -> LsaSummary:
+    """Process-wide LsaSummary, so language resources are loaded once"""
+    global _summary
+    with _summary_lock:
+        if _summary is None:
+            _summary = LsaSummary()
+        return _summary
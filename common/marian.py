@@ -0,0 +1,131 @@
+"""Offline MarianMT translation backend.
+
+Runs the Helsinki-NLP opus-mt models on the CPU for the languages the scrapers
+cover, so translation is not bound by provider rate limits. Models are loaded
+lazily, once per language pair, and sentences are batched by token length so
+a batch never pads short sentences up to a long one.
+
+transformers and torch are imported on first use only; scrapers that keep the
+Google backend never pay for them.
+"""
+import logging
+import os
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from common.lazy import timed
+from common.translation_memory import normalize_segment
+
+# Source language -> model translating into English
+MARIAN_MODELS = {
+    'da': 'Helsinki-NLP/opus-mt-da-en',
+    'nl': 'Helsinki-NLP/opus-mt-nl-en',
+    'de': 'Helsinki-NLP/opus-mt-de-en',
+    'pt': 'Helsinki-NLP/opus-mt-ROMANCE-en',
+    'sv': 'Helsinki-NLP/opus-mt-sv-en',
+    'is': 'Helsinki-NLP/opus-mt-is-en',
+    'fr': 'Helsinki-NLP/opus-mt-fr-en',
+    'no': 'Helsinki-NLP/opus-mt-gmq-en',
+    'nb': 'Helsinki-NLP/opus-mt-gmq-en',
+    'fi': 'Helsinki-NLP/opus-mt-fi-en',
+    'mt': 'Helsinki-NLP/opus-mt-mt-en',
+}
+
+# Marian models are trained on sentences up to 512 tokens
+MAX_INPUT_TOKENS = 512
+
+# Padded tokens per generate() call (longest sentence x batch size)
+DEFAULT_BATCH_TOKENS = 4096
+
+logger = logging.getLogger(__name__)
+
+
+def default_num_threads() -> int:
+    """CPU threads for torch (RI_TRANSLATION_THREADS, default min(4, cores))"""
+    env = os.environ.get('RI_TRANSLATION_THREADS')
+    if env:
+        return max(1, int(env))
+    return max(1, min(4, os.cpu_count() or 1))
+
+
+def token_batches(lengths: Sequence[int], max_batch_tokens: int) -> List[List[int]]:
+    """Group indices, shortest first, so that longest-in-batch x size stays under the budget"""
+    batches, current, longest = [], [], 0
+    for i in sorted(range(len(lengths)), key=lengths.__getitem__):
+        width = max(longest, lengths[i])
+        if current and width * (len(current) + 1) > max_batch_tokens:
+            batches.append(current)
+            current, width = [], lengths[i]
+        current.append(i)
+        longest = width
+    if current:
+        batches.append(current)
+    return batches
+
+
+class MarianTranslator:
+    """Lazily loaded opus-mt models with token-length batching"""
+
+    def __init__(self, models: Optional[Dict[str, str]] = None, num_threads: Optional[int] = None,
+                 max_batch_tokens: int = DEFAULT_BATCH_TOKENS):
+        self.models = dict(MARIAN_MODELS if models is None else models)
+        self.num_threads = num_threads or default_num_threads()
+        self.max_batch_tokens = max_batch_tokens
+        self._loaded: Dict[str, Tuple[object, object]] = {}
+        self._lock = threading.Lock()
+        self._torch = None
+
+    def supports(self, source: str) -> bool:
+        return (source or '').lower() in self.models
+
+    def _load(self, source: str):
+        source = source.lower()
+        with self._lock:
+            if source not in self._loaded:
+                import torch
+                from transformers import MarianMTModel, MarianTokenizer
+
+                if self._torch is None:
+                    torch.set_num_threads(self.num_threads)
+                    self._torch = torch
+                name = self.models[source]
+                logger.info(f"Loading translation model {name} ({self.num_threads} threads)")
+                with timed(f"load {name}"):
+                    tokenizer = MarianTokenizer.from_pretrained(name)
+                    model = MarianMTModel.from_pretrained(name)
+                    model.eval()
+                self._loaded[source] = (tokenizer, model)
+            return self._loaded[source]
+
+    def translate_many(self, segments: Sequence[str], source: str) -> List[str]:
+        """Translate segments (ideally single sentences) into English, preserving order"""
+        if not segments:
+            return []
+        tokenizer, model = self._load(source)
+        texts = [normalize_segment(segment) for segment in segments]
+        lengths = [min(len(ids), MAX_INPUT_TOKENS) for ids in tokenizer(texts, truncation=True,
+                                                                        max_length=MAX_INPUT_TOKENS)['input_ids']]
+
+        results: List[Optional[str]] = [None] * len(texts)
+        for batch in token_batches(lengths, self.max_batch_tokens):
+            inputs = tokenizer([texts[i] for i in batch], return_tensors='pt', padding=True,
+                               truncation=True, max_length=MAX_INPUT_TOKENS)
+            with self._torch.inference_mode():
+                output = model.generate(**inputs, max_new_tokens=min(2 * max(lengths[i] for i in batch) + 16,
+                                                                     MAX_INPUT_TOKENS))
+            for i, translated in zip(batch, tokenizer.batch_decode(output, skip_special_tokens=True)):
+                results[i] = translated
+        return results
+
+
+_translator = None
+_translator_lock = threading.Lock()
+
+
+def get_marian_translator() -> MarianTranslator:
+    """Process-wide MarianTranslator, so each model is loaded at most once"""
+    global _translator
+    with _translator_lock:
+        if _translator is None:
+            _translator = MarianTranslator()
+        return _translator
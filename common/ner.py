@@ -0,0 +1,82 @@
+"""Biomedical named-entity recognition models used by the scrapers.
+
+Loading `d4data/biomedical-ner-all` (and stanza's English NER) costs seconds
+and hundreds of MB per process. The loaders here are used by the shared NER
+worker (common.ner_server), which keeps one copy of each model for every
+scraper on the box; entities are returned as plain dicts so they can cross
+the process boundary.
+
+Set RI_NER_BACKEND=onnx to serve the int8 ONNX export (common.ner_onnx)
+instead of the fp32 PyTorch model.
+"""
+import logging
+import os
+from typing import Dict, List, Sequence
+
+BIOMEDICAL_NER_MODEL = 'd4data/biomedical-ner-all'
+
+logger = logging.getLogger(__name__)
+
+Entity = Dict[str, object]
+
+
+def load_biomedical_pipeline(model: str = BIOMEDICAL_NER_MODEL):
+    """transformers token-classification pipeline on the CPU, entities aggregated per word span"""
+    from transformers import pipeline
+
+    return pipeline('token-classification', model=model, aggregation_strategy='simple', device=-1)
+
+
+def load_biomedical_backend():
+    """Biomedical NER for the worker: int8 ONNX when RI_NER_BACKEND=onnx, PyTorch otherwise"""
+    if os.environ.get('RI_NER_BACKEND', 'torch').lower() == 'onnx':
+        from common.ner_onnx import load_onnx_pipeline
+
+        return load_onnx_pipeline()
+    return load_biomedical_pipeline()
+
+
+def load_stanza_pipeline(lang: str = 'en'):
+    import stanza
+
+    stanza.download(lang, processors='tokenize,ner', verbose=False)
+    return stanza.Pipeline(lang, processors='tokenize,ner', use_gpu=False, verbose=False)
+
+
+def clean_entities(entities) -> List[Entity]:
+    """Pipeline output with numpy scalars turned into plain Python values"""
+    return [
+        {
+            'entity_group': entity['entity_group'],
+            'word': entity['word'],
+            'start': int(entity['start']),
+            'end': int(entity['end']),
+            'score': float(entity['score']),
+        }
+        for entity in entities
+    ]
+
+
+def run_biomedical(ner_pipeline, texts: Sequence[str], batch_size: int = 8) -> List[List[Entity]]:
+    """Entities for each text; empty texts get an empty list without touching the model"""
+    results: List[List[Entity]] = [[] for _ in texts]
+    todo = [i for i, text in enumerate(texts) if text and text.strip()]
+    if todo:
+        outputs = ner_pipeline([texts[i] for i in todo], batch_size=batch_size)
+        for i, entities in zip(todo, outputs):
+            results[i] = clean_entities(entities)
+    return results
+
+
+def run_stanza(nlp, texts: Sequence[str]) -> List[List[Entity]]:
+    results = []
+    for text in texts:
+        if not text or not text.strip():
+            results.append([])
+            continue
+        doc = nlp(text)
+        results.append([
+            {'text': ent.text, 'type': ent.type, 'start_char': ent.start_char, 'end_char': ent.end_char}
+            for ent in doc.ents
+        ])
+    return results
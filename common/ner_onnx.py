@@ -0,0 +1,240 @@
+"""ONNX / int8 runtime for the biomedical NER model.
+
+`export` converts d4data/biomedical-ner-all to ONNX and applies dynamic int8
+quantization to the weights. `OnnxNerPipeline` runs the quantized model with
+onnxruntime and aggregates tokens into entity spans exactly like the
+transformers pipeline with aggregation_strategy='simple', so the NER worker
+can swap it in (RI_NER_BACKEND=onnx) without changing its output format.
+
+    python -m common.ner_onnx export            # build <cache>/ner-onnx/model.int8.onnx
+    python -m common.ner_onnx verify [FILE]     # compare with the PyTorch pipeline
+
+`verify` exits non-zero when the int8 model disagrees with PyTorch on more
+spans than allowed, so it can gate a deployment.
+"""
+import json
+import logging
+import os
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from common.ner import BIOMEDICAL_NER_MODEL, Entity, clean_entities, load_biomedical_pipeline, run_biomedical
+from common.paths import cache_root
+
+MAX_TOKENS = 512
+ONNX_OPSET = 14
+# Share of spans the int8 model must reproduce for `verify` to pass
+MIN_AGREEMENT = 0.95
+
+# Sentences used by `verify` when no file is given
+PARITY_SAMPLES = [
+    "The patient was treated with 500 mg of amoxicillin twice daily for acute otitis media.",
+    "Metformin remains the first-line therapy for type 2 diabetes mellitus in adults.",
+    "The EMA recommended suspending the marketing authorisation of ranitidine because of NDMA contamination.",
+    "Adverse reactions included nausea, headache and elevated liver enzymes after vaccination.",
+    "Pembrolizumab is a monoclonal antibody that targets the PD-1 receptor on T cells.",
+    "Children under 12 years should not receive codeine for cough or cold symptoms.",
+    "A recall was issued for batches of valsartan tablets manufactured in China.",
+    "Patients with severe renal impairment require a reduced dose of apixaban.",
+]
+
+logger = logging.getLogger(__name__)
+
+
+def default_model_dir() -> str:
+    return os.environ.get('RI_NER_ONNX_DIR') or os.path.join(cache_root(), 'ner-onnx')
+
+
+def export(model: str = BIOMEDICAL_NER_MODEL, out_dir: Optional[str] = None) -> str:
+    """Export the model to ONNX, quantize it to int8 and return the quantized model path"""
+    import torch
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+    from transformers import AutoModelForTokenClassification, AutoTokenizer
+
+    out_dir = out_dir or default_model_dir()
+    os.makedirs(out_dir, exist_ok=True)
+    fp32_path = os.path.join(out_dir, 'model.onnx')
+    int8_path = os.path.join(out_dir, 'model.int8.onnx')
+
+    tokenizer = AutoTokenizer.from_pretrained(model)
+    network = AutoModelForTokenClassification.from_pretrained(model)
+    network.eval()
+
+    sample = tokenizer(["Aspirin reduces fever."], return_tensors='pt')
+    with torch.no_grad():
+        torch.onnx.export(
+            network,
+            (sample['input_ids'], sample['attention_mask']),
+            fp32_path,
+            input_names=['input_ids', 'attention_mask'],
+            output_names=['logits'],
+            dynamic_axes={
+                'input_ids': {0: 'batch', 1: 'sequence'},
+                'attention_mask': {0: 'batch', 1: 'sequence'},
+                'logits': {0: 'batch', 1: 'sequence'},
+            },
+            opset_version=ONNX_OPSET,
+        )
+    quantize_dynamic(fp32_path, int8_path, weight_type=QuantType.QInt8)
+
+    tokenizer.save_pretrained(out_dir)
+    with open(os.path.join(out_dir, 'labels.json'), 'w', encoding='utf-8') as fh:
+        json.dump({'model': model, 'id2label': {int(k): v for k, v in network.config.id2label.items()}}, fh, indent=2)
+
+    logger.info(f"Exported {model}: {os.path.getsize(fp32_path) >> 20} MB fp32 -> "
+                f"{os.path.getsize(int8_path) >> 20} MB int8 in {out_dir}")
+    return int8_path
+
+
+def _split_tag(label: str) -> Tuple[str, str]:
+    """('B' | 'I', tag) as the transformers pipeline reads IOB labels"""
+    if label.startswith('B-'):
+        return 'B', label[2:]
+    if label.startswith('I-'):
+        return 'I', label[2:]
+    return 'I', label
+
+
+class OnnxNerPipeline:
+    """onnxruntime token classification with transformers' 'simple' aggregation"""
+
+    def __init__(self, model_dir: Optional[str] = None, model_file: str = 'model.int8.onnx',
+                 num_threads: Optional[int] = None):
+        import onnxruntime
+        from transformers import AutoTokenizer
+
+        model_dir = model_dir or default_model_dir()
+        self.tokenizer = AutoTokenizer.from_pretrained(model_dir)
+        with open(os.path.join(model_dir, 'labels.json'), encoding='utf-8') as fh:
+            self.id2label = {int(k): v for k, v in json.load(fh)['id2label'].items()}
+
+        options = onnxruntime.SessionOptions()
+        if num_threads:
+            options.intra_op_num_threads = num_threads
+        self.session = onnxruntime.InferenceSession(os.path.join(model_dir, model_file), options,
+                                                    providers=['CPUExecutionProvider'])
+
+    def _group(self, tokens: List[Entity]) -> Entity:
+        return {
+            'entity_group': _split_tag(tokens[0]['entity'])[1],
+            'score': float(np.nanmean([token['score'] for token in tokens])),
+            'word': self.tokenizer.convert_tokens_to_string([token['word'] for token in tokens]),
+            'start': tokens[0]['start'],
+            'end': tokens[-1]['end'],
+        }
+
+    def _entities(self, text: str, input_ids, offsets, special, logits) -> List[Entity]:
+        shifted = np.exp(logits - logits.max(axis=-1, keepdims=True))
+        scores = shifted / shifted.sum(axis=-1, keepdims=True)
+
+        tokens = []
+        for idx, token_id in enumerate(input_ids):
+            if special[idx]:
+                continue
+            start, end = int(offsets[idx][0]), int(offsets[idx][1])
+            word = self.tokenizer.convert_ids_to_tokens(int(token_id))
+            if int(token_id) == self.tokenizer.unk_token_id:
+                word = text[start:end]
+            label_id = int(scores[idx].argmax())
+            tokens.append({'entity': self.id2label[label_id], 'score': float(scores[idx][label_id]),
+                           'word': word, 'start': start, 'end': end})
+
+        groups, current = [], []
+        for token in tokens:
+            if current:
+                bi, tag = _split_tag(token['entity'])
+                if not (tag == _split_tag(current[-1]['entity'])[1] and bi != 'B'):
+                    groups.append(self._group(current))
+                    current = []
+            current.append(token)
+        if current:
+            groups.append(self._group(current))
+        return [group for group in groups if group['entity_group'] != 'O']
+
+    def __call__(self, inputs, batch_size: int = 8):
+        single = isinstance(inputs, str)
+        texts = [inputs] if single else list(inputs)
+        results = []
+        for begin in range(0, len(texts), batch_size):
+            batch = texts[begin:begin + batch_size]
+            encoded = self.tokenizer(batch, padding=True, truncation=True, max_length=MAX_TOKENS,
+                                     return_offsets_mapping=True, return_special_tokens_mask=True,
+                                     return_tensors='np')
+            logits = self.session.run(['logits'], {
+                'input_ids': encoded['input_ids'].astype(np.int64),
+                'attention_mask': encoded['attention_mask'].astype(np.int64),
+            })[0]
+            for row, text in enumerate(batch):
+                length = int(encoded['attention_mask'][row].sum())
+                results.append(self._entities(text, encoded['input_ids'][row][:length],
+                                              encoded['offset_mapping'][row][:length],
+                                              encoded['special_tokens_mask'][row][:length],
+                                              logits[row][:length]))
+        return results[0] if single else results
+
+
+def load_onnx_pipeline(model_dir: Optional[str] = None) -> OnnxNerPipeline:
+    model_dir = model_dir or default_model_dir()
+    if not os.path.exists(os.path.join(model_dir, 'model.int8.onnx')):
+        export(out_dir=model_dir)
+    return OnnxNerPipeline(model_dir)
+
+
+def compare(reference: Sequence[Sequence[Entity]], candidate: Sequence[Sequence[Entity]],
+            score_tolerance: float = 0.1) -> dict:
+    """Span-level agreement between two NER outputs for the same texts"""
+    def spans(entities):
+        return {(e['entity_group'], e['start'], e['end']): e['score'] for e in entities}
+
+    matched = missing = extra = drifted = 0
+    for ref, cand in zip(reference, candidate):
+        ref_spans, cand_spans = spans(ref), spans(cand)
+        common = ref_spans.keys() & cand_spans.keys()
+        matched += len(common)
+        missing += len(ref_spans.keys() - cand_spans.keys())
+        extra += len(cand_spans.keys() - ref_spans.keys())
+        drifted += sum(1 for key in common if abs(ref_spans[key] - cand_spans[key]) > score_tolerance)
+    total = matched + missing + extra
+    return {
+        'matched': matched,
+        'missing': missing,
+        'extra': extra,
+        'score_drift': drifted,
+        'agreement': matched / total if total else 1.0,
+    }
+
+
+def verify(texts: Sequence[str], model_dir: Optional[str] = None, min_agreement: float = MIN_AGREEMENT) -> bool:
+    """Run PyTorch and int8 ONNX on the same texts and report span agreement"""
+    reference = run_biomedical(load_biomedical_pipeline(), texts)
+    candidate = [clean_entities(entities) for entities in load_onnx_pipeline(model_dir)(list(texts))]
+    report = compare(reference, candidate)
+    print(f"Spans matched: {report['matched']}, missing: {report['missing']}, extra: {report['extra']}, "
+          f"score drift > 0.1: {report['score_drift']}, agreement: {report['agreement']:.1%}")
+    ok = report['agreement'] >= min_agreement
+    print("✅ ONNX int8 output matches PyTorch" if ok else f"❌ Agreement below {min_agreement:.0%}")
+    return ok
+
+
+if __name__ == '__main__':
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description='Export and check the int8 ONNX biomedical NER model')
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('export', help='export and quantize the model')
+    check = sub.add_parser('verify', help='compare the ONNX model with the PyTorch pipeline')
+    check.add_argument('file', nargs='?', help='text file with one sample per line')
+    check.add_argument('--min-agreement', type=float, default=MIN_AGREEMENT)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    if args.command == 'export':
+        print(f"✅ {export()}")
+    else:
+        samples = PARITY_SAMPLES
+        if args.file:
+            with open(args.file, encoding='utf-8') as fh:
+                samples = [line.strip() for line in fh if line.strip()]
+        sys.exit(0 if verify(samples, min_agreement=args.min_agreement) else 1)
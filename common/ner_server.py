@@ -0,0 +1,270 @@
+"""Shared NER worker process.
+
+One worker per box loads the biomedical NER pipeline (and stanza, if asked
+for) once and answers batched requests from every scraper over a Unix
+socket. Scrapers use `ner_client()`, which connects lazily and starts the
+worker on first use if none is running:
+
+    entities = ner_client()(["Aspirin reduces the risk of stroke."])
+
+The client is callable like the transformers pipeline it replaces: a string
+gives one list of entity dicts, a list of strings gives one list per text.
+
+Run `python -m common.ner_server` to start the worker by hand; it exits after
+RI_NER_IDLE_TIMEOUT seconds (default 1800) without requests.
+
+Connections authenticate with a random per-user key kept next to the socket
+(mode 0600), the socket itself is only accessible to its owner, and messages
+are JSON, so nothing received over the socket is ever unpickled.
+"""
+import fcntl
+import json
+import logging
+import os
+import secrets
+import subprocess
+import sys
+import threading
+import time
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Listener
+from typing import List, Optional, Sequence, Union
+
+from common.lazy import timed
+from common.ner import Entity, load_biomedical_backend, load_stanza_pipeline, run_biomedical, run_stanza
+from common.paths import cache_path
+
+DEFAULT_IDLE_TIMEOUT = 30 * 60
+STARTUP_TIMEOUT = 300
+
+logger = logging.getLogger(__name__)
+
+
+def socket_path() -> str:
+    return os.environ.get('RI_NER_SOCKET') or cache_path('ner-worker.sock')
+
+
+def authkey(address: Optional[str] = None) -> bytes:
+    """Key shared by the worker and its clients, created on first use and readable by the owner only"""
+    path = (address or socket_path()) + '.key'
+    if not os.path.exists(path):
+        # Write under a private name, then link into place so no one reads a half-written key
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            with os.fdopen(fd, 'wb') as fh:
+                fh.write(secrets.token_hex(32).encode())
+            try:
+                os.link(tmp_path, path)
+            except FileExistsError:
+                pass  # another process won the race; use its key
+        finally:
+            os.remove(tmp_path)
+    info = os.stat(path)
+    if info.st_uid != os.getuid() or info.st_mode & 0o077:
+        raise PermissionError(f"{path} must be owned by the current user with mode 0600")
+    with open(path, 'rb') as fh:
+        return fh.read().strip()
+
+
+def _send(conn, message):
+    conn.send_bytes(json.dumps(message).encode('utf-8'))
+
+
+def _recv(conn):
+    return json.loads(conn.recv_bytes().decode('utf-8'))
+
+
+class NerServer:
+    """Owns the models and serves requests from any number of client connections"""
+
+    def __init__(self, address: Optional[str] = None, idle_timeout: float = DEFAULT_IDLE_TIMEOUT):
+        self.address = address or socket_path()
+        self.idle_timeout = idle_timeout
+        self._models = {}
+        self._model_lock = threading.Lock()
+        self._last_request = time.monotonic()
+        self._stopping = threading.Event()
+
+    def _model(self, name: str):
+        if name not in self._models:
+            with timed(f"load {name} NER model"):
+                self._models[name] = load_biomedical_backend() if name == 'biomedical' else load_stanza_pipeline()
+        return self._models[name]
+
+    def handle(self, op: str, payload):
+        self._last_request = time.monotonic()
+        if op == 'ping':
+            return 'pong'
+        if op == 'shutdown':
+            self._stopping.set()
+            return 'bye'
+        if op in ('biomedical', 'stanza'):
+            # One model call at a time; requests from different scrapers queue here
+            with self._model_lock:
+                model = self._model(op)
+                return run_biomedical(model, payload) if op == 'biomedical' else run_stanza(model, payload)
+        raise ValueError(f"Unknown NER request: {op}")
+
+    def _serve_connection(self, conn):
+        with conn:
+            while not self._stopping.is_set():
+                try:
+                    op, payload = _recv(conn)
+                except (EOFError, OSError):
+                    return
+                except (ValueError, TypeError) as e:
+                    _send(conn, ['error', f"Malformed request: {e}"])
+                    continue
+                try:
+                    _send(conn, ['ok', self.handle(op, payload)])
+                except Exception as e:
+                    logger.exception(f"NER request {op} failed")
+                    _send(conn, ['error', f"{type(e).__name__}: {e}"])
+
+    def _watch_idle(self):
+        while not self._stopping.wait(30):
+            if time.monotonic() - self._last_request > self.idle_timeout:
+                logger.info("NER worker idle, shutting down")
+                self._stopping.set()
+        # Wake the accept() loop so it sees the stop flag
+        _ping(self.address)
+
+    def serve_forever(self):
+        # Only one worker per socket; a second one started in a race just exits
+        lock_file = open(self.address + '.lock', 'w')
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            logger.info(f"NER worker already running on {self.address}")
+            lock_file.close()
+            return
+        if os.path.exists(self.address):
+            os.remove(self.address)  # left behind by a worker that died
+
+        # Owner-only socket: created under a restrictive umask, then chmod'ed to be sure
+        old_umask = os.umask(0o077)
+        try:
+            listener = Listener(self.address, family='AF_UNIX', authkey=authkey(self.address))
+        finally:
+            os.umask(old_umask)
+        os.chmod(self.address, 0o600)
+        threading.Thread(target=self._watch_idle, daemon=True).start()
+        logger.info(f"NER worker listening on {self.address}")
+        try:
+            while not self._stopping.is_set():
+                try:
+                    conn = listener.accept()
+                except AuthenticationError:
+                    logger.warning("Rejected a NER connection with a wrong key")
+                    continue
+                except OSError:
+                    break
+                threading.Thread(target=self._serve_connection, args=(conn,), daemon=True).start()
+        finally:
+            listener.close()
+            if os.path.exists(self.address):
+                os.remove(self.address)
+            lock_file.close()
+
+
+def _ping(address: str) -> bool:
+    try:
+        with Client(address, family='AF_UNIX', authkey=authkey(address)) as conn:
+            _send(conn, ['ping', None])
+            return _recv(conn) == ['ok', 'pong']
+    except (OSError, EOFError, ValueError, AuthenticationError):
+        return False
+
+
+class NerClient:
+    """Connection to the shared NER worker, started on demand"""
+
+    def __init__(self, address: Optional[str] = None, autostart: bool = True):
+        self.address = address or socket_path()
+        self.autostart = autostart
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        if self._conn is not None:
+            return self._conn
+        try:
+            self._conn = Client(self.address, family='AF_UNIX', authkey=authkey(self.address))
+            return self._conn
+        except OSError:
+            if not self.autostart:
+                raise
+        with timed('start NER worker'):
+            self._start_worker()
+        self._conn = Client(self.address, family='AF_UNIX', authkey=authkey(self.address))
+        return self._conn
+
+    def _start_worker(self):
+        repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        log_path = cache_path('ner-worker.log')
+        logger.info(f"Starting shared NER worker (log: {log_path})")
+        with open(log_path, 'ab') as log:
+            subprocess.Popen([sys.executable, '-m', 'common.ner_server'], cwd=repo_root,
+                             stdout=log, stderr=subprocess.STDOUT, start_new_session=True)
+        deadline = time.monotonic() + STARTUP_TIMEOUT
+        while time.monotonic() < deadline:
+            if os.path.exists(self.address) and _ping(self.address):
+                return
+            time.sleep(0.2)
+        raise TimeoutError(f"NER worker did not start within {STARTUP_TIMEOUT}s (see {log_path})")
+
+    def request(self, op: str, payload=None):
+        with self._lock:
+            for attempt in range(2):
+                conn = self._connect()
+                try:
+                    _send(conn, [op, payload])
+                    status, result = _recv(conn)
+                    break
+                except (EOFError, OSError):
+                    # The worker went away (idle shutdown or crash); reconnect once
+                    self._conn = None
+                    if attempt:
+                        raise
+        if status != 'ok':
+            raise RuntimeError(f"NER worker error: {result}")
+        return result
+
+    def entities(self, texts: Sequence[str]) -> List[List[Entity]]:
+        """Biomedical entities for each text"""
+        return self.request('biomedical', list(texts))
+
+    def stanza(self, texts: Sequence[str]) -> List[List[Entity]]:
+        """stanza English NER entities for each text"""
+        return self.request('stanza', list(texts))
+
+    def __call__(self, inputs: Union[str, Sequence[str]], **kwargs):
+        if isinstance(inputs, str):
+            return self.entities([inputs])[0]
+        return self.entities(inputs)
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def ner_client() -> NerClient:
+    """Process-wide client; nothing is loaded or connected until the first request"""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = NerClient()
+        return _client
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    idle = float(os.environ.get('RI_NER_IDLE_TIMEOUT', DEFAULT_IDLE_TIMEOUT))
+    NerServer(idle_timeout=idle).serve_forever()
@@ -0,0 +1,14 @@
+"""Location of the on-disk caches shared by all scrapers."""
+import os
+
+
+def cache_root() -> str:
+    """Base cache directory (RI_CACHE_DIR, defaulting to ~/.cache/ri)"""
+    return os.environ.get('RI_CACHE_DIR') or os.path.join(os.path.expanduser('~'), '.cache', 'ri')
+
+
+def cache_path(*parts: str) -> str:
+    """Path inside the cache root; parent directories are created on demand"""
+    path = os.path.join(cache_root(), *parts)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return path
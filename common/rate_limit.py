@@ -0,0 +1,67 @@
+"""Thread-safe rate limiting and retry helpers for calls to external services."""
+import logging
+import random
+import threading
+import time
+from typing import Callable, Tuple, Type, TypeVar
+
+T = TypeVar('T')
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """`rate` tokens per second with bursts of up to `capacity`; acquire() blocks until one is free"""
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = max(capacity, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        with self._lock:
+            self._refill()
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Take tokens, sleeping as long as needed; returns the time waited"""
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                delay = (tokens - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+def retry_with_jitter(func: Callable[[], T], retries: int = 3, base_delay: float = 1.0, max_delay: float = 30.0,
+                      retry_on: Tuple[Type[BaseException], ...] = (Exception,),
+                      give_up_on: Tuple[Type[BaseException], ...] = ()) -> T:
+    """Call func, retrying failures after a random delay in [0, base_delay * 2**attempt] ("full jitter").
+
+    Exceptions in `give_up_on` are raised immediately.
+    """
+    for attempt in range(retries + 1):
+        try:
+            return func()
+        except retry_on as e:
+            if attempt == retries or isinstance(e, give_up_on):
+                raise
+            delay = random.uniform(0, min(max_delay, base_delay * 2 ** attempt))
+            logger.debug(f"Attempt {attempt + 1} failed ({e}); retrying in {delay:.1f}s")
+            time.sleep(delay)
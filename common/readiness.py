@@ -0,0 +1,165 @@
+"""Condition-based waits for the Selenium scrapers.
+
+Fixed `time.sleep()` calls after every page load, tab switch, consent click
+and paginator click either waste time (the page was ready long before) or
+are too short on a slow day. The helpers here wait for the actual signal
+instead: the document has been parsed and the element the scraper reads next
+is present, a clicked banner is gone, the old list has been replaced, more
+items have appeared, or the network has gone quiet.
+
+What "ready" means for a site is declared in READINESS, one selector per kind
+of page (XPath if it starts with '/' or '(', CSS otherwise):
+
+    self.driver.get(url)
+    wait_ready(self.driver, 'who.int', 'article')
+
+Every wait records how long it took; `wait_stats()` has the totals per site
+and they are logged at exit, so slow sites and bad timeouts show up in logs.
+Like the sleeps they replace, the helpers do not fail: they return False on
+timeout, unless `required=True` asks for a TimeoutException.
+"""
+import atexit
+import logging
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+DEFAULT_TIMEOUT = 10
+POLL_INTERVAL = 0.1
+
+# Network counts as idle when no new resource has started for this long
+NETWORK_QUIET = 0.5
+
+READINESS: Dict[str, Dict[str, str]] = {
+    # Detail pages without an entry are server-rendered: parsed means ready
+    'moh.gov.cy': {'listing': '//table//tr'},
+    'bfarm.de': {'listing': "//table[@class='textualData links']", 'article': '//main'},
+    'fda.gov': {'listing': "//table[@id='DataTables_Table_0']/tbody/tr"},
+    'fimea.fi': {'listing': '//li[@class="list list__item"]', 'article': '//main'},
+    'gmp-compliance.org': {'listing': '//div[@data-types="NEWS"]/span'},
+    'hpra.ie': {'listing': "//div[@class='news-wrapper']/a", 'article': '//article'},
+    'santesecu.public.lu': {'listing': '//article[@class="article article--image"]'},
+    'medicinesauthority.gov.mt': {'listing': '.archive-entry', 'article': '.news-single-container'},
+    'dmp.no': {'listing': '//li[@class="list-result-wrapper"]'},
+    'lakemedelsverket.se': {'article': '.news-page__main'},
+    'who.int': {'listing': '.link-container.table', 'article': 'article.sf-detail-body-wrapper'},
+    'raps.org': {'listing': '//div[@class="item-content"]'},
+    'ich.org': {'listing': 'section.news-summary'},
+    'ima.is': {'listing': '.articlelist__item'},
+    'swissmedic.ch': {'listing': '.mod-teaser'},
+}
+
+logger = logging.getLogger(__name__)
+
+_stats: Dict[Tuple[str, str], Dict[str, float]] = {}
+_stats_lock = threading.Lock()
+
+
+def _record(site: Optional[str], label: str, seconds: float, ok: bool):
+    with _stats_lock:
+        entry = _stats.setdefault((site or '-', label), {'count': 0, 'total': 0.0, 'max': 0.0, 'timeouts': 0})
+        entry['count'] += 1
+        entry['total'] += seconds
+        entry['max'] = max(entry['max'], seconds)
+        if not ok:
+            entry['timeouts'] += 1
+
+
+def wait_stats() -> Dict[Tuple[str, str], Dict[str, float]]:
+    """Count, total/max seconds and timeouts of the waits so far, per (site, label)"""
+    with _stats_lock:
+        return {key: dict(entry) for key, entry in _stats.items()}
+
+
+def locator(selector: str) -> Tuple[str, str]:
+    """Selenium locator for a READINESS selector"""
+    from selenium.webdriver.common.by import By
+
+    return (By.XPATH if selector.startswith(('/', '(')) else By.CSS_SELECTOR, selector)
+
+
+def wait_for(driver, condition: Callable, timeout: float = DEFAULT_TIMEOUT, label: str = 'condition',
+             site: Optional[str] = None, required: bool = False) -> bool:
+    """Wait until condition(driver) is truthy; True if it happened before the timeout"""
+    from selenium.common.exceptions import TimeoutException
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    started = time.perf_counter()
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=POLL_INTERVAL).until(condition)
+        ok = True
+    except TimeoutException:
+        ok = False
+    _record(site, label, time.perf_counter() - started, ok)
+    if not ok:
+        logger.debug(f"Wait for {label} on {site} timed out after {timeout}s")
+        if required:
+            raise TimeoutException(f"{label} not reached on {site} within {timeout}s")
+    return ok
+
+
+def _document_parsed(driver) -> bool:
+    return driver.execute_script(
+        "return document.readyState !== 'loading' && location.href !== 'about:blank'")
+
+
+def wait_ready(driver, site: str, page: str = 'listing', timeout: float = DEFAULT_TIMEOUT,
+               required: bool = False) -> bool:
+    """Wait until the document is parsed and the site's selector for this kind of page is present"""
+    from selenium.webdriver.support import expected_conditions as EC
+
+    selector = READINESS.get(site, {}).get(page)
+    present = EC.presence_of_element_located(locator(selector)) if selector else None
+
+    def ready(d):
+        return _document_parsed(d) and (present is None or present(d))
+
+    return wait_for(driver, ready, timeout, page, site, required)
+
+
+def wait_hidden(driver, element, timeout: float = 5, site: Optional[str] = None) -> bool:
+    """Wait until a clicked element (e.g. a consent banner button) is hidden or removed"""
+    from selenium.webdriver.support import expected_conditions as EC
+
+    return wait_for(driver, EC.invisibility_of_element(element), timeout, 'hidden', site)
+
+
+def wait_stale(driver, element, timeout: float = DEFAULT_TIMEOUT, site: Optional[str] = None,
+               required: bool = False) -> bool:
+    """Wait until an element of the old page has been replaced (after navigation or pagination)"""
+    from selenium.webdriver.support import expected_conditions as EC
+
+    if element is None:
+        return True
+    return wait_for(driver, EC.staleness_of(element), timeout, 'replaced', site, required)
+
+
+def wait_count_above(driver, selector: str, count: int, timeout: float = DEFAULT_TIMEOUT,
+                     site: Optional[str] = None, required: bool = False) -> bool:
+    """Wait until more than `count` elements match (after a "load more" click)"""
+    by, value = locator(selector)
+    return wait_for(driver, lambda d: len(d.find_elements(by, value)) > count, timeout, 'more items', site, required)
+
+
+def wait_network_idle(driver, quiet: float = NETWORK_QUIET, timeout: float = DEFAULT_TIMEOUT,
+                      site: Optional[str] = None) -> bool:
+    """Wait until the page is loaded and no new request has started for `quiet` seconds"""
+    state = {'count': -1, 'since': time.monotonic()}
+
+    def idle(d):
+        count = d.execute_script(
+            "return document.readyState === 'complete' ? performance.getEntriesByType('resource').length : -1")
+        now = time.monotonic()
+        if count < 0 or count != state['count']:
+            state['count'], state['since'] = count, now
+            return False
+        return now - state['since'] >= quiet
+
+    return wait_for(driver, idle, timeout, 'network idle', site)
+
+
+@atexit.register
+def _report_waits():
+    for (site, label), entry in sorted(wait_stats().items()):
+        logger.info(f"Waits {site}/{label}: {entry['count']} x, {entry['total']:.1f}s total, "
+                    f"{entry['max']:.1f}s max, {entry['timeouts']} timeouts")
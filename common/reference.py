@@ -0,0 +1,799 @@
+"""Reference tables shared by all scrapers.
+
+Every scraper used to carry its own copy of the language, document type,
+product type, country pattern and region tables, rebuilt for each spider
+instance (several scrapers built them twice). They are defined here once per
+process as read-only structures - mappings are `MappingProxyType`, keyword
+lists are tuples - so spiders running in the same process share one copy, the
+per-table caches of common.gazetteer and common.keyword_classifier compile
+each table once, and no scraper can change a table under another one.
+
+Scrapers whose tables differ slightly from the shared ones derive their
+variant from it (`without_keywords`, `with_keywords`) instead of copying it.
+
+    from common import reference
+
+    class MySpider(scrapy.Spider):
+        COUNTRY_PATTERNS = reference.COUNTRY_PATTERNS
+"""
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Mapping, Tuple
+
+KeywordTable = Mapping[str, Tuple[str, ...]]
+
+
+def freeze(value: Any) -> Any:
+    """Read-only copy of nested dicts/lists: dicts become MappingProxyType, lists and sets tuples"""
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def without_keywords(table: KeywordTable, *keywords: str) -> KeywordTable:
+    """Frozen copy of a keyword table with the given keywords removed from every category"""
+    dropped = set(keywords)
+    return freeze({category: [kw for kw in words if kw not in dropped] for category, words in table.items()})
+
+
+def with_keywords(table: KeywordTable, additions: Mapping[str, Iterable[str]]) -> KeywordTable:
+    """Frozen copy of a keyword table with extra keywords appended to some categories"""
+    return freeze({category: list(words) + list(additions.get(category, ())) for category, words in table.items()})
+
+
+def _first_index(pairs: Iterable[Tuple[str, str]]) -> Mapping[str, str]:
+    index: Dict[str, str] = {}
+    for key, value in pairs:
+        index.setdefault(key, value)
+    return MappingProxyType(index)
+
+
+# Language code to full name mapping
+LANGUAGE_NAMES = freeze({
+    'af': 'Afrikaans',
+    'ar': 'Arabic',
+    'bg': 'Bulgarian',
+    'bn': 'Bengali',
+    'ca': 'Catalan',
+    'cs': 'Czech',
+    'cy': 'Welsh',
+    'da': 'Danish',
+    'de': 'German',
+    'el': 'Greek',
+    'en': 'English',
+    'es': 'Spanish',
+    'et': 'Estonian',
+    'fa': 'Persian',
+    'fi': 'Finnish',
+    'fr': 'French',
+    'gu': 'Gujarati',
+    'he': 'Hebrew',
+    'hi': 'Hindi',
+    'hr': 'Croatian',
+    'hu': 'Hungarian',
+    'id': 'Indonesian',
+    'it': 'Italian',
+    'ja': 'Japanese',
+    'kn': 'Kannada',
+    'ko': 'Korean',
+    'lt': 'Lithuanian',
+    'lv': 'Latvian',
+    'mk': 'Macedonian',
+    'ml': 'Malayalam',
+    'mr': 'Marathi',
+    'ne': 'Nepali',
+    'nl': 'Dutch',
+    'no': 'Norwegian',
+    'pa': 'Punjabi',
+    'pl': 'Polish',
+    'pt': 'Portuguese',
+    'ro': 'Romanian',
+    'ru': 'Russian',
+    'sk': 'Slovak',
+    'sl': 'Slovenian',
+    'so': 'Somali',
+    'sq': 'Albanian',
+    'sv': 'Swedish',
+    'sw': 'Swahili',
+    'ta': 'Tamil',
+    'te': 'Telugu',
+    'th': 'Thai',
+    'tl': 'Tagalog',
+    'tr': 'Turkish',
+    'uk': 'Ukrainian',
+    'ur': 'Urdu',
+    'vi': 'Vietnamese',
+    'zh-cn': 'Chinese (Simplified)',
+    'zh-tw': 'Chinese (Traditional)'
+})
+
+# Full name to language code (first code wins, e.g. 'Chinese (Simplified)' -> 'zh-cn')
+LANGUAGE_CODES = _first_index((name, code) for code, name in LANGUAGE_NAMES.items())
+
+# Document type keywords, in classification priority order
+DOCUMENT_TYPES = freeze({
+    'Announcement': ['announcement', 'notification', 'bulletin'],
+    'Expert Report': ['expert report', 'technical report', 'scientific opinion'],
+    'Amendment': ['amendment', 'regulation change', 'regulatory update'],
+    'Law': ['law', 'legislation', 'statute', 'act'],
+    'Directive': ['directive', 'guideline', 'policy'],
+    'Order': ['order', 'decision', 'ruling', 'decree'],
+    'Information Note': ['information note', 'information bulletin', 'notice'],
+    'Q&A': ['questions and answers', 'q&a', 'faq', 'frequently asked'],
+    'Instructions': ['instructions', 'manual', 'guidance', 'procedure'],
+    'Resolution': ['resolution', 'conclusion', 'determination'],
+    'Consultation': ['consultation', 'public hearing', 'stakeholder input'],
+    'Product Info': ['product information', 'package leaflet', 'product update'],
+    'Regulatory Decision': ['regulatory decision', 'approval summary', 'assessment'],
+    'Evaluation': ['evaluation report', 'assessment report', 'review report'],
+    'Recommendation': ['recommendation', 'advice', 'suggestion'],
+    'Checklist': ['checklist', 'verification list', 'review points'],
+    'Approval Tracker': ['approval tracker', 'authorization status', 'timeline'],
+    'CHMP Opinion': ['chmp opinion', 'committee opinion', 'scientific opinion'],
+    'Committee': ['committee', 'working group', 'task force'],
+    'CV': ['curriculum vitae', 'cv', 'resume'],
+    'EPAR': ['epar', 'european public assessment report'],
+    'Letter': ['letter', 'correspondence', 'official communication'],
+    'Meeting': ['meeting', 'conference', 'session'],
+    'Withdrawal': ['withdrawn application', 'cancelled submission'],
+    'Communication': ['communication', 'announcement', 'message'],
+    'Decree': ['decree', 'royal decree', 'official order'],
+    'Form': ['form', 'application form', 'submission form'],
+    'Regulatory History': ['regulatory history', 'dossier history', 'timeline'],
+    'Press Release': ['press release', 'news release', 'media statement'],
+    'Ordinance': ['ordinance', 'local regulation', 'municipal law'],
+    'Advisory Committee': ['advisory committee', 'committee profile'],
+    'Voting': ['voting', 'committee vote', 'decision outcome'],
+    'Petition': ['citizen petition', 'public petition', 'request'],
+    'Federal Register': ['federal register', 'official gazette', 'journal'],
+    'Inspection': ['inspection report', 'audit report', 'site visit'],
+    'SOP': ['sop', 'standard procedure', 'operating protocol'],
+    'BLA Approval': ['bla', 'biologics license application'],
+    'BLA Supplement': ['supplemental bla', 'bla amendment'],
+    'NDA Supplement': ['supplemental nda', 'nda amendment'],
+    '510(k)': ['510(k)', 'premarket notification'],
+    'NDA Approval': ['nda', 'new drug application'],
+    'Other Type': []
+})
+
+# Without the short keywords that match inside unrelated words ('act', 'nda')
+DOCUMENT_TYPES_STRICT = without_keywords(DOCUMENT_TYPES, 'act', 'nda')
+
+# Product type keywords
+PRODUCT_TYPES = freeze({
+    'Biological': [
+        'biological', 'biologic', 'monoclonal antibody', 'mab', 'recombinant',
+        'cell therapy', 'gene therapy', 'blood product', 'plasma derived'
+    ],
+    'Drug Product': [
+        'drug product', 'finished product', 'formulation', 'dosage form',
+        'tablet', 'capsule', 'injection', 'solution'
+    ],
+    'Drug Substance': [
+        'drug substance', 'active substance', 'api', 'active ingredient',
+        'bulk drug', 'chemical entity', 'reference standard'
+    ],
+    'Vaccine': [
+        'vaccine', 'vaccination', 'immunization', 'antigen', 'adjuvant',
+        'mmr', 'dtap', 'hpv', 'influenza', 'covid-19', 'sars-cov-2'
+    ],
+    'Small Molecule': [
+        'small molecule', 'chemical drug', 'synthetic', 'organic compound',
+        'nme', 'new molecular entity', 'low molecular weight'
+    ],
+    'Medical Device': [
+        'medical device', 'implant', 'stent', 'catheter', 'prosthesis',
+        'pacemaker', 'defibrillator', 'surgical instrument'
+    ],
+    'IVD': [
+        'ivd', 'in vitro diagnostic', 'diagnostic test', 'assay',
+        'reagent', 'test kit', 'analyzer', 'rapid test'
+    ],
+    'Other': []
+})
+
+# Product types with the extra biologic and dosage form terms used by the EMA/EC/ICH scrapers
+PRODUCT_TYPES_EXTENDED = with_keywords(PRODUCT_TYPES, {
+    'Biological': ['therapeutic protein', 'insulin', 'erythropoietin', 'immunoglobulin', 'stem cell'],
+    'Drug Product': ['suspension', 'biopharmaceutical', 'biosimilar', 'cream', 'ointment', 'gel',
+                     'suppository', 'inhalation'],
+})
+
+# Country patterns for detection in text
+COUNTRY_PATTERNS = freeze({
+    # Europe (Complete list)
+    'Albania': ['albania', 'shqipëria', 'tirana'],
+    'Andorra': ['andorra', 'andorre'],
+    'Austria': ['austria', 'österreich', 'vienna'],
+    'Belarus': ['belarus', 'belarús', 'minsk'],
+    'Belgium': ['belgium', 'belgique', 'belgie', 'brussels'],
+    'Bosnia and Herzegovina': ['bosnia', 'herzegovina', 'sarajevo'],
+    'Bulgaria': ['bulgaria', 'българия', 'sofia'],
+    'Croatia': ['croatia', 'hrvatska', 'zagreb'],
+    'Cyprus': ['cyprus', 'κύπρος', 'lefkosia', 'nicosia', 'republic of cyprus'],
+    'Czech Republic': ['czech republic', 'česko', 'prague'],
+    'Denmark': ['denmark', 'danmark', 'copenhagen'],
+    'Estonia': ['estonia', 'eesti', 'tallinn'],
+    'Finland': ['finland', 'suomi', 'helsinki'],
+    'France': ['france', 'french', 'paris'],
+    'Germany': ['germany', 'deutschland', 'berlin'],
+    'Greece': ['greece', 'ελλάδα', 'athens'],
+    'Hungary': ['hungary', 'magyarország', 'budapest'],
+    'Iceland': ['iceland', 'ísland', 'reykjavik'],
+    'Ireland': ['ireland', 'éire', 'dublin'],
+    'Italy': ['italy', 'italia', 'rome'],
+    'Latvia': ['latvia', 'latvija', 'riga'],
+    'Liechtenstein': ['liechtenstein', 'vaduz'],
+    'Lithuania': ['lithuania', 'lietuva', 'vilnius'],
+    'Luxembourg': ['luxembourg', 'luxemburg', 'luxembourg city'],
+    'Malta': ['malta', 'valletta'],
+    'Moldova': ['moldova', 'chișinău'],
+    'Monaco': ['monaco', 'monaco-ville'],
+    'Montenegro': ['montenegro', 'crna gora', 'podgorica'],
+    'Netherlands': ['netherlands', 'nederland', 'holland', 'amsterdam'],
+    'North Macedonia': ['north macedonia', 'macedonia', 'skopje'],
+    'Norway': ['norway', 'norge', 'oslo'],
+    'Poland': ['poland', 'polska', 'warsaw'],
+    'Portugal': ['portugal', 'lisbon'],
+    'Romania': ['romania', 'românia', 'bucharest'],
+    'Russia': ['russia', 'россия', 'moscow', 'russian federation'],
+    'San Marino': ['san marino'],
+    'Serbia': ['serbia', 'srbija', 'belgrade'],
+    'Slovakia': ['slovakia', 'slovensko', 'bratislava'],
+    'Slovenia': ['slovenia', 'slovenija', 'ljubljana'],
+    'Spain': ['spain', 'españa', 'madrid'],
+    'Sweden': ['sweden', 'sverige', 'stockholm'],
+    'Switzerland': ['switzerland', 'suisse', 'schweiz', 'bern'],
+    'Ukraine': ['ukraine', 'україна', 'kyiv'],
+    'United Kingdom': ['uk', 'united kingdom', 'britain', 'london'],
+    'Vatican City': ['vatican', 'holy see'],
+
+    # Americas (Complete list)
+    'Antigua and Barbuda': ['antigua', 'barbuda', "antigua and barbuda", 'saint john'],
+    'Argentina': ['argentina', 'buenos aires', 'argentine republic'],
+    'Bahamas': ['bahamas', 'nassau', 'commonwealth of the bahamas'],
+    'Barbados': ['barbados', 'bridgetown'],
+    'Belize': ['belize', 'belmopan'],
+    'Bolivia': ['bolivia', 'sucre', 'la paz', 'plurinational state'],
+    'Brazil': ['brazil', 'brasil', 'brasília', 'rio de janeiro', 'federative republic'],
+    'Canada': ['canada', 'ottawa', 'toronto', 'ontario', 'quebec'],
+    'Chile': ['chile', 'santiago', 'republic of chile'],
+    'Colombia': ['colombia', 'bogotá', 'bogota', 'republic of colombia'],
+    'Costa Rica': ['costa rica', 'san josé', 'san jose'],
+    'Cuba': ['cuba', 'havana', 'republic of cuba'],
+    'Dominica': ['dominica', 'roseau', 'commonwealth of dominica'],
+    'Dominican Republic': ['dominican republic', 'santo domingo'],
+    'Ecuador': ['ecuador', 'quito', 'republic of ecuador'],
+    'El Salvador': ['el salvador', 'san salvador', 'republic of el salvador'],
+    'Grenada': ['grenada', "saint george"],
+    'Guatemala': ['guatemala', 'guatemala city', 'republic of guatemala'],
+    'Guyana': ['guyana', 'georgetown', 'cooperative republic'],
+    'Haiti': ['haiti', 'port-au-prince', 'republic of haiti'],
+    'Honduras': ['honduras', 'tegucigalpa', 'republic of honduras'],
+    'Jamaica': ['jamaica', 'kingston'],
+    'Mexico': ['mexico', 'méxico', 'mexico city', 'cdmx', 'estados unidos mexicanos'],
+    'Nicaragua': ['nicaragua', 'managua', 'republic of nicaragua'],
+    'Panama': ['panama', 'panama city', 'republic of panama'],
+    'Paraguay': ['paraguay', 'asunción', 'asunción', 'republic of paraguay'],
+    'Peru': ['peru', 'lima', 'republic of peru'],
+    'Saint Kitts and Nevis': ['saint kitts', 'nevis', 'basseterre'],
+    'Saint Lucia': ['saint lucia', 'castries'],
+    'Saint Vincent and the Grenadines': ['saint vincent', 'grenadines', 'kingstown'],
+    'Suriname': ['suriname', 'paramaribo', 'republic of suriname'],
+    'Trinidad and Tobago': ['trinidad', 'tobago', 'port of spain'],
+    'United States': ['usa', 'u\\.s\\.', 'united states', 'america', 'washington dc', 'new york', 'california'],
+    'Uruguay': ['uruguay', 'montevideo', 'oriental republic'],
+    'Venezuela': ['venezuela', 'caracas', 'bolivarian republic'],
+
+    # Asia (Complete list)
+    'Afghanistan': ['afghanistan', 'kabul', 'islamic emirate'],
+    'Armenia': ['armenia', 'yerevan', 'republic of armenia'],
+    'Azerbaijan': ['azerbaijan', 'baku', 'republic of azerbaijan'],
+    'Bahrain': ['bahrain', 'manama', 'kingdom of bahrain'],
+    'Bangladesh': ['bangladesh', 'dhaka', "people's republic"],
+    'Bhutan': ['bhutan', 'thimphu', 'kingdom of bhutan'],
+    'Brunei': ['brunei', 'bandar seri begawan', 'darussalam'],
+    'Cambodia': ['cambodia', 'phnom penh', 'kingdom of cambodia'],
+    'China': ['china', 'zhongguo', 'beijing', 'shanghai', "people's republic"],
+    'Georgia': ['georgia', 'tbilisi'],
+    'India': ['india', 'bharat', 'new delhi', 'mumbai', 'republic of india'],
+    'Indonesia': ['indonesia', 'jakarta', 'republic of indonesia'],
+    'Iran': ['iran', 'tehran', 'islamic republic'],
+    'Iraq': ['iraq', 'baghdad', 'republic of iraq'],
+    'Israel': ['israel', 'jerusalem', 'state of israel'],
+    'Japan': ['japan', 'nippon', 'tokyo'],
+    'Jordan': ['jordan', 'amman', 'hashemite kingdom'],
+    'Kazakhstan': ['kazakhstan', 'nur-sultan', 'astana', 'republic of kazakhstan'],
+    'Kuwait': ['kuwait', 'kuwait city', 'state of kuwait'],
+    'Kyrgyzstan': ['kyrgyzstan', 'bishkek', 'kyrgyz republic'],
+    'Laos': ['laos', 'vientiane', "lao people's republic"],
+    'Lebanon': ['lebanon', 'beirut', 'lebanese republic'],
+    'Malaysia': ['malaysia', 'kuala lumpur', 'putrajaya'],
+    'Maldives': ['maldives', 'malé', 'republic of maldives'],
+    'Mongolia': ['mongolia', 'ulaanbaatar'],
+    'Myanmar': ['myanmar', 'burma', 'naypyidaw', 'republic of the union'],
+    'Nepal': ['nepal', 'kathmandu', 'federal democratic republic'],
+    'North Korea': ['north korea', 'dprk', 'pyongyang', "democratic people's republic"],
+    'Oman': ['oman', 'muscat', 'sultanate of oman'],
+    'Pakistan': ['pakistan', 'islamabad', 'islamic republic'],
+    'Palestine': ['palestine', 'ramallah', 'state of palestine'],
+    'Philippines': ['philippines', 'manila', 'republic of the philippines'],
+    'Qatar': ['qatar', 'doha', 'state of qatar'],
+    'Saudi Arabia': ['saudi arabia', 'riyadh', 'kingdom of saudi arabia'],
+    'Singapore': ['singapore', 'republic of singapore'],
+    'South Korea': ['south korea', 'korea republic', 'seoul', 'republic of korea'],
+    'Sri Lanka': ['sri lanka', 'colombo', 'sri jayawardenepura kotte'],
+    'Syria': ['syria', 'damascus', 'syrian arab republic'],
+    'Taiwan': ['taiwan', 'taipei', 'republic of china'],
+    'Tajikistan': ['tajikistan', 'dushanbe', 'republic of tajikistan'],
+    'Thailand': ['thailand', 'bangkok', 'kingdom of thailand'],
+    'Timor-Leste': ['timor-leste', 'east timor', 'dili', 'democratic republic'],
+    'Turkey': ['turkey', 'türkiye', 'ankara', 'republic of turkey'],
+    'Turkmenistan': ['turkmenistan', 'ashgabat'],
+    'United Arab Emirates': ['uae', 'united arab emirates', 'dubai', 'abu dhabi'],
+    'Uzbekistan': ['uzbekistan', 'tashkent', 'republic of uzbekistan'],
+    'Vietnam': ['vietnam', 'hanoi', 'socialist republic'],
+    'Yemen': ['yemen', "sana'a", 'republic of yemen'],
+
+    # Africa (Complete list)
+    'Algeria': ['algeria', 'algiers', "people's democratic republic"],
+    'Angola': ['angola', 'luanda', 'republic of angola'],
+    'Benin': ['benin', 'porto-novo', 'republic of benin'],
+    'Botswana': ['botswana', 'gaborone', 'republic of botswana'],
+    'Burkina Faso': ['burkina faso', 'ouagadougou'],
+    'Burundi': ['burundi', 'gitega', 'republic of burundi'],
+    'Cameroon': ['cameroon', 'yaoundé', 'republic of cameroon'],
+    'Cape Verde': ['cape verde', 'cabo verde', 'praia', 'republic of cape verde'],
+    'Central African Republic': ['central african republic', 'bangui'],
+    'Chad': ['chad', "n'djamena", 'republic of chad'],
+    'Comoros': ['comoros', 'moroni', 'union of the comoros'],
+    'Congo (Brazzaville)': ['republic of the congo', 'congo-brazzaville', 'brazzaville'],
+    'Congo (Kinshasa)': ['democratic republic of the congo', 'drc', 'kinshasa'],
+    "Côte d'Ivoire": ["côte d'ivoire", 'ivory coast', 'yamoussoukro'],
+    'Djibouti': ['djibouti', 'republic of djibouti'],
+    'Egypt': ['egypt', 'cairo', 'arab republic of egypt'],
+    'Equatorial Guinea': ['equatorial guinea', 'malabo', 'republic of equatorial guinea'],
+    'Eritrea': ['eritrea', 'asmara', 'state of eritrea'],
+    'Eswatini': ['eswatini', 'swaziland', 'mbabane', 'kingdom of eswatini'],
+    'Ethiopia': ['ethiopia', 'addis ababa', 'federal democratic republic'],
+    'Gabon': ['gabon', 'libreville', 'gabonese republic'],
+    'Gambia': ['gambia', 'banjul', 'republic of the gambia'],
+    'Ghana': ['ghana', 'accra', 'republic of ghana'],
+    'Guinea': ['guinea', 'conakry', 'republic of guinea'],
+    'Guinea-Bissau': ['guinea-bissau', 'bissau', 'republic of guinea-bissau'],
+    'Kenya': ['kenya', 'nairobi', 'republic of kenya'],
+    'Lesotho': ['lesotho', 'maseru', 'kingdom of lesotho'],
+    'Liberia': ['liberia', 'monrovia', 'republic of liberia'],
+    'Libya': ['libya', 'tripoli', 'state of libya'],
+    'Madagascar': ['madagascar', 'antananarivo', 'republic of madagascar'],
+    'Malawi': ['malawi', 'lilongwe', 'republic of malawi'],
+    'Mali': ['mali', 'bamako', 'republic of mali'],
+    'Mauritania': ['mauritania', 'nouakchott', 'islamic republic'],
+    'Mauritius': ['mauritius', 'port louis', 'republic of mauritius'],
+    'Morocco': ['morocco', 'rabat', 'kingdom of morocco'],
+    'Mozambique': ['mozambique', 'maputo', 'republic of mozambique'],
+    'Namibia': ['namibia', 'windhoek', 'republic of namibia'],
+    'Niger': ['niger', 'niamey', 'republic of niger'],
+    'Nigeria': ['nigeria', 'abuja', 'federal republic of nigeria'],
+    'Rwanda': ['rwanda', 'kigali', 'republic of rwanda'],
+    'Sao Tome and Principe': ['são tomé and príncipe', 'sao tome', 'são tomé'],
+    'Senegal': ['senegal', 'dakar', 'republic of senegal'],
+    'Seychelles': ['seychelles', 'victoria', 'republic of seychelles'],
+    'Sierra Leone': ['sierra leone', 'freetown', 'republic of sierra leone'],
+    'Somalia': ['somalia', 'mogadishu', 'federal republic of somalia'],
+    'South Africa': ['south africa', 'pretoria', 'cape town', 'republic of south africa'],
+    'South Sudan': ['south sudan', 'juba', 'republic of south sudan'],
+    'Sudan': ['sudan', 'khartoum', 'republic of the sudan'],
+    'Tanzania': ['tanzania', 'dodoma', 'united republic of tanzania'],
+    'Togo': ['togo', 'lomé', 'togolese republic'],
+    'Tunisia': ['tunisia', 'tunis', 'republic of tunisia'],
+    'Uganda': ['uganda', 'kampala', 'republic of uganda'],
+    'Zambia': ['zambia', 'lusaka', 'republic of zambia'],
+    'Zimbabwe': ['zimbabwe', 'harare', 'republic of zimbabwe'],
+
+    # International/Regional
+    'European Union': ['eu', 'european union', 'e\\.u\\.', 'brussels eu'],
+    'African Union': ['african union', 'au', 'addis ababa'],
+    'ASEAN': ['asean', 'southeast asia', 'jakarta'],
+    'Global': ['who', 'world health organization', 'united nations', 'international'],
+})
+
+# Pattern to country (first country wins for shared patterns)
+PATTERN_TO_COUNTRY = _first_index((pattern, country) for country, patterns in COUNTRY_PATTERNS.items()
+                                  for pattern in patterns)
+
+# Country to region
+REGION_MAPPING = freeze({
+    # Europe
+    'Albania': 'Southern Europe',
+    'Andorra': 'Southern Europe',
+    'Austria': 'Central Europe',
+    'Belarus': 'Eastern Europe',
+    'Belgium': 'Western Europe',
+    'Bosnia and Herzegovina': 'Southern Europe',
+    'Bulgaria': 'Eastern Europe',
+    'Croatia': 'Southern Europe',
+    'Czech Republic': 'Central Europe',
+    'Denmark': 'Northern Europe',
+    'Estonia': 'Northern Europe',
+    'Finland': 'Northern Europe',
+    'France': 'Western Europe',
+    'Germany': 'Central Europe',
+    'Greece': 'Southern Europe',
+    'Hungary': 'Central Europe',
+    'Iceland': 'Northern Europe',
+    'Ireland': 'Northern Europe',
+    'Italy': 'Southern Europe',
+    'Latvia': 'Northern Europe',
+    'Liechtenstein': 'Central Europe',
+    'Lithuania': 'Northern Europe',
+    'Luxembourg': 'Western Europe',
+    'Malta': 'Southern Europe',
+    'Moldova': 'Eastern Europe',
+    'Monaco': 'Western Europe',
+    'Montenegro': 'Southern Europe',
+    'Netherlands': 'Western Europe',
+    'North Macedonia': 'Southern Europe',
+    'Norway': 'Northern Europe',
+    'Poland': 'Central Europe',
+    'Portugal': 'Southern Europe',
+    'Romania': 'Eastern Europe',
+    'Russia': 'Eastern Europe',  # Transcontinental
+    'San Marino': 'Southern Europe',
+    'Serbia': 'Southern Europe',
+    'Slovakia': 'Central Europe',
+    'Slovenia': 'Southern Europe',
+    'Spain': 'Southern Europe',
+    'Sweden': 'Northern Europe',
+    'Switzerland': 'Central Europe',
+    'Ukraine': 'Eastern Europe',
+    'United Kingdom': 'Northern Europe',
+    'Vatican City': 'Southern Europe',
+
+    # Americas
+    # North America
+    'Canada': 'North America',
+    'United States': 'North America',
+    'Mexico': 'North America',
+
+    # Central America
+    'Belize': 'Central America',
+    'Costa Rica': 'Central America',
+    'El Salvador': 'Central America',
+    'Guatemala': 'Central America',
+    'Honduras': 'Central America',
+    'Nicaragua': 'Central America',
+    'Panama': 'Central America',
+
+    # Caribbean
+    'Antigua and Barbuda': 'Caribbean',
+    'Bahamas': 'Caribbean',
+    'Barbados': 'Caribbean',
+    'Cuba': 'Caribbean',
+    'Dominica': 'Caribbean',
+    'Dominican Republic': 'Caribbean',
+    'Grenada': 'Caribbean',
+    'Haiti': 'Caribbean',
+    'Jamaica': 'Caribbean',
+    'Saint Kitts and Nevis': 'Caribbean',
+    'Saint Lucia': 'Caribbean',
+    'Saint Vincent and the Grenadines': 'Caribbean',
+    'Trinidad and Tobago': 'Caribbean',
+
+    # South America
+    'Argentina': 'South America',
+    'Bolivia': 'South America',
+    'Brazil': 'South America',
+    'Chile': 'South America',
+    'Colombia': 'South America',
+    'Ecuador': 'South America',
+    'Guyana': 'South America',
+    'Paraguay': 'South America',
+    'Peru': 'South America',
+    'Suriname': 'South America',
+    'Uruguay': 'South America',
+    'Venezuela': 'South America',
+
+    # Asia
+    # Central Asia
+    'Kazakhstan': 'Central Asia',
+    'Kyrgyzstan': 'Central Asia',
+    'Tajikistan': 'Central Asia',
+    'Turkmenistan': 'Central Asia',
+    'Uzbekistan': 'Central Asia',
+
+    # East Asia
+    'China': 'East Asia',
+    'Japan': 'East Asia',
+    'Mongolia': 'East Asia',
+    'North Korea': 'East Asia',
+    'South Korea': 'East Asia',
+    'Taiwan': 'East Asia',
+
+    # South Asia
+    'Afghanistan': 'South Asia',
+    'Bangladesh': 'South Asia',
+    'Bhutan': 'South Asia',
+    'India': 'South Asia',
+    'Maldives': 'South Asia',
+    'Nepal': 'South Asia',
+    'Pakistan': 'South Asia',
+    'Sri Lanka': 'South Asia',
+
+    # Southeast Asia
+    'Brunei': 'Southeast Asia',
+    'Cambodia': 'Southeast Asia',
+    'Indonesia': 'Southeast Asia',
+    'Laos': 'Southeast Asia',
+    'Malaysia': 'Southeast Asia',
+    'Myanmar': 'Southeast Asia',
+    'Philippines': 'Southeast Asia',
+    'Singapore': 'Southeast Asia',
+    'Thailand': 'Southeast Asia',
+    'Timor-Leste': 'Southeast Asia',
+    'Vietnam': 'Southeast Asia',
+
+    # Middle East (West Asia)
+    'Armenia': 'Middle East',
+    'Azerbaijan': 'Middle East',
+    'Bahrain': 'Middle East',
+    'Cyprus': 'Middle East',
+    'Georgia': 'Middle East',
+    'Iran': 'Middle East',
+    'Iraq': 'Middle East',
+    'Israel': 'Middle East',
+    'Jordan': 'Middle East',
+    'Kuwait': 'Middle East',
+    'Lebanon': 'Middle East',
+    'Oman': 'Middle East',
+    'Palestine': 'Middle East',
+    'Qatar': 'Middle East',
+    'Saudi Arabia': 'Middle East',
+    'Syria': 'Middle East',
+    'Turkey': 'Middle East',
+    'United Arab Emirates': 'Middle East',
+    'Yemen': 'Middle East',
+
+    # ====== AFRICA ====== #
+    # Northern Africa
+    'Algeria': 'Northern Africa',
+    'Egypt': 'Northern Africa',
+    'Libya': 'Northern Africa',
+    'Morocco': 'Northern Africa',
+    'Sudan': 'Northern Africa',
+    'Tunisia': 'Northern Africa',
+
+    # Sub-Saharan Africa
+    # Western Africa
+    'Benin': 'Western Africa',
+    'Burkina Faso': 'Western Africa',
+    'Cape Verde': 'Western Africa',
+    "Côte d'Ivoire": 'Western Africa',
+    'Gambia': 'Western Africa',
+    'Ghana': 'Western Africa',
+    'Guinea': 'Western Africa',
+    'Guinea-Bissau': 'Western Africa',
+    'Liberia': 'Western Africa',
+    'Mali': 'Western Africa',
+    'Mauritania': 'Western Africa',
+    'Niger': 'Western Africa',
+    'Nigeria': 'Western Africa',
+    'Senegal': 'Western Africa',
+    'Sierra Leone': 'Western Africa',
+    'Togo': 'Western Africa',
+
+    # Central Africa
+    'Angola': 'Central Africa',
+    'Cameroon': 'Central Africa',
+    'Central African Republic': 'Central Africa',
+    'Chad': 'Central Africa',
+    'Congo (Brazzaville)': 'Central Africa',
+    'Congo (Kinshasa)': 'Central Africa',
+    'Equatorial Guinea': 'Central Africa',
+    'Gabon': 'Central Africa',
+    'Sao Tome and Principe': 'Central Africa',
+
+    # Eastern Africa
+    'Burundi': 'Eastern Africa',
+    'Comoros': 'Eastern Africa',
+    'Djibouti': 'Eastern Africa',
+    'Eritrea': 'Eastern Africa',
+    'Ethiopia': 'Eastern Africa',
+    'Kenya': 'Eastern Africa',
+    'Madagascar': 'Eastern Africa',
+    'Malawi': 'Eastern Africa',
+    'Mauritius': 'Eastern Africa',
+    'Mozambique': 'Eastern Africa',
+    'Rwanda': 'Eastern Africa',
+    'Seychelles': 'Eastern Africa',
+    'Somalia': 'Eastern Africa',
+    'South Sudan': 'Eastern Africa',
+    'Tanzania': 'Eastern Africa',
+    'Uganda': 'Eastern Africa',
+    'Zambia': 'Eastern Africa',
+    'Zimbabwe': 'Eastern Africa',
+
+    # Southern Africa
+    'Botswana': 'Southern Africa',
+    'Eswatini': 'Southern Africa',
+    'Lesotho': 'Southern Africa',
+    'Namibia': 'Southern Africa',
+    'South Africa': 'Southern Africa',
+
+    # Oceania
+    'Australia': 'Australia and New Zealand',
+    'New Zealand': 'Australia and New Zealand',
+    'Fiji': 'Pacific Islands',
+    'Papua New Guinea': 'Pacific Islands',
+    'Solomon Islands': 'Pacific Islands',
+    'Vanuatu': 'Pacific Islands',
+
+    # Special Regions
+    'European Union': 'European Union',
+    'African Union': 'African Union',
+    'ASEAN': 'ASEAN',
+    'Global': 'Global'
+})
+
+COUNTRY_TO_REGION = REGION_MAPPING
+
+# Region to its countries, in table order
+REGION_COUNTRIES = freeze({region: [country for country, r in REGION_MAPPING.items() if r == region]
+                           for region in dict.fromkeys(REGION_MAPPING.values())})
+
+# Mapping of languages to likely countries
+LANGUAGE_TO_COUNTRY = freeze({
+    # European Languages
+    'dutch': 'Netherlands', 'flemish': 'Belgium',
+    'german': 'Germany', 'austrian german': 'Austria',
+    'swiss german': 'Switzerland', 'french': 'France',
+    'belgian french': 'Belgium', 'swiss french': 'Switzerland',
+    'canadian french': 'Canada', 'italian': 'Italy',
+    'swiss italian': 'Switzerland', 'spanish': 'Spain',
+    'latin american spanish': 'Mexico', 'catalan': 'Spain',
+    'portuguese': 'Portugal', 'brazilian portuguese': 'Brazil',
+    'english': 'United States', 'british english': 'United Kingdom',
+    'irish english': 'Ireland', 'scots': 'United Kingdom',
+    'swedish': 'Sweden', 'norwegian': 'Norway',
+    'danish': 'Denmark', 'finnish': 'Finland',
+    'icelandic': 'Iceland', 'russian': 'Russia',
+    'ukrainian': 'Ukraine', 'polish': 'Poland',
+    'czech': 'Czech Republic', 'slovak': 'Slovakia',
+    'hungarian': 'Hungary', 'romanian': 'Romania',
+    'bulgarian': 'Bulgaria', 'serbian': 'Serbia',
+    'croatian': 'Croatia', 'slovenian': 'Slovenia',
+    'bosnian': 'Bosnia and Herzegovina', 'albanian': 'Albania',
+    'greek': 'Greece', 'turkish': 'Turkey',
+    'estonian': 'Estonia', 'latvian': 'Latvia',
+    'lithuanian': 'Lithuania', 'maltese': 'Malta',
+
+    # Asian Languages
+    'mandarin': 'China', 'cantonese': 'China',
+    'japanese': 'Japan', 'korean': 'South Korea',
+    'vietnamese': 'Vietnam', 'thai': 'Thailand',
+    'hindi': 'India', 'bengali': 'Bangladesh',
+    'punjabi': 'India', 'tamil': 'India',
+    'telugu': 'India', 'urdu': 'Pakistan',
+    'indonesian': 'Indonesia', 'malay': 'Malaysia',
+    'filipino': 'Philippines', 'burmese': 'Myanmar',
+    'khmer': 'Cambodia', 'lao': 'Laos',
+    'mongolian': 'Mongolia', 'nepali': 'Nepal',
+    'sinhala': 'Sri Lanka', 'dzongkha': 'Bhutan',
+
+    # Middle Eastern Languages
+    'arabic': 'Egypt', 'egyptian arabic': 'Egypt',
+    'saudi arabic': 'Saudi Arabia', 'hebrew': 'Israel',
+    'persian': 'Iran', 'pashto': 'Afghanistan',
+    'dari': 'Afghanistan', 'kurdish': 'Iraq',
+    'turkmen': 'Turkmenistan', 'uzbek': 'Uzbekistan',
+    'kazakh': 'Kazakhstan',
+
+    # African Languages
+    'swahili': 'Tanzania', 'amharic': 'Ethiopia',
+    'yoruba': 'Nigeria', 'hausa': 'Nigeria',
+    'igbo': 'Nigeria', 'somali': 'Somalia',
+    'afrikaans': 'South Africa', 'zulu': 'South Africa',
+    'xhosa': 'South Africa', 'shona': 'Zimbabwe',
+    'malagasy': 'Madagascar',
+
+    # Americas
+    'american english': 'United States',
+    'canadian english': 'Canada',
+    'mexican spanish': 'Mexico',
+    'argentine spanish': 'Argentina',
+    'quebec french': 'Canada',
+    'haitian creole': 'Haiti',
+    'jamaican patois': 'Jamaica',
+
+    # Other
+    'esperanto': 'International',
+    'latin': 'Vatican City'
+})
+
+# Country code top-level domains
+COUNTRY_TLDS = freeze({
+    # ====== OFFICIAL COUNTRY CODE TLDs ======
+    # Europe
+    '.al': 'Albania', '.ad': 'Andorra', '.am': 'Armenia', '.at': 'Austria',
+    '.az': 'Azerbaijan', '.by': 'Belarus', '.be': 'Belgium', '.ba': 'Bosnia and Herzegovina',
+    '.bg': 'Bulgaria', '.hr': 'Croatia', '.cy': 'Cyprus', '.cz': 'Czech Republic',
+    '.dk': 'Denmark', '.ee': 'Estonia', '.fi': 'Finland', '.fr': 'France',
+    '.ge': 'Georgia', '.de': 'Germany', '.gr': 'Greece', '.hu': 'Hungary',
+    '.is': 'Iceland', '.ie': 'Ireland', '.it': 'Italy', '.kz': 'Kazakhstan',
+    '.lv': 'Latvia', '.li': 'Liechtenstein', '.lt': 'Lithuania', '.lu': 'Luxembourg',
+    '.mk': 'North Macedonia', '.mt': 'Malta', '.md': 'Moldova', '.mc': 'Monaco',
+    '.me': 'Montenegro', '.nl': 'Netherlands', '.no': 'Norway', '.pl': 'Poland',
+    '.pt': 'Portugal', '.ro': 'Romania', '.ru': 'Russia', '.sm': 'San Marino',
+    '.rs': 'Serbia', '.sk': 'Slovakia', '.si': 'Slovenia', '.es': 'Spain',
+    '.se': 'Sweden', '.ch': 'Switzerland', '.tr': 'Turkey', '.ua': 'Ukraine',
+    '.uk': 'United Kingdom', '.va': 'Vatican City',
+
+    # Americas
+    '.ai': 'Anguilla', '.ag': 'Antigua and Barbuda', '.ar': 'Argentina', '.aw': 'Aruba',
+    '.bs': 'Bahamas', '.bb': 'Barbados', '.bz': 'Belize', '.bm': 'Bermuda',
+    '.bo': 'Bolivia', '.br': 'Brazil', '.vg': 'British Virgin Islands', '.ca': 'Canada',
+    '.ky': 'Cayman Islands', '.cl': 'Chile', '.co': 'Colombia', '.cr': 'Costa Rica',
+    '.cu': 'Cuba', '.dm': 'Dominica', '.do': 'Dominican Republic', '.ec': 'Ecuador',
+    '.sv': 'El Salvador', '.fk': 'Falkland Islands', '.gd': 'Grenada', '.gt': 'Guatemala',
+    '.gy': 'Guyana', '.ht': 'Haiti', '.hn': 'Honduras', '.jm': 'Jamaica',
+    '.mx': 'Mexico', '.ni': 'Nicaragua', '.pa': 'Panama', '.py': 'Paraguay',
+    '.pe': 'Peru', '.pr': 'Puerto Rico', '.bl': 'Saint Barthélemy', '.kn': 'Saint Kitts and Nevis',
+    '.lc': 'Saint Lucia', '.mf': 'Saint Martin', '.vc': 'Saint Vincent and the Grenadines',
+    '.sr': 'Suriname', '.tt': 'Trinidad and Tobago', '.tc': 'Turks and Caicos Islands',
+    '.us': 'United States', '.uy': 'Uruguay', '.ve': 'Venezuela',
+
+    # Asia
+    '.af': 'Afghanistan', '.bh': 'Bahrain', '.bd': 'Bangladesh', '.bt': 'Bhutan',
+    '.bn': 'Brunei', '.kh': 'Cambodia', '.cn': 'China', '.tw': 'Taiwan',
+    '.in': 'India', '.id': 'Indonesia', '.ir': 'Iran', '.iq': 'Iraq',
+    '.il': 'Israel', '.jp': 'Japan', '.jo': 'Jordan', '.kw': 'Kuwait',
+    '.kg': 'Kyrgyzstan', '.la': 'Laos', '.lb': 'Lebanon', '.mo': 'Macao',
+    '.my': 'Malaysia', '.mv': 'Maldives', '.mn': 'Mongolia', '.mm': 'Myanmar',
+    '.np': 'Nepal', '.kp': 'North Korea', '.om': 'Oman', '.pk': 'Pakistan',
+    '.ps': 'Palestine', '.ph': 'Philippines', '.qa': 'Qatar', '.sa': 'Saudi Arabia',
+    '.sg': 'Singapore', '.kr': 'South Korea', '.lk': 'Sri Lanka', '.sy': 'Syria',
+    '.tj': 'Tajikistan', '.th': 'Thailand', '.tl': 'Timor-Leste', '.ae': 'United Arab Emirates',
+    '.uz': 'Uzbekistan', '.vn': 'Vietnam', '.ye': 'Yemen',
+
+    # Africa
+    '.dz': 'Algeria', '.ao': 'Angola', '.bj': 'Benin', '.bw': 'Botswana',
+    '.bf': 'Burkina Faso', '.bi': 'Burundi', '.cv': 'Cape Verde', '.cm': 'Cameroon',
+    '.cf': 'Central African Republic', '.td': 'Chad', '.km': 'Comoros', '.cd': 'Congo (Kinshasa)',
+    '.cg': 'Congo (Brazzaville)', '.ci': "Côte d'Ivoire", '.dj': 'Djibouti', '.eg': 'Egypt',
+    '.gq': 'Equatorial Guinea', '.er': 'Eritrea', '.sz': 'Eswatini', '.et': 'Ethiopia',
+    '.ga': 'Gabon', '.gm': 'Gambia', '.gh': 'Ghana', '.gn': 'Guinea',
+    '.gw': 'Guinea-Bissau', '.ke': 'Kenya', '.ls': 'Lesotho', '.lr': 'Liberia',
+    '.ly': 'Libya', '.mg': 'Madagascar', '.mw': 'Malawi', '.ml': 'Mali',
+    '.mr': 'Mauritania', '.mu': 'Mauritius', '.yt': 'Mayotte', '.ma': 'Morocco',
+    '.mz': 'Mozambique', '.na': 'Namibia', '.ne': 'Niger', '.ng': 'Nigeria',
+    '.re': 'Réunion', '.rw': 'Rwanda', '.sh': 'Saint Helena', '.st': 'Sao Tome and Principe',
+    '.sn': 'Senegal', '.sc': 'Seychelles', '.sl': 'Sierra Leone', '.so': 'Somalia',
+    '.za': 'South Africa', '.ss': 'South Sudan', '.sd': 'Sudan', '.tz': 'Tanzania',
+    '.tg': 'Togo', '.tn': 'Tunisia', '.ug': 'Uganda', '.eh': 'Western Sahara',
+    '.zm': 'Zambia', '.zw': 'Zimbabwe',
+
+   # Oceania
+    '.as': 'American Samoa', '.au': 'Australia', '.ck': 'Cook Islands', '.fj': 'Fiji',
+    '.pf': 'French Polynesia', '.gu': 'Guam', '.ki': 'Kiribati', '.mh': 'Marshall Islands',
+    '.fm': 'Micronesia', '.nr': 'Nauru', '.nc': 'New Caledonia', '.nz': 'New Zealand',
+    '.nu': 'Niue', '.nf': 'Norfolk Island', '.mp': 'Northern Mariana Islands', '.pw': 'Palau',
+    '.pg': 'Papua New Guinea', '.pn': 'Pitcairn', '.ws': 'Samoa', '.sb': 'Solomon Islands',
+    '.tk': 'Tokelau', '.to': 'Tonga', '.tv': 'Tuvalu', '.vu': 'Vanuatu',
+
+    # ====== SPECIAL CASES & SECOND-LEVEL DOMAINS ======
+    # UK second-level domains
+    '.ac.uk': 'United Kingdom', '.gov.uk': 'United Kingdom', '.co.uk': 'United Kingdom',
+    '.org.uk': 'United Kingdom', '.me.uk': 'United Kingdom', '.net.uk': 'United Kingdom',
+
+    # Australia second-level
+    '.com.au': 'Australia', '.org.au': 'Australia', '.net.au': 'Australia',
+    '.gov.au': 'Australia', '.edu.au': 'Australia',
+
+    # Other notable second-levels
+   '.edu': 'United States', '.gov': 'United States', '.mil': 'United States',
+   '.gc.ca': 'Canada', '.gob.mx': 'Mexico', '.gov.in': 'India',
+
+ # Generic TLDs with geographic significance
+ '.asia': 'Asia', '.eu': 'European Union', '.lat': 'Latin America'
+})
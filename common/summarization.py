@@ -0,0 +1,213 @@
+"""Batched abstractive summarization on the CPU.
+
+Article bodies are queued and summarized by a distilled BART model
+(RI_SUMMARY_MODEL, default sshleifer/distilbart-cnn-6-6) on a background
+thread. Requests that arrive within BATCH_WAIT of each other are sorted by
+length and run through `generate()` in padded batches, and inputs are cut to
+MAX_INPUT_TOKENS so a long PDF costs no more than a news item.
+
+Summaries are kept in a persistent store keyed by a hash of the model, the
+length bounds and the normalized text, so an article seen on an earlier run is
+never summarized again. Spiders with `async def` callbacks convert the
+Deferred for the asyncio reactor before awaiting it:
+
+    from scrapy.utils.defer import maybe_deferred_to_future
+
+    summary = await maybe_deferred_to_future(
+        summarization_service().summarize_deferred(text, max_length=60, min_length=40))
+
+The service is also callable like the transformers summarization pipeline.
+"""
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from common.lazy import LazyModel
+from common.marian import DEFAULT_BATCH_TOKENS, default_num_threads, token_batches
+from common.paths import cache_path
+from common.translation_memory import TranslationMemory, normalize_segment
+
+SUMMARY_MODEL = os.environ.get('RI_SUMMARY_MODEL', 'sshleifer/distilbart-cnn-6-6')
+
+# Longest article prefix the model sees
+MAX_INPUT_TOKENS = 512
+
+# Requests collected into one batch, and how long to wait for the batch to fill
+MAX_PENDING = 16
+BATCH_WAIT = 0.05
+
+logger = logging.getLogger(__name__)
+
+
+def _length_key(max_length: int, min_length: int) -> str:
+    return f"summary-{min_length}-{max_length}"
+
+
+class Summarizer:
+    """Seq2seq summarization model, loaded on first use, run in length-sorted batches"""
+
+    def __init__(self, model_name: Optional[str] = None, num_threads: Optional[int] = None,
+                 max_input_tokens: int = MAX_INPUT_TOKENS, max_batch_tokens: int = DEFAULT_BATCH_TOKENS):
+        self.model_name = model_name or SUMMARY_MODEL
+        self.num_threads = num_threads or default_num_threads()
+        self.max_input_tokens = max_input_tokens
+        self.max_batch_tokens = max_batch_tokens
+        self._model = LazyModel(self.model_name, self._load)
+
+    def _load(self):
+        import torch
+        from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
+
+        torch.set_num_threads(self.num_threads)
+        logger.info(f"Loading summarization model {self.model_name} ({self.num_threads} threads)")
+        tokenizer = AutoTokenizer.from_pretrained(self.model_name)
+        model = AutoModelForSeq2SeqLM.from_pretrained(self.model_name)
+        model.eval()
+        return torch, tokenizer, model
+
+    def summarize_many(self, texts: Sequence[str], max_length: int = 60, min_length: int = 40) -> List[str]:
+        """Summaries of texts, in order"""
+        if not texts:
+            return []
+        torch, tokenizer, model = self._model.get()
+        texts = [normalize_segment(text) for text in texts]
+        lengths = [len(ids) for ids in tokenizer(texts, truncation=True,
+                                                  max_length=self.max_input_tokens)['input_ids']]
+
+        results = [''] * len(texts)
+        for batch in token_batches(lengths, self.max_batch_tokens):
+            inputs = tokenizer([texts[i] for i in batch], return_tensors='pt', padding=True,
+                               truncation=True, max_length=self.max_input_tokens)
+            with torch.inference_mode():
+                output = model.generate(**inputs, max_length=max_length, min_length=min_length, do_sample=False)
+            for i, summary in zip(batch, tokenizer.batch_decode(output, skip_special_tokens=True)):
+                results[i] = summary.strip()
+        return results
+
+
+Request = Tuple[str, int, int, Future]
+
+
+class SummarizationService:
+    """Queues summary requests and answers them from the cache or in batches on a worker thread"""
+
+    def __init__(self, summarizer: Optional[Summarizer] = None, cache: Optional[TranslationMemory] = None,
+                 max_pending: int = MAX_PENDING, batch_wait: float = BATCH_WAIT):
+        self.summarizer = summarizer or Summarizer()
+        self.max_pending = max_pending
+        self.batch_wait = batch_wait
+        self._cache = cache
+        self._queue: 'queue.Queue[Request]' = queue.Queue()
+        self._worker = None
+        self._lock = threading.Lock()
+
+    @property
+    def cache(self) -> TranslationMemory:
+        with self._lock:
+            if self._cache is None:
+                self._cache = TranslationMemory(cache_path('summaries.sqlite3'))
+            return self._cache
+
+    def submit(self, text: str, max_length: int = 60, min_length: int = 40) -> Future:
+        """Future resolving to the summary of text"""
+        future = Future()
+        cached = self.cache.get(text, self.summarizer.model_name, _length_key(max_length, min_length))
+        if cached is not None:
+            future.set_result(cached)
+            return future
+        self._queue.put((text, max_length, min_length, future))
+        with self._lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name='summarization', daemon=True)
+                self._worker.start()
+        return future
+
+    def _next_batch(self) -> List[Request]:
+        pending = [self._queue.get()]
+        deadline = time.monotonic() + self.batch_wait
+        while len(pending) < self.max_pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                pending.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return pending
+
+    def _run(self):
+        while True:
+            pending = self._next_batch()
+            groups: Dict[Tuple[int, int], Dict[str, List[Future]]] = {}
+            for text, max_length, min_length, future in pending:
+                groups.setdefault((max_length, min_length), {}).setdefault(text, []).append(future)
+
+            for (max_length, min_length), by_text in groups.items():
+                texts = list(by_text)
+                try:
+                    summaries = self.summarizer.summarize_many(texts, max_length, min_length)
+                except Exception as e:
+                    for futures in by_text.values():
+                        for future in futures:
+                            future.set_exception(e)
+                    continue
+                for text, summary in zip(texts, summaries):
+                    self.cache.put(text, summary, self.summarizer.model_name, _length_key(max_length, min_length))
+                    for future in by_text[text]:
+                        future.set_result(summary)
+
+    def summarize(self, text: str, max_length: int = 60, min_length: int = 40) -> str:
+        """Blocking convenience wrapper for code that is not running on a reactor"""
+        return self.submit(text, max_length, min_length).result()
+
+    def summarize_deferred(self, text: str, max_length: int = 60, min_length: int = 40):
+        """Twisted Deferred resolving to the summary, fired on the reactor thread"""
+        from twisted.internet import defer, reactor
+
+        deferred = defer.Deferred()
+
+        def done(future: Future):
+            error = future.exception()
+            if error is not None:
+                reactor.callFromThread(deferred.errback, error)
+            else:
+                reactor.callFromThread(deferred.callback, future.result())
+
+        self.submit(text, max_length, min_length).add_done_callback(done)
+        return deferred
+
+    def __call__(self, inputs: Union[str, Sequence[str]], max_length: int = 60, min_length: int = 40, **kwargs):
+        """Pipeline-compatible call: [{'summary_text': ...}] per input"""
+        texts = [inputs] if isinstance(inputs, str) else list(inputs)
+        futures = [self.submit(text, max_length, min_length) for text in texts]
+        return [{'summary_text': future.result()} for future in futures]
+
+    def stats(self) -> Dict[str, float]:
+        """Hit/miss counters of the summary cache"""
+        return self.cache.stats()
+
+
+_service = None
+_service_lock = threading.Lock()
+
+
+def summarization_service() -> SummarizationService:
+    """Process-wide summarization service; the model is loaded on the first cache miss"""
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = SummarizationService()
+        return _service
+
+
+@atexit.register
+def _report_stats():
+    if _service is not None and _service._cache is not None:
+        stats = _service.stats()
+        logger.info(f"Summary cache: {stats['hits']} hits, {stats['misses']} misses "
+                    f"({stats['hit_rate']:.0%} hit rate), {stats['size']} stored summaries")
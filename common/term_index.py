@@ -0,0 +1,231 @@
+"""Precompiled drug term index shared between scraper processes through mmap.
+
+`build_index` turns a profile's term set into one binary file holding the
+sorted term table and the Aho-Corasick automaton as flat uint32 arrays:
+
+    header | term offsets | UTF-8 term blob | edge starts | edge labels |
+    edge targets | fail links | output links | term ids
+
+`open_term_index` maps that file read-only, so every spider running on the box
+shares the same physical pages instead of holding its own Python set of strings.
+Build all profiles ahead of a crawl with:
+
+    python -m common.term_index
+"""
+import logging
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterator, Optional, Tuple
+
+from common.drug_matcher import BOUNDARY_MODES, BaseTermMatcher, DrugTermMatcher
+from common.drug_terms import DRUG_TERM_PROFILES, DrugTermCache, atomic_write
+
+MAGIC = b'RITIDX01'
+_HEADER = struct.Struct('<8s6I')  # magic, byte order mark, terms, nodes, edges, blob bytes, reserved
+_BYTE_ORDER_MARK = 0x01020304
+
+logger = logging.getLogger(__name__)
+
+
+def _pad4(data: bytes) -> bytes:
+    return data + b'\0' * (-len(data) % 4)
+
+
+def build_index(terms, path: str):
+    """Compile a term set into the binary index format at `path`"""
+    matcher = DrugTermMatcher(terms)
+    goto = matcher._goto
+
+    encoded = [t.encode('utf-8') for t in matcher.terms]
+    offsets = array('I', [0])
+    for e in encoded:
+        offsets.append(offsets[-1] + len(e))
+    blob = b''.join(encoded)
+
+    edge_start = array('I', [0])
+    edge_label = array('I')
+    edge_target = array('I')
+    for transitions in goto:
+        for ch, target in sorted(transitions.items()):
+            edge_label.append(ord(ch))
+            edge_target.append(target)
+        edge_start.append(len(edge_label))
+
+    header = _HEADER.pack(MAGIC, _BYTE_ORDER_MARK, len(encoded), len(goto), len(edge_label), len(blob), 0)
+    sections = [
+        offsets.tobytes(),
+        _pad4(blob),
+        edge_start.tobytes(),
+        edge_label.tobytes(),
+        edge_target.tobytes(),
+        array('I', matcher._fail).tobytes(),
+        array('I', matcher._dict_link).tobytes(),
+        array('i', matcher._term_at).tobytes(),
+    ]
+    atomic_write(path, header + b''.join(sections))
+
+
+class TermIndexFile:
+    """Read-only view over a mapped index file"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as fh:
+            self._mmap = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, bom, self.n_terms, self.n_nodes, self.n_edges, blob_len, _ = _HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            raise ValueError(f"Not a term index file: {path}")
+        if bom != struct.unpack('=I', struct.pack('<I', _BYTE_ORDER_MARK))[0]:
+            raise ValueError("Term index files store little-endian arrays and need a little-endian machine")
+
+        view = memoryview(self._mmap)
+        pos = _HEADER.size
+
+        def take(count, fmt='I'):
+            nonlocal pos
+            section = view[pos:pos + 4 * count].cast(fmt)
+            pos += 4 * count
+            return section
+
+        self.offsets = take(self.n_terms + 1)
+        self.blob = view[pos:pos + blob_len]
+        pos += blob_len + (-blob_len % 4)
+        self.edge_start = take(self.n_nodes + 1)
+        self.edge_label = take(self.n_edges)
+        self.edge_target = take(self.n_edges)
+        self.fail = take(self.n_nodes)
+        self.dict_link = take(self.n_nodes)
+        self.term_at = take(self.n_nodes, 'i')
+
+    def term(self, idx: int) -> str:
+        return bytes(self.blob[self.offsets[idx]:self.offsets[idx + 1]]).decode('utf-8')
+
+    def term_bytes(self, idx: int) -> bytes:
+        return bytes(self.blob[self.offsets[idx]:self.offsets[idx + 1]])
+
+
+class MappedTermIndex(BaseTermMatcher):
+    """Drop-in replacement for DrugTermMatcher backed by a shared index file.
+
+    Also behaves as a read-only container of terms (len, `in`, iteration), so it
+    can stand in for the old `drug_terms_set`.
+    """
+
+    def __init__(self, data: TermIndexFile, boundary: str = 'lookaround', min_length: int = 0):
+        if boundary not in BOUNDARY_MODES:
+            raise ValueError(f"Unknown boundary mode: {boundary}")
+        self.data = data
+        self.boundary = boundary
+        self.min_length = min_length
+        # Root transitions are hit for almost every character, keep them in a dict
+        lo, hi = data.edge_start[0], data.edge_start[1]
+        self._root = {chr(data.edge_label[i]): data.edge_target[i] for i in range(lo, hi)}
+        self._terms: Dict[int, str] = {}
+
+    def __len__(self):
+        return self.data.n_terms
+
+    def __iter__(self):
+        for idx in range(self.data.n_terms):
+            yield self.data.term(idx)
+
+    def __contains__(self, term) -> bool:
+        if not isinstance(term, str):
+            return False
+        key = term.encode('utf-8')
+        lo, hi = 0, self.data.n_terms
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.data.term_bytes(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo < self.data.n_terms and self.data.term_bytes(lo) == key
+
+    def _term(self, idx: int) -> str:
+        term = self._terms.get(idx)
+        if term is None:
+            term = self._terms[idx] = self.data.term(idx)
+        return term
+
+    def _step(self, node: int, cp: int) -> int:
+        data = self.data
+        while True:
+            lo, hi = data.edge_start[node], data.edge_start[node + 1]
+            pos = bisect_left(data.edge_label, cp, lo, hi)
+            if pos < hi and data.edge_label[pos] == cp:
+                return data.edge_target[pos]
+            if node == 0:
+                return 0
+            node = data.fail[node]
+
+    def finditer(self, text: str) -> Iterator[Tuple[int, int, str]]:
+        """Yield (start, end, term) for each whole-word occurrence in the lowercased text"""
+        if not text or not self.data.n_terms:
+            return
+        text = text.lower()
+        data, root, min_length = self.data, self._root, self.min_length
+        term_at, dict_link = data.term_at, data.dict_link
+        node = 0
+        for i, ch in enumerate(text):
+            node = root.get(ch, 0) if node == 0 else self._step(node, ord(ch))
+            out = node if term_at[node] >= 0 else dict_link[node]
+            while out:
+                term = self._term(term_at[out])
+                start = i + 1 - len(term)
+                if len(term) >= min_length and self._boundary_ok(text, start, i + 1):
+                    yield start, i + 1, term
+                out = dict_link[out]
+
+
+def index_path(cache: DrugTermCache, profile: str, version: str) -> str:
+    return os.path.join(cache.cache_dir, f'index-{profile}-{version[:16]}.bin')
+
+
+def ensure_index(profile: str, cache: Optional[DrugTermCache] = None) -> str:
+    """Return the index path for the current TSV version, building it if missing"""
+    if profile not in DRUG_TERM_PROFILES:
+        raise ValueError(f"Unknown drug term profile: {profile}")
+    cache = cache or DrugTermCache()
+    path = index_path(cache, profile, cache.version())
+    if not os.path.exists(path):
+        logger.info(f"Building term index for profile '{profile}'")
+        build_index(cache.terms(profile), path)
+        _prune_indexes(cache, profile, keep=path)
+    return path
+
+
+def _prune_indexes(cache: DrugTermCache, profile: str, keep: str):
+    prefix = f'index-{profile}-'
+    for name in os.listdir(cache.cache_dir):
+        path = os.path.join(cache.cache_dir, name)
+        if name.startswith(prefix) and path != keep:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+_open_files: Dict[str, TermIndexFile] = {}
+
+
+def open_term_index(profile: str = 'long_terms', boundary: str = 'lookaround', min_length: int = 0) -> MappedTermIndex:
+    """Memory-map the index for a profile (once per process) and return a matcher over it"""
+    path = ensure_index(profile)
+    data = _open_files.get(path)
+    if data is None:
+        data = _open_files[path] = TermIndexFile(path)
+    return MappedTermIndex(data, boundary=boundary, min_length=min_length)
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    profiles = sys.argv[1:] or list(DRUG_TERM_PROFILES)
+    for name in profiles:
+        built = ensure_index(name)
+        print(f"✅ {name}: {built} ({os.path.getsize(built) // 1024} KiB)")
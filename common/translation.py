@@ -0,0 +1,310 @@
+"""Translation entry point used by the scrapers.
+
+`translate()` is a drop-in replacement for
+`GoogleTranslator(source=..., target='en').translate(text)`: it consults the
+persistent translation memory first and only calls the provider for text that
+has not been translated before. Provider errors propagate unchanged so each
+scraper's existing fallback logic keeps working.
+
+`TranslationBatch` / `translate_batch()` gather the fields of many articles
+and pack the segments that miss the memory into as few provider requests as
+possible, mapping the results back per field. Long texts are split at
+sentence boundaries rather than at fixed character offsets.
+
+Set RI_TRANSLATION_BACKEND=marian to translate the languages covered by
+common.marian on the local CPU instead; anything else (including 'auto'
+sources) still goes to Google.
+"""
+import atexit
+import logging
+import os
+import re
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from deep_translator import GoogleTranslator
+from deep_translator.exceptions import LanguageNotSupportedException, NotValidLength, NotValidPayload
+
+from common.rate_limit import TokenBucket, retry_with_jitter
+from common.translation_memory import get_translation_memory
+
+# Largest payload deep_translator accepts for GoogleTranslator in one request
+MAX_REQUEST_CHARS = 5000
+
+# Requests per second (and burst size) allowed against the Google endpoint, shared by all threads
+GOOGLE_REQUESTS_PER_SECOND = float(os.environ.get('RI_TRANSLATION_RATE', '2'))
+GOOGLE_BURST = 5
+
+# Errors that retrying cannot fix
+_PERMANENT_ERRORS = (LanguageNotSupportedException, NotValidLength, NotValidPayload, ValueError)
+
+# Placed between packed segments; the provider passes the symbol through untouched
+SEGMENT_SEPARATOR = '\n\u2042\n'
+_SEPARATOR_RE = re.compile(r'\s*\u2042\s*')
+
+# Sentence ends followed by whitespace, or line breaks
+_SENTENCE_BOUNDARY_RE = re.compile(r'(?<=[.!?\u2026])\s+|\s*\n\s*')
+
+logger = logging.getLogger(__name__)
+
+_used = False
+_google_bucket = TokenBucket(GOOGLE_REQUESTS_PER_SECOND, GOOGLE_BURST)
+
+
+def translation_backend() -> str:
+    """Configured backend: 'google' (default) or 'marian'"""
+    return os.environ.get('RI_TRANSLATION_BACKEND', 'google').lower()
+
+
+def local_translator(source: str, target: str = 'en'):
+    """The offline translator for a language pair, or None if Google should be used"""
+    if translation_backend() != 'marian' or target != 'en':
+        return None
+    from common.marian import get_marian_translator
+
+    translator = get_marian_translator()
+    return translator if translator.supports(source) else None
+
+
+def translate(text: str, source: str = 'auto', target: str = 'en') -> str:
+    """Translate text, reusing earlier translations of the same segment.
+
+    Text longer than one provider request is split at sentence boundaries and
+    translated through a TranslationBatch; a sentence that fails there keeps its
+    original wording instead of raising.
+    """
+    global _used
+    if not text or not text.strip():
+        return text
+    if len(text) > MAX_REQUEST_CHARS or local_translator(source, target):
+        return translate_batch([text], source, target)[0]
+
+    _used = True
+    memory = get_translation_memory()
+    cached = memory.get(text, source, target)
+    if cached is not None:
+        return cached
+
+    return _translate_uncached(text, source, target)
+
+
+def google_translate(text: str, source: str = 'auto', target: str = 'en') -> str:
+    """One rate-limited request to Google, retried with jittered backoff on transient errors"""
+    def call():
+        _google_bucket.acquire()
+        return GoogleTranslator(source=source or 'auto', target=target).translate(text)
+
+    return retry_with_jitter(call, retries=3, base_delay=1.0, give_up_on=_PERMANENT_ERRORS)
+
+
+def _translate_uncached(text: str, source: str, target: str) -> str:
+    translated = google_translate(text, source, target)
+    if translated:
+        get_translation_memory().put(text, translated, source, target)
+    return translated
+
+
+def split_sentences(text: str) -> List[Tuple[str, str]]:
+    """Split text into (sentence, following whitespace) pairs; joining them restores the text"""
+    units, pos = [], 0
+    for match in _SENTENCE_BOUNDARY_RE.finditer(text):
+        units.append((text[pos:match.start()], match.group()))
+        pos = match.end()
+    units.append((text[pos:], ''))
+    return [(sentence, gap) for sentence, gap in units if sentence or gap]
+
+
+def chunk_sentences(text: str, max_chars: int = MAX_REQUEST_CHARS) -> List[Tuple[str, str]]:
+    """Like split_sentences, but sentences longer than max_chars are cut at the last space that fits"""
+    units = []
+    for sentence, gap in split_sentences(text):
+        while len(sentence) > max_chars:
+            cut = sentence.rfind(' ', 0, max_chars)
+            if cut <= 0:
+                cut = max_chars
+            units.append((sentence[:cut], ' ' if sentence[cut:cut + 1] == ' ' else ''))
+            sentence = sentence[cut:].lstrip(' ')
+        units.append((sentence, gap))
+    return units
+
+
+def pack_segments(segments: Sequence[str], max_chars: int = MAX_REQUEST_CHARS) -> List[List[int]]:
+    """Group segment indices into packets whose joined length stays under max_chars"""
+    packets, current, size = [], [], 0
+    for i, segment in enumerate(segments):
+        extra = len(segment) + (len(SEGMENT_SEPARATOR) if current else 0)
+        if current and size + extra > max_chars:
+            packets.append(current)
+            current, size = [], 0
+            extra = len(segment)
+        current.append(i)
+        size += extra
+    if current:
+        packets.append(current)
+    return packets
+
+
+class TranslationBatch:
+    """Collects text fields and translates them together.
+
+    `add()` returns a ticket; after `run()` the translation of every field is
+    available through `result(ticket)`. Identical segments are translated once,
+    segments already in the translation memory are not sent at all, and the rest
+    are packed per source language into requests of up to `max_chars`. Fields
+    longer than that are split into sentences, which are deduplicated and packed
+    like any other segment, then reassembled in order. With the local backend
+    every field is split into sentences and all of them go to the model in
+    token-length batches. A field whose translation fails keeps its original
+    text, like the scrapers' `translate_to_english` fallbacks; `failed(ticket)`
+    tells such fields apart (a long field counts as failed only if none of its
+    sentences were translated).
+    """
+
+    def __init__(self, target: str = 'en', max_chars: int = MAX_REQUEST_CHARS):
+        self.target = target
+        self.max_chars = max_chars
+        self._fields: List[Tuple[str, str]] = []
+        self._results: Dict[Tuple[str, str], str] = {}
+        self._failed: Set[Tuple[str, str]] = set()
+
+    def __len__(self):
+        return len(self._fields)
+
+    def add(self, text: str, source: str = 'auto') -> int:
+        self._fields.append((text, source or 'auto'))
+        return len(self._fields) - 1
+
+    def result(self, ticket: int) -> str:
+        text, source = self._fields[ticket]
+        return self._results.get((text, source), text)
+
+    def results(self) -> List[str]:
+        return [self.result(i) for i in range(len(self._fields))]
+
+    def failed(self, ticket: int) -> bool:
+        """True if no translation could be obtained for the field"""
+        return self._fields[ticket] in self._failed
+
+    def run(self) -> List[str]:
+        global _used
+        memory = get_translation_memory()
+        pending: Dict[str, Dict[str, None]] = {}
+        split: Dict[Tuple[str, str], List[Tuple[str, str]]] = {}
+
+        def lookup(text: str, source: str) -> bool:
+            if (text, source) in self._results:
+                return True
+            if not text.strip():
+                self._results[(text, source)] = text
+                return True
+            cached = memory.get(text, source, self.target)
+            if cached is None:
+                return False
+            self._results[(text, source)] = cached
+            return True
+
+        for text, source in dict.fromkeys(self._fields):
+            if not text:
+                continue
+            _used = True
+            if lookup(text, source):
+                continue
+            units = chunk_sentences(text, self.max_chars)
+            if len(units) == 1 or (len(text) <= self.max_chars and not local_translator(source, self.target)):
+                pending.setdefault(source, {})[text] = None
+                continue
+            split[(text, source)] = units
+            for sentence, _ in units:
+                if not lookup(sentence, source):
+                    pending.setdefault(source, {})[sentence] = None
+
+        for source, texts in pending.items():
+            segments = list(texts)
+            local = local_translator(source, self.target)
+            if local:
+                self._dispatch_local(local, source, segments)
+                continue
+            for packet in pack_segments(segments, self.max_chars):
+                self._dispatch(source, [segments[i] for i in packet])
+
+        for text, source in dict.fromkeys(self._fields):
+            if text and (text, source) not in self._results and (text, source) not in split:
+                self._failed.add((text, source))
+
+        for (text, source), units in split.items():
+            if all((sentence, source) in self._results for sentence, _ in units):
+                translated = ''.join(self._results[(sentence, source)] + gap for sentence, gap in units)
+                memory.put(text, translated, source, self.target)
+            elif any((sentence, source) in self._results for sentence, _ in units if sentence.strip()):
+                translated = ''.join(self._results.get((sentence, source), sentence) + gap for sentence, gap in units)
+            else:
+                self._failed.add((text, source))
+                continue
+            self._results[(text, source)] = translated
+        return self.results()
+
+    def _dispatch_local(self, local, source: str, segments: List[str]):
+        memory = get_translation_memory()
+        try:
+            translations = local.translate_many(segments, source)
+        except Exception as e:
+            logger.warning(f"Local translation failed: {e}. Using original text.")
+            return
+        for text, translated in zip(segments, translations):
+            if translated:
+                self._results[(text, source)] = translated
+                memory.put(text, translated, source, self.target)
+
+    def _dispatch(self, source: str, segments: List[str]):
+        """Send one packet; if the separators do not survive, retry each half"""
+        memory = get_translation_memory()
+        if len(segments) > 1:
+            try:
+                joined = google_translate(SEGMENT_SEPARATOR.join(segments), source, self.target)
+                parts = _SEPARATOR_RE.split(joined.strip()) if joined else []
+                if len(parts) == len(segments):
+                    for text, translated in zip(segments, parts):
+                        self._results[(text, source)] = translated
+                        memory.put(text, translated, source, self.target)
+                    return
+                logger.info(f"Packed translation returned {len(parts)} of {len(segments)} segments; splitting the packet")
+            except Exception as e:
+                logger.warning(f"Packed translation failed ({e}); splitting the packet")
+            middle = len(segments) // 2
+            self._dispatch(source, segments[:middle])
+            self._dispatch(source, segments[middle:])
+            return
+
+        try:
+            translated = _translate_uncached(segments[0], source, self.target)
+            if translated:
+                self._results[(segments[0], source)] = translated
+        except Exception as e:
+            logger.warning(f"Translation failed: {e}. Using original text.")
+
+
+def translate_batch(texts: Sequence[str], source: str = 'auto', target: str = 'en',
+                    fallback: Optional[str] = None) -> List[str]:
+    """Translate several fields with as few provider requests as possible.
+
+    Fields that could not be translated keep their text, or become `fallback` if one is given.
+    """
+    batch = TranslationBatch(target=target)
+    tickets = [batch.add(text, source) for text in texts]
+    results = batch.run()
+    if fallback is not None:
+        results = [fallback if batch.failed(ticket) else result for ticket, result in zip(tickets, results)]
+    return results
+
+
+def translation_stats():
+    """Hit/miss counters of the shared translation memory"""
+    return get_translation_memory().stats()
+
+
+@atexit.register
+def _report_stats():
+    if _used:
+        stats = translation_stats()
+        logger.info(
+            f"Translation memory: {stats['hits']} hits, {stats['misses']} misses "
+            f"({stats['hit_rate']:.0%} hit rate), {stats['size']} stored segments")
@@ -0,0 +1,170 @@
+"""Persistent translation memory shared by every scraper on the box.
+
+Translations are stored in SQLite keyed by a hash of (source language, target
+language, normalized text), so titles, boilerplate paragraphs and articles seen
+on a previous run are never sent to the translation provider again. The store
+keeps hit/miss counters and evicts the least recently used entries once it
+grows past `max_entries`.
+
+Hits are recorded in memory and their last-used times written in batches
+(with the next store, every TOUCH_BATCH hits, and at exit), so a lookup that
+hits costs one SELECT and no commit.
+"""
+import atexit
+import hashlib
+import logging
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from typing import Dict, List, Optional
+
+from common.paths import cache_path
+
+DEFAULT_MAX_ENTRIES = 200_000
+# Hits buffered before their last-used times are written
+TOUCH_BATCH = 256
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_segment(text: str) -> str:
+    """Canonical form used for keys: NFC, collapsed whitespace, stripped"""
+    return re.sub(r'\s+', ' ', unicodedata.normalize('NFC', text)).strip()
+
+
+def segment_key(source_lang: str, target_lang: str, text: str) -> str:
+    payload = f"{(source_lang or 'auto').lower()}\x1f{target_lang.lower()}\x1f{normalize_segment(text)}"
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class TranslationMemory:
+    """Content-hash keyed translation store with LRU eviction"""
+
+    def __init__(self, path: Optional[str] = None, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.path = path or cache_path('translation_memory.sqlite3')
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self._lock = threading.Lock()
+        # key -> [last hit time, hits since the last write]
+        self._touched: Dict[str, List[float]] = {}
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS translations (
+                key TEXT PRIMARY KEY,
+                source_lang TEXT NOT NULL,
+                target_lang TEXT NOT NULL,
+                translation TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_used_at REAL NOT NULL,
+                use_count INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        self._conn.execute('CREATE INDEX IF NOT EXISTS idx_translations_last_used ON translations(last_used_at)')
+        self._conn.commit()
+        self._size = self._count()
+        atexit.register(self.flush)
+
+    def _count(self) -> int:
+        return self._conn.execute('SELECT COUNT(*) FROM translations').fetchone()[0]
+
+    def get(self, text: str, source_lang: str = 'auto', target_lang: str = 'en') -> Optional[str]:
+        """Return the stored translation or None, updating the hit/miss counters"""
+        key = segment_key(source_lang, target_lang, text)
+        with self._lock:
+            row = self._conn.execute('SELECT translation FROM translations WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            touched = self._touched.setdefault(key, [0.0, 0])
+            touched[0] = time.time()
+            touched[1] += 1
+            if len(self._touched) >= TOUCH_BATCH:
+                self._write_touched()
+                self._conn.commit()
+            return row[0]
+
+    def _write_touched(self):
+        """Write the buffered hits into the current transaction (lock held, caller commits)"""
+        if self._touched:
+            self._conn.executemany(
+                'UPDATE translations SET last_used_at = ?, use_count = use_count + ? WHERE key = ?',
+                [(last_used, count, key) for key, (last_used, count) in self._touched.items()])
+            self._touched.clear()
+
+    def flush(self):
+        """Write buffered hits now"""
+        with self._lock:
+            if self._touched:
+                self._write_touched()
+                self._conn.commit()
+
+    def put(self, text: str, translation: str, source_lang: str = 'auto', target_lang: str = 'en'):
+        """Store a translation; empty results are never cached"""
+        if not translation:
+            return
+        key = segment_key(source_lang, target_lang, text)
+        now = time.time()
+        with self._lock:
+            self._write_touched()
+            # A replaced row does not grow the store; only new keys count towards max_entries
+            exists = self._conn.execute('SELECT 1 FROM translations WHERE key = ?', (key,)).fetchone()
+            self._conn.execute(
+                'INSERT OR REPLACE INTO translations '
+                '(key, source_lang, target_lang, translation, created_at, last_used_at, use_count) '
+                'VALUES (?, ?, ?, ?, ?, ?, 0)',
+                (key, (source_lang or 'auto').lower(), target_lang.lower(), translation, now, now))
+            self._conn.commit()
+            self.writes += 1
+            if exists is None:
+                self._size += 1
+            if self._size > self.max_entries:
+                self._evict()
+
+    def _evict(self):
+        """Drop the least recently used entries down to 90% of the limit"""
+        self._size = self._count()
+        excess = self._size - int(self.max_entries * 0.9)
+        if excess <= 0:
+            return
+        self._conn.execute(
+            'DELETE FROM translations WHERE key IN '
+            '(SELECT key FROM translations ORDER BY last_used_at LIMIT ?)', (excess,))
+        self._conn.commit()
+        self._size = self._count()
+        logger.info(f"Translation memory evicted {excess} entries")
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'writes': self.writes,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+            'size': self._size,
+        }
+
+    def close(self):
+        self.flush()
+        with self._lock:
+            self._conn.close()
+        atexit.unregister(self.flush)
+
+
+_memory = None
+_memory_lock = threading.Lock()
+
+
+def get_translation_memory() -> TranslationMemory:
+    """Process-wide translation memory, opened on first use"""
+    global _memory
+    with _memory_lock:
+        if _memory is None:
+            _memory = TranslationMemory()
+        return _memory
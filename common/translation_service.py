@@ -0,0 +1,76 @@
+"""Background translation for Scrapy spiders.
+
+Translating inside a Scrapy callback blocks the Twisted reactor, so every
+other download stalls while Google answers (or while the old code slept
+between requests). `TranslationService` runs `translate_batch` on a small
+thread pool instead; the requests still share the rate limiter and retry
+policy of common.translation. `translate_deferred(...)` resolves on the
+reactor thread; spiders with `async def` callbacks convert it for the asyncio
+reactor before awaiting it:
+
+    from scrapy.utils.defer import maybe_deferred_to_future
+
+    title_en, content_en = await maybe_deferred_to_future(
+        translation_service().translate_deferred([title, content], source='da'))
+"""
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Optional, Sequence
+
+from common.translation import translate_batch
+
+
+def default_workers() -> int:
+    """Translation threads (RI_TRANSLATION_WORKERS, default 4)"""
+    return max(1, int(os.environ.get('RI_TRANSLATION_WORKERS', '4')))
+
+
+class TranslationService:
+    """Thread pool that translates batches of fields off the calling thread"""
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers or default_workers(),
+                                            thread_name_prefix='translation')
+
+    def submit(self, texts: Sequence[str], source: str = 'auto', target: str = 'en',
+               fallback: Optional[str] = None) -> Future:
+        """Future resolving to the translations of texts, in order (see translate_batch for fallback)"""
+        return self._executor.submit(translate_batch, list(texts), source, target, fallback)
+
+    def translate_deferred(self, texts: Sequence[str], source: str = 'auto', target: str = 'en',
+                           fallback: Optional[str] = None):
+        """Twisted Deferred resolving to the translations of texts, fired on the reactor thread"""
+        from twisted.internet import defer, reactor
+
+        deferred = defer.Deferred()
+
+        def done(future: Future):
+            error = future.exception()
+            if error is not None:
+                reactor.callFromThread(deferred.errback, error)
+            else:
+                reactor.callFromThread(deferred.callback, future.result())
+
+        self.submit(texts, source, target, fallback).add_done_callback(done)
+        return deferred
+
+    def translate_many(self, texts: Sequence[str], source: str = 'auto', target: str = 'en') -> List[str]:
+        """Blocking convenience wrapper for code that is not running on a reactor"""
+        return self.submit(texts, source, target).result()
+
+    def shutdown(self, wait: bool = True):
+        self._executor.shutdown(wait=wait)
+
+
+_service = None
+_service_lock = threading.Lock()
+
+
+def translation_service() -> TranslationService:
+    """Process-wide translation service"""
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = TranslationService()
+        return _service
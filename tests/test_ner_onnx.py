@@ -0,0 +1,80 @@
+"""The int8 ONNX NER backend against the transformers pipeline it replaces.
+
+The parity test downloads the model and exports it to ONNX, so it only runs
+with RI_NER_PARITY=1.
+"""
+import os
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from common.ner_onnx import MIN_AGREEMENT, PARITY_SAMPLES, OnnxNerPipeline, compare  # noqa: E402
+
+LABELS = {0: 'O', 1: 'B-Medication', 2: 'I-Medication', 3: 'B-Sign_symptom', 4: 'I-Sign_symptom'}
+VOCAB = ['[PAD]', '[UNK]', '[CLS]', '[SEP]', 'as', '##pir', '##in', 'reduces', 'fever', 'and', 'head',
+         '##ache', 'in', 'children', '.']
+TEXT = "Aspirin reduces fever and headache in xyzzy children."
+
+
+@pytest.fixture(scope='module')
+def tokenizer(tmp_path_factory):
+    transformers = pytest.importorskip('transformers')
+    vocab = tmp_path_factory.mktemp('vocab') / 'vocab.txt'
+    vocab.write_text('\n'.join(VOCAB) + '\n', encoding='utf-8')
+    return transformers.BertTokenizerFast(vocab_file=str(vocab), do_lower_case=True)
+
+
+def _simple_aggregation(tokenizer, encoded, logits):
+    """transformers' own postprocessing with aggregation_strategy='simple'"""
+    from types import SimpleNamespace
+
+    from transformers import TokenClassificationPipeline
+    from transformers.pipelines.token_classification import AggregationStrategy
+
+    pipeline = object.__new__(TokenClassificationPipeline)
+    pipeline.tokenizer = tokenizer
+    pipeline.model = SimpleNamespace(config=SimpleNamespace(id2label=LABELS))
+
+    shifted = np.exp(logits - logits.max(axis=-1, keepdims=True))
+    scores = shifted / shifted.sum(axis=-1, keepdims=True)
+    pre_entities = pipeline.gather_pre_entities(TEXT, encoded['input_ids'][0], scores,
+                                                encoded['offset_mapping'][0].tolist(),
+                                                encoded['special_tokens_mask'][0], AggregationStrategy.SIMPLE)
+    entities = pipeline.aggregate(pre_entities, AggregationStrategy.SIMPLE)
+    return [entity for entity in entities if entity['entity_group'] != 'O']
+
+
+@pytest.mark.parametrize('seed', range(8))
+def test_entities_match_simple_aggregation(tokenizer, seed):
+    encoded = tokenizer([TEXT], return_offsets_mapping=True, return_special_tokens_mask=True, return_tensors='np')
+    assert tokenizer.unk_token_id in encoded['input_ids'][0]
+    logits = np.random.default_rng(seed).normal(scale=3.0, size=(encoded['input_ids'].shape[1], len(LABELS)))
+
+    onnx_pipeline = object.__new__(OnnxNerPipeline)
+    onnx_pipeline.tokenizer = tokenizer
+    onnx_pipeline.id2label = LABELS
+    entities = onnx_pipeline._entities(TEXT, encoded['input_ids'][0], encoded['offset_mapping'][0],
+                                       encoded['special_tokens_mask'][0], logits)
+    expected = _simple_aggregation(tokenizer, encoded, logits)
+
+    assert [(e['entity_group'], e['word'], e['start'], e['end']) for e in entities] == \
+           [(e['entity_group'], e['word'], e['start'], e['end']) for e in expected]
+    assert [e['score'] for e in entities] == pytest.approx([float(e['score']) for e in expected])
+
+
+@pytest.mark.skipif(os.environ.get('RI_NER_PARITY') != '1',
+                    reason='downloads and exports the model; set RI_NER_PARITY=1')
+def test_int8_model_agrees_with_pytorch():
+    pytest.importorskip('onnxruntime')
+    pytest.importorskip('transformers')
+    pytest.importorskip('torch')
+    from common.ner import clean_entities, load_biomedical_pipeline, run_biomedical
+    from common.ner_onnx import load_onnx_pipeline
+
+    reference = run_biomedical(load_biomedical_pipeline(), PARITY_SAMPLES)
+    candidate = [clean_entities(entities) for entities in load_onnx_pipeline()(PARITY_SAMPLES)]
+    report = compare(reference, candidate)
+
+    assert report['matched'] > 0
+    assert report['agreement'] >= MIN_AGREEMENT, report